@@ -1,14 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
+import logging
+import shutil
 from pathlib import Path
 from threading import Lock
 
-from PySide6.QtCore import Signal, QTimer, QObject
+from PySide6.QtCore import Signal, QObject
 
-from libbaram.utils import rmtree
-from libbaram.openfoam.constants import CASE_DIRECTORY_NAME
-from libbaram.run import launchSolver, runParallelUtility, STDOUT_FILE_NAME, STDERR_FILE_NAME
+from libbaram.affinity import partitionCores
+from libbaram.mpi import ParallelEnvironment, ParallelType
+from libbaram.process import ProcessWatcher
+from libbaram.utils import directorySize, rmtree
+from libbaram.openfoam.constants import CASE_DIRECTORY_NAME, Directory
+from libbaram.openfoam.foam_file import FoamDictFile
+from libbaram.run import launchSolver, readSolverRun, runParallelUtility, SolverRun, STDOUT_FILE_NAME, STDERR_FILE_NAME
+from libbaram.telemetry import ResourceSampler
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.project import Project
@@ -21,17 +29,22 @@ from .solver_status import SolverStatus, RunType, SolverProcess
 from .coredb.coredb_reader import CoreDBReader
 
 
-SOLVER_CHECK_INTERVAL = 500
 BATCH_DIRECTORY_NAME = 'batch'
 
+# Ratio of the disk to keep free when batch cases are prepared ahead of the solvers
+BATCH_DISK_RESERVE_RATIO = 0.1
+
 _mutex = Lock()
 
+logger = logging.getLogger(__name__)
+
 
 class CaseManager(QObject):
     progress = Signal(str)
     caseLoaded = Signal(str)
     caseCleared = Signal()
     batchCleared = Signal()
+    resourcesSampled = Signal(Path, object)  # case root, samples of SAMPLE_DTYPE
 
     def __new__(cls, *args, **kwargs):
         with _mutex:
@@ -55,10 +68,12 @@ class CaseManager(QObject):
         self._runType = None
         self._status = None
         self._process = None
+        self._solverRun = None
 
         self._monitor = None
+        self._sampler = None
         self._generator = None
-        self._batchProcess = None
+        self._batchProcesses = {}
         self._batchRunning = False
 
     @property
@@ -121,14 +136,18 @@ class CaseManager(QObject):
     def process(self):
         return self._process
 
+    def solverRun(self) -> SolverRun:
+        """Returns the exit status and resource usage of the last run of the live case, if baramd has written them"""
+        return self._solverRun
+
     def kill(self):
         self.stopBatchRun()
 
         if self._process:
             self._process.kill()
 
-        if self._batchProcess:
-            self._batchProcess.terminate()
+        for _, process in self._batchProcesses.values():
+            process.terminate()
 
     async def liveRun(self):
         self.loadLiveCase()
@@ -139,8 +158,9 @@ class CaseManager(QObject):
         solver = findSolver()
         process = launchSolver(solver, caseRoot, self._project.uuid, parallel.getEnvironment())
         if process:
+            self._solverRun = None
             self._runType = RunType.PROCESS
-            self._setLiveProcess(SolverProcess(process[0], process[1]))
+            self._setLiveProcess(SolverProcess(process[0], process[1]), newRun=True)
         else:
             raise RuntimeError
 
@@ -150,32 +170,54 @@ class CaseManager(QObject):
         await self._initializeCase()
 
     async def batchRun(self, cases):
+        """Runs the cases, as many at the same time as the cores allow
+
+        Cases are prepared one by one in the background, ahead of the solvers,
+        to be ready when a set of cores becomes free.
+        Cases waiting for cores are as many as the sets of cores at most,
+        and only one waits if the free disk space would get short.
+        """
         self._batchStop = False
         self._batchRunning = True
-        for case, parameters in cases:
-            self.loadBatchCase(case, parameters)
-
-            await self._initializeCase()
-
-            caseRoot = FileSystem.caseRoot()
-            stdout = open(caseRoot / STDOUT_FILE_NAME, 'w')
-            stderr = open(caseRoot / STDERR_FILE_NAME, 'w')
 
-            solver = findSolver()
-            self._batchProcess = await runParallelUtility(solver, parallel=parallel.getEnvironment(), cwd=caseRoot,
-                                                          stdout=stdout, stderr=stderr)
-            self._setStatus(SolverStatus.RUNNING)
-            result = await self._batchProcess.wait()
-
-            if self._batchStop:
-                self._setStatus(SolverStatus.ENDED)
-                break
-
-            self._setStatus(SolverStatus.ENDED if result == 0 else SolverStatus.ERROR)
-
-        self._batchProcess = None
-        self._batchRunning = False
-        self._project.updateSolverStatus(None, SolverStatus.ENDED, None)
+        environment = parallel.getEnvironment()
+        slots = asyncio.Queue()
+        for cpus in self._solverSlots(environment):
+            slots.put_nowait(cpus)
+
+        prepared = asyncio.Queue()
+        taken = asyncio.Condition()
+        preparing = asyncio.create_task(self._prepareBatchCases(cases, prepared, taken, slots.qsize()))
+        solving = []
+        try:
+            while True:
+                cpus = await slots.get()
+                case = await prepared.get()
+                async with taken:
+                    taken.notify()
+
+                if case is None:
+                    break
+                if self._batchStop:
+                    self._setBatchStatus(case[0], SolverStatus.NONE)
+                    break
+
+                solving.append(asyncio.create_task(self._solveBatchCase(*case, environment, cpus, slots)))
+
+            if preparing.done():
+                preparing.result()  # Raises the error in preparing the cases
+        finally:
+            if not preparing.done():
+                self.cancel()
+                preparing.cancel()
+            await asyncio.gather(preparing, *solving, return_exceptions=True)
+
+            while not prepared.empty():
+                if case := prepared.get_nowait():
+                    self._setBatchStatus(case[0], SolverStatus.NONE)
+
+            self._batchRunning = False
+            self._project.updateSolverStatus(None, SolverStatus.ENDED, None)
 
     def saveAndStop(self):
         controlDict = ControlDict().build()
@@ -187,9 +229,20 @@ class CaseManager(QObject):
             self._generator.cancel()
             self._generator = None
 
-    def stopBatchRun(self):
+    def stopBatchRun(self, stopAt=None):
+        """Stops running batch cases
+
+        Args:
+            stopAt: "stopAt" to write in controlDict of the running cases, which are left running if None
+        """
         self._batchStop = True
 
+        if stopAt:
+            for caseRoot, _ in self._batchProcesses.values():
+                controlDict = FoamDictFile(caseRoot / Directory.SYSTEM_DIRECTORY_NAME / 'controlDict')
+                controlDict.content['stopAt'] = stopAt
+                controlDict.writeFile()
+
     def clearCases(self):
         livePath = self._livePath()
         FileSystem.createCase(livePath)
@@ -234,25 +287,110 @@ class CaseManager(QObject):
         self._status = status
         self._project.updateSolverStatus(self._caseName, status, self._process)
 
-    def _setLiveProcess(self, process):
+    def _setBatchStatus(self, name, status):
+        if name == self._caseName:
+            self._setStatus(status)
+        else:
+            self._project.updateSolverStatus(name, status, None)
+
+    def _solverSlots(self, environment: ParallelEnvironment):
+        """Returns the sets of CPUs to run batch cases on at the same time
+
+        Cases run one by one without being pinned to CPUs
+        if the cores are not enough for more than one case, or on clusters, where MPI places the processes.
+        """
+        if environment.type() != ParallelType.LOCAL_MACHINE:
+            return [None]
+
+        slots = partitionCores(environment.np())
+        if len(slots) < 2:
+            return [None]
+
+        logger.info(f'Batch cases run on {len(slots)} sets of {environment.np()} cores')
+
+        return slots
+
+    async def _prepareBatchCases(self, cases, prepared, taken: asyncio.Condition, ahead):
+        """Prepares the cases into the queue, while it has fewer cases than the number ahead and the disk has space"""
+        caseSize = 0
+
+        def canPrepare():
+            if prepared.empty():
+                return True
+
+            usage = shutil.disk_usage(self._project.path)
+            return prepared.qsize() < ahead and usage.free - caseSize > usage.total * BATCH_DISK_RESERVE_RATIO
+
+        try:
+            for name, parameters in cases:
+                async with taken:
+                    await taken.wait_for(canPrepare)
+                if self._batchStop:
+                    break
+
+                self.loadBatchCase(name, parameters)
+                await self._initializeCase()
+
+                caseRoot = FileSystem.caseRoot()
+                caseSize = max(caseSize, await asyncio.to_thread(directorySize, caseRoot))
+                self._setBatchStatus(name, SolverStatus.WAITING)
+                prepared.put_nowait((name, caseRoot, findSolver()))
+        finally:
+            prepared.put_nowait(None)
+
+    async def _solveBatchCase(self, name, caseRoot, solver, environment, cpus, slots):
+        sampler = None
+        try:
+            with open(caseRoot / STDOUT_FILE_NAME, 'w') as stdout, open(caseRoot / STDERR_FILE_NAME, 'w') as stderr:
+                process = await runParallelUtility(solver, parallel=environment, cwd=caseRoot,
+                                                   stdout=stdout, stderr=stderr, cpus=cpus)
+            self._batchProcesses[name] = caseRoot, process
+            sampler = self._startSampler(process.pid, caseRoot)
+            self._setBatchStatus(name, SolverStatus.RUNNING)
+
+            result = await process.wait()
+            logger.info(f'Batch case {name} exited with {result}')
+            self._setBatchStatus(name, SolverStatus.ENDED if result == 0 or self._batchStop else SolverStatus.ERROR)
+        except Exception as e:
+            logger.error(f'Batch case {name} failed to run: {e}')
+            self._setBatchStatus(name, SolverStatus.ERROR)
+        finally:
+            if sampler is not None:
+                sampler.stop()
+            self._batchProcesses.pop(name, None)
+            slots.put_nowait(cpus)
+
+    def _setLiveProcess(self, process, newRun=False):
         self._runType = RunType.PROCESS
         self._process = process
-        self._updateStatus()
-        self._startMonitor()
+        self._setStatus(SolverStatus.RUNNING)
+        self._startMonitor(newRun)
 
-    def _startMonitor(self):
+    def _startMonitor(self, newRun):
         if self._monitor is None:
-            self._monitor = QTimer()
-            self._monitor.setInterval(SOLVER_CHECK_INTERVAL)
-            self._monitor.timeout.connect(self._updateStatus)
+            self._monitor = ProcessWatcher(self._process.pid, self._process.startTime)
+            self._monitor.exited.connect(self._solverExited)
             self._monitor.start()
+            self._sampler = self._startSampler(self._process.pid, self._livePath(), append=not newRun)
 
     def _stopMonitor(self):
         if self._monitor:
             self._monitor.stop()
+            self._monitor.exited.disconnect(self._solverExited)
             self._monitor = None
             self._process = None
 
+        if self._sampler:
+            self._sampler.stop()
+            self._sampler = None
+
+    def _startSampler(self, pid, caseRoot, append=False):
+        sampler = ResourceSampler(pid, caseRoot)
+        sampler.sampled.connect(self.resourcesSampled)
+        sampler.start(append)
+
+        return sampler
+
     def _loadLiveStatus(self):
         process = self._project.solverProcess()
         if process:
@@ -265,12 +403,14 @@ class CaseManager(QObject):
         else:
             self._setStatus(SolverStatus.NONE)
 
-    def _updateStatus(self):
-        if self._process.isRunning():
-            self._setStatus(SolverStatus.RUNNING)
-        else:
-            self._setStatus(SolverStatus.ENDED)
-            self._stopMonitor()
+    def _solverExited(self):
+        run = readSolverRun(self._livePath())
+        if run is not None and run.pid == self._process.pid and run.isEnded():
+            self._solverRun = run
+            logger.info(f'Solver exited: {run}')
+
+        self._setStatus(SolverStatus.ENDED)
+        self._stopMonitor()
 
     async def _generateCase(self):
         self._generator = CaseGenerator()
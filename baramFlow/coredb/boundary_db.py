@@ -180,8 +180,7 @@ class BoundaryDB:
 
     @classmethod
     def getBoundaryTypeByName(cls, rname, bcname):
-        return coredb.CoreDB().getValue(
-            f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition[name="{bcname}"]/physicalType')
+        return coredb.CoreDB().getValue(cls.getXPathByName(rname, bcname) + '/physicalType')
 
     @classmethod
     def needsCoupledBoundary(cls, bctype):
@@ -255,36 +254,37 @@ class MaterialObserver(IMaterialObserver):
     def materialRemoving(self, db, mid: str):
         for wallAdhesion in db.getElements(
                 f'{BOUNDARY_CONDITION_XPATH}/wall/wallAdhesions/wallAdhesion[mid="{mid}"]'):
-            wallAdhesion.getparent().remove(wallAdhesion)
+            db.detachElement(wallAdhesion)
 
         for volumeFraction in db.getElements(
                 f'{BOUNDARY_CONDITION_XPATH}/volumeFractions/volumeFraction[material="{mid}"]'):
-            volumeFraction.getparent().remove(volumeFraction)
+            db.detachElement(volumeFraction)
 
     def specieAdded(self, db, mid: str, mixtureID: str):
         for mixture in db.getElements(f'{BOUNDARY_CONDITION_XPATH}/species/mixture[mid="{mixtureID}"]'):
-            mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                             f' <mid>{mid}</mid><value>0</value>'
-                                             '</specie>'))
+            db.appendElement(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                        f' <mid>{mid}</mid><value>0</value>'
+                                                        '</specie>'))
 
     def specieRemoving(self, db, mid: str, primarySpecie):
         for boundaryCondition in db.getElements(BOUNDARY_CONDITION_XPATH):
             for specie in xml.getElements(boundaryCondition, f'species/mixture/specie[mid="{mid}"]'):
-                self._removeSpecieInComposition(primarySpecie, specie)
+                self._removeSpecieInComposition(db, primarySpecie, specie)
 
 
 class RegionMaterialObserver(IRegionMaterialObserver):
     def materialsUpdating(self, db, rname: str, primary: str, secondaries: list[str], species):
         def addWallAdhesion(parent, mid1, mid2):
             if xml.getElement(parent, f'wallAdhesion[mid="{mid1}"][mid="{mid2}"]') is None:
-                parent.append(xml.createElement('<wallAdhesion xmlns="http://www.baramcfd.org/baram"> '
-                                                f'  <mid>{mid1}</mid>'
-                                                f'  <mid>{mid2}</mid>'
-                                                '   <contactAngle>90</contactAngle>'
-                                                '   <advancingContactAngle>90</advancingContactAngle>'
-                                                '   <recedingContactAngle>90</recedingContactAngle>'
-                                                '   <characteristicVelocityScale>0.001</characteristicVelocityScale>'
-                                                '</wallAdhesion>'))
+                db.appendElement(parent,
+                                 xml.createElement('<wallAdhesion xmlns="http://www.baramcfd.org/baram"> '
+                                                   f'  <mid>{mid1}</mid>'
+                                                   f'  <mid>{mid2}</mid>'
+                                                   '   <contactAngle>90</contactAngle>'
+                                                   '   <advancingContactAngle>90</advancingContactAngle>'
+                                                   '   <recedingContactAngle>90</recedingContactAngle>'
+                                                   '   <characteristicVelocityScale>0.001</characteristicVelocityScale>'
+                                                   '</wallAdhesion>'))
 
         speicesXML = f'''<mixture xmlns="http://www.baramcfd.org/baram">
                             <mid>{primary}</mid>{self._specieRatiosXML(species)}
@@ -302,15 +302,16 @@ class RegionMaterialObserver(IRegionMaterialObserver):
                     addWallAdhesion(wallAdhesions, secondaries[i], secondaries[j])
 
                 if xml.getElement(volumeFractions, f'volumeFraction[material="{secondaries[i]}"]') is None:
-                    volumeFractions.append(xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
-                                                             f' <material>{secondaries[i]}</material>'
-                                                             f' <fraction>0</fraction>'
-                                                             '</volumeFraction>'))
+                    db.appendElement(volumeFractions,
+                                     xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
+                                                       f' <material>{secondaries[i]}</material>'
+                                                       f' <fraction>0</fraction>'
+                                                       '</volumeFraction>'))
 
             speciesElement = xml.getElement(boundaryCondtion, 'species')
-            speciesElement.clear()
+            db.emptyElement(speciesElement)
             if species:
-                speciesElement.append(xml.createElement(speicesXML))
+                db.appendElement(speciesElement, xml.createElement(speicesXML))
 
 
 class ScalarObserver(IUserDefinedScalarObserver):
@@ -321,8 +322,8 @@ class ScalarObserver(IUserDefinedScalarObserver):
                         </scalar>'''
 
         for scalars in db.getElements(BOUNDARY_CONDITION_XPATH + '/userDefinedScalars'):
-            scalars.append(xml.createElement(scalarXML))
+            db.appendElement(scalars, xml.createElement(scalarXML))
 
     def scalarRemoving(self, db, scalarID):
         for scalars in db.getElements(BOUNDARY_CONDITION_XPATH + '/userDefinedScalars'):
-            xml.removeElement(scalars, f'scalar[scalarID="{scalarID}"]')
+            db.detachElement(xml.getElement(scalars, f'scalar[scalarID="{scalarID}"]'))
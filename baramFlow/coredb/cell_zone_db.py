@@ -88,9 +88,10 @@ def getCellZoneElements(rname=None):
     return coredb.CoreDB().getElements(f'{RegionDB.getXPath(rname)}/cellZones/cellZone')
 
 
-def _addMaterialSourceTerm(parent, mid):
+def _addMaterialSourceTerm(db, parent, mid):
     if xml.getElement(parent, f'materialSource[material="{mid}"]') is None:
-        parent.append(
+        db.appendElement(
+            parent,
             xml.createElement('<materialSource xmlns="http://www.baramcfd.org/baram" disabled="true">'
                               f'  <material>{mid}</material>'
                               '   <unit>valueForEntireCellZone</unit>'
@@ -109,20 +110,20 @@ class MaterialObserver(IMaterialObserver):
     def specieAdded(self, db, mid, mixtureID):
         for cellZone in db.getElements(f'{REGION_XPATH}[material="{mixtureID}"]/cellZones/cellZone'):
             for sourceTerms in xml.getElements(cellZone, f'sourceTerms/materials'):
-                _addMaterialSourceTerm(sourceTerms, mid)
+                _addMaterialSourceTerm(db, sourceTerms, mid)
 
             for mixture in xml.getElements(cellZone, f'fixedValues/species/mixture[mid="{mixtureID}"]'):
-                mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                                 f' <mid>{mid}</mid><value disabled="true">0</value>'
-                                                 '</specie>'))
+                db.appendElement(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                            f' <mid>{mid}</mid><value disabled="true">0</value>'
+                                                            '</specie>'))
 
     def specieRemoving(self, db, mid, primarySpecie):
         for cellZone in db.getElements(CELL_ZONE_CONDITION_XPATH):
             for sourceTerm in xml.getElements(cellZone, f'sourceTerms/materials/materialSource[material="{mid}"]'):
-                sourceTerm.getparent().remove(sourceTerm)
+                db.detachElement(sourceTerm)
 
             for specie in xml.getElements(cellZone, f'fixedValues/species/mixture/specie[mid="{mid}"]'):
-                specie.getparent().remove(specie)
+                db.detachElement(specie)
 
 
 class RegionMaterialObserver(IRegionMaterialObserver):
@@ -140,19 +141,19 @@ class RegionMaterialObserver(IRegionMaterialObserver):
             for sourceTerm in xml.getElements(materialSourceTerms, f'materialSource'):
                 sourceTermMaterial = xml.getText(sourceTerm, 'material')
                 if sourceTermMaterial not in secondaries and sourceTermMaterial not in species:
-                    sourceTerm.getparent().remove(sourceTerm)
+                    db.detachElement(sourceTerm)
 
             for mid in secondaries:
-                _addMaterialSourceTerm(materialSourceTerms, mid)
+                _addMaterialSourceTerm(db, materialSourceTerms, mid)
 
             for mid in species:
-                _addMaterialSourceTerm(materialSourceTerms, mid)
+                _addMaterialSourceTerm(db, materialSourceTerms, mid)
 
             fixedValuesSpecies = xml.getElement(cellZone, 'fixedValues/species')
-            fixedValuesSpecies.clear()
+            db.emptyElement(fixedValuesSpecies)
 
             if species:
-                fixedValuesSpecies.append(xml.createElement(fixedValuesSpeciesXML))
+                db.appendElement(fixedValuesSpecies, xml.createElement(fixedValuesSpeciesXML))
 
 
 class ScalarObserver(IUserDefinedScalarObserver):
@@ -172,14 +173,13 @@ class ScalarObserver(IUserDefinedScalarObserver):
 
         for cellZone in db.getElements(CELL_ZONE_CONDITION_XPATH):
             scalarSourceTerms = xml.getElement(cellZone, 'sourceTerms/userDefinedScalars')
-            scalarSourceTerms.append(xml.createElement(sourceTermXML))
+            db.appendElement(scalarSourceTerms, xml.createElement(sourceTermXML))
 
             scalarFixedValues = xml.getElement(cellZone, 'fixedValues/userDefinedScalars')
-            scalarFixedValues.append(xml.createElement(fixedValueXML))
+            db.appendElement(scalarFixedValues, xml.createElement(fixedValueXML))
 
     def scalarRemoving(self, db, scalarID):
         for cellZone in db.getElements(CELL_ZONE_CONDITION_XPATH):
-            xml.removeElement(xml.getElement(cellZone, 'sourceTerms/userDefinedScalars'),
-                              f'scalarSource[scalarID="{scalarID}"]')
-            xml.removeElement(xml.getElement(cellZone, 'fixedValues/userDefinedScalars'),
-                              f'scalar[scalarID="{scalarID}"]')
+            db.detachElement(
+                xml.getElement(cellZone, f'sourceTerms/userDefinedScalars/scalarSource[scalarID="{scalarID}"]'))
+            db.detachElement(xml.getElement(cellZone, f'fixedValues/userDefinedScalars/scalar[scalarID="{scalarID}"]'))
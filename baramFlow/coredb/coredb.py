@@ -5,6 +5,9 @@ from __future__ import annotations
 
 import copy
 import logging
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional
 
 from lxml import etree
@@ -18,24 +21,168 @@ import resource_rc
 
 from resources import resource
 from baramFlow.coredb import migrate
+from baramFlow.coredb.coredb_index import CoreDBIndex, KEY_ATTRIBUTES
 from .libdb import nsmap, ns, DBError, ValueException
 
 __instance: Optional[_CoreDB] = None
 
+# A view that CoreDB() returns instead of the instance in the current context, such as a snapshot of CoreDBReader.
+_view: ContextVar[Optional[_CoreDB]] = ContextVar('coreDBView', default=None)
+
 logger = logging.getLogger(__name__)
 
 
+# Positions in element paths like "region[2]". Elements at the same path without positions share a declaration
+_POSITION_PATTERN = re.compile(r'\[\d+\]')
+
+
 class Cancel(Exception):
     pass
 
 
+class _SchemaNode:
+    """Facts of an element declaration that getValue() and validate() need
+
+    Finding a declaration in the XML Schema is far more expensive than finding the element in the configuration,
+    so they are resolved once per element path and kept.
+    """
+    NUMBER_LIST = 'numberList'
+    DOUBLE = 'double'
+    DECIMAL = 'decimal'
+    STRING = 'string'
+
+    def __init__(self, schema):
+        self.hasSimpleContent = schema.type.has_simple_content()
+        self.hasBatchParameter = schema.type.is_complex() and 'batchParameter' in schema.type.attributes
+
+        self.kind = None
+        self.isInteger = False
+        self.minInclusive = None
+        self.maxInclusive = None
+        self.minExclusive = None
+        self.maxExclusive = None
+        self.enumeration = None
+
+        if not self.hasSimpleContent:
+            return
+
+        if schema.type.local_name == 'inputNumberListType':
+            self.kind = self.NUMBER_LIST
+        elif schema.type.is_derived(schema.type.maps.types[XSD_DOUBLE]):  # The type has restrictions or attributes
+            self.kind = self.DOUBLE
+            baseType = schema.type.base_type
+            self.minInclusive = getattr(baseType.get_facet(XSD_MIN_INCLUSIVE), 'value', None)
+            self.maxInclusive = getattr(baseType.get_facet(XSD_MAX_INCLUSIVE), 'value', None)
+            self.minExclusive = getattr(baseType.get_facet(XSD_MIN_EXCLUSIVE), 'value', None)
+            self.maxExclusive = getattr(baseType.get_facet(XSD_MAX_EXCLUSIVE), 'value', None)
+        elif schema.type.is_decimal():
+            self.kind = self.DECIMAL
+            if schema.type.is_simple():
+                name = schema.type.local_name.lower()
+                self.minInclusive = schema.type.min_value
+                self.maxInclusive = schema.type.max_value
+            else:
+                name = schema.type.content.primitive_type.local_name.lower()
+                self.minInclusive = schema.type.content.min_value
+                self.maxInclusive = schema.type.content.max_value
+            self.isInteger = 'integer' in name
+        else:
+            self.kind = self.STRING
+            if schema.type.is_restriction():
+                self.enumeration = schema.type.enumeration
+
+
+class _UndoLog:
+    """Changes made to the tree in a transaction, recorded to be undone in reverse order
+
+    Elements removed from the tree are kept alive by the log and put back as they are,
+    so rolling back takes time in proportion to the number of changes, not to the size of the tree.
+    """
+    def __init__(self):
+        self._entries = []
+
+    def textChanged(self, element):
+        self._entries.append((self._restoreText, (element, element.text)))
+
+    def attributeChanged(self, element, name):
+        self._entries.append((self._restoreAttribute, (element, name, element.get(name))))
+
+    def inserted(self, element):
+        self._entries.append((self._unlink, (element,)))
+
+    def removed(self, element):
+        parent = element.getparent()
+        self._entries.append((self._insert, (parent, parent.index(element), element)))
+
+    def cleared(self, element):
+        self._entries.append(
+            (self._restore, (element, element.text, element.tail, dict(element.attrib), list(element))))
+
+    def rollback(self):
+        for undo, args in reversed(self._entries):
+            undo(*args)
+
+        self._entries = []
+
+    @staticmethod
+    def _restoreText(element, text):
+        element.text = text
+
+    @staticmethod
+    def _restoreAttribute(element, name, value):
+        if value is None:
+            element.attrib.pop(name, None)
+        else:
+            element.set(name, value)
+
+    @staticmethod
+    def _unlink(element):
+        element.getparent().remove(element)
+
+    @staticmethod
+    def _insert(parent, index, element):
+        parent.insert(index, element)
+
+    @staticmethod
+    def _restore(element, text, tail, attributes, children):
+        element.clear()
+        element.text = text
+        element.tail = tail
+        for name, value in attributes.items():
+            element.set(name, value)
+        element.extend(children)
+
+
 def CoreDB():
     global __instance
+    if (current := _view.get()) is not None:
+        return current
+
     assert(__instance is not None)
 
     return __instance
 
 
+def currentView() -> Optional[_CoreDB]:
+    """Returns the view made current by viewing(), or None"""
+    return _view.get()
+
+
+@contextmanager
+def viewing(view: _CoreDB):
+    """Makes CoreDB() return the view in the current context
+
+    Threads started by asyncio.to_thread() in the context see the view as well,
+    while other tasks and threads keep getting the instance.
+    Functions run by an executor see it only if they are submitted with contextvars.copy_context().run.
+    """
+    token = _view.set(view)
+    try:
+        yield view
+    finally:
+        _view.reset(token)
+
+
 def createDB():
     global __instance
     assert(__instance is None)
@@ -90,13 +237,20 @@ class _CoreDB(object):
     BOUNDARY_CONDITION_MAX_INDEX = 10000
     USER_DEFINED_SCALAR_MAX_INDEX = 10000
 
+    # Element path without positions -> _SchemaNode, or None if not declared.
+    # Shared by all the instances, which load the same schema.
+    _schemaNodes: dict[str, Optional[_SchemaNode]] = {}
+
     def __init__(self):
         self._initialized = True
 
         self._configCount = 0
         self._configCountAtSave = self._configCount
         self._inContext = False
-        self._backupTree = None
+        self._undoLog: Optional[_UndoLog] = None
+        self._revision = 0
+        self._frozen = None
+        self._validationPending = False
         self._lastError = None
         self._lastNote = None
 
@@ -107,21 +261,39 @@ class _CoreDB(object):
         self._xmlParser = etree.XMLParser(schema=self._xmlSchema)
 
         self._xmlTree = None
+        self._index = CoreDBIndex()
 
     def __enter__(self):
         logger.debug('enter')
-        self._backupTree = copy.deepcopy(self._xmlTree)
+        self._undoLog = _UndoLog()
         self._lastError = None
         self._inContext = True
         return self
 
     def __exit__(self, eType, eValue, eTraceback):
-        if self._lastError is not None or eType is not None:
-            self._xmlTree = self._backupTree
+        rollback = self._lastError is not None or eType is not None
+        invalid = None
+
+        # Mutations in the context have been validated only locally. The whole tree is validated once here.
+        if not rollback and self._validationPending:
+            try:
+                self._xmlSchema.assertValid(self._xmlTree)
+            except etree.DocumentInvalid as ex:
+                rollback = True
+                invalid = ex
+
+        if rollback:
+            self._undoLog.rollback()
+            self._index.rebuild(self._xmlTree)
+            self._revision += 1
 
         self._lastError = None
-        self._backupTree = None
+        self._undoLog = None
         self._inContext = False
+        self._validationPending = False
+
+        if invalid is not None:
+            raise invalid
 
         if eType == Cancel:
             logger.debug('exit with Cancel')
@@ -145,7 +317,7 @@ class _CoreDB(object):
         Raises:
             LookupError: Less or more than one item are matched, or attribute not found
         """
-        elements = self._xmlTree.findall(xpath, namespaces=nsmap)
+        elements = self._findAll(xpath)
         if len(elements) != 1:
             raise LookupError
 
@@ -172,7 +344,7 @@ class _CoreDB(object):
         Raises:
             LookupError: Less or more than one item are matched, or attribute not found
         """
-        elements = self._xmlTree.findall(xpath, namespaces=nsmap)
+        elements = self._findAll(xpath)
         if len(elements) != 1:
             raise LookupError
 
@@ -180,7 +352,7 @@ class _CoreDB(object):
             raise LookupError
 
         oldValue = elements[0].get(name)
-        elements[0].set(name, value)
+        self._setAttribute(elements[0], name, value)
         if value != oldValue:
             self._configCount += 1
 
@@ -204,13 +376,12 @@ class _CoreDB(object):
         if parameter := element.get('batchParameter'):
             return '$' + parameter
 
-        path = self._xmlTree.getelementpath(element)
-        schema = self._schema.find(".//" + path, namespaces=nsmap)
+        schema = self._schemaNode(element)
 
         if schema is None:
             raise LookupError
 
-        if not schema.type.has_simple_content():
+        if not schema.hasSimpleContent:
             raise LookupError
 
         logger.debug(f'getValue( {xpath} -> {element.text} )')
@@ -237,19 +408,18 @@ class _CoreDB(object):
         """
         element = self.getElement(xpath)
 
-        path = self._xmlTree.getelementpath(element)
-        schema = self._schema.find(".//" + path, namespaces=nsmap)
+        schema = self._schemaNode(element)
 
         if schema is None:
             raise LookupError
 
-        if not schema.type.has_simple_content():
+        if not schema.hasSimpleContent:
             raise LookupError
 
         batchParameter = None
         value = value.strip()
 
-        if schema.type.is_complex() and 'batchParameter' in schema.type.attributes:
+        if schema.hasBatchParameter:
             if value and value[0] == '$':
                 batchParameter = value[1:]
                 batchParameterXPath = f'.//runCalculation/batch/parameters/parameter[name="{batchParameter}"]'
@@ -260,7 +430,7 @@ class _CoreDB(object):
                 else:
                     batchParameter = None
 
-        if schema.type.local_name == 'inputNumberListType':
+        if schema.kind == _SchemaNode.NUMBER_LIST:
             numbers = value.split()
             # To check if the strings in value are valid numbers
             # 'ValueError' exception is raised if invalid number found
@@ -272,46 +442,33 @@ class _CoreDB(object):
 
             return element, ' '.join(numbers), None
 
-        elif schema.type.is_derived(schema.type.maps.types[XSD_DOUBLE]):  # The case when the type has restrictions or attributes
+        elif schema.kind == _SchemaNode.DOUBLE:  # The case when the type has restrictions or attributes
             try:
                 decimal = float(value)
             except ValueError:
                 self._lastError = DBError.FLOAT_ONLY
                 raise ValueException(DBError.FLOAT_ONLY, self._lastNote)
 
-            if (minValue := getattr(schema.type.base_type.get_facet(XSD_MIN_INCLUSIVE), 'value', None)) is not None:
-                if decimal < minValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.minInclusive is not None and decimal < schema.minInclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if (maxValue := getattr(schema.type.base_type.get_facet(XSD_MAX_INCLUSIVE), 'value', None)) is not None:
-                if decimal > maxValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.maxInclusive is not None and decimal > schema.maxInclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if (minValue := getattr(schema.type.base_type.get_facet(XSD_MIN_EXCLUSIVE), 'value', None)) is not None:
-                if decimal <= minValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.minExclusive is not None and decimal <= schema.minExclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if (maxValue := getattr(schema.type.base_type.get_facet(XSD_MAX_EXCLUSIVE), 'value', None)) is not None:
-                if decimal >= maxValue:
-                    self._lastError = DBError.OUT_OF_RANGE
-                    raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
+            if schema.maxExclusive is not None and decimal >= schema.maxExclusive:
+                self._lastError = DBError.OUT_OF_RANGE
+                raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
             return element, value.lower(), batchParameter
 
-        elif schema.type.is_decimal():
-            if schema.type.is_simple():
-                name = schema.type.local_name.lower()
-                minValue = schema.type.min_value
-                maxValue = schema.type.max_value
-            else:
-                name = schema.type.content.primitive_type.local_name.lower()
-                minValue = schema.type.content.min_value
-                maxValue = schema.type.content.max_value
-
-            if 'integer' in name:
+        elif schema.kind == _SchemaNode.DECIMAL:
+            if schema.isInteger:
                 try:
                     decimal = int(value)
                 except ValueError:
@@ -324,11 +481,11 @@ class _CoreDB(object):
                     self._lastError = DBError.FLOAT_ONLY
                     raise ValueException(DBError.FLOAT_ONLY, self._lastNote)
 
-            if minValue is not None and decimal < minValue:
+            if schema.minInclusive is not None and decimal < schema.minInclusive:
                 self._lastError = DBError.OUT_OF_RANGE
                 raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
-            if maxValue is not None and decimal > maxValue:
+            if schema.maxInclusive is not None and decimal > schema.maxInclusive:
                 self._lastError = DBError.OUT_OF_RANGE
                 raise ValueException(DBError.OUT_OF_RANGE, self._lastNote)
 
@@ -338,7 +495,7 @@ class _CoreDB(object):
         # For now, string value is set only by VIEW code not by user.
         # Therefore, raising exception(not returning value) is reasonable.
         else:
-            if schema.type.is_restriction() and value not in schema.type.enumeration:
+            if schema.enumeration is not None and value not in schema.enumeration:
                 raise ValueError
 
             return element, value, None
@@ -364,17 +521,14 @@ class _CoreDB(object):
             if element.text or value:     # the case of (element.text=='' and oldValue is None) happens because of XML processing
                 self._configCount += 1
 
-            element.text = value
+            self.setElementText(element, value)
 
         logger.debug(f'setValue( {xpath} -> {element.text} )')
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         if element.get('batchParameter') != parameter:
-            if parameter:
-                element.set('batchParameter', parameter)
-            else:
-                del element.attrib['batchParameter']
+            self._setAttribute(element, 'batchParameter', parameter or None)
             self._configCount += 1
 
     def setBulk(self, xpath: str, value: dict):
@@ -428,15 +582,17 @@ class _CoreDB(object):
         if not isinstance(value, dict):
             raise ValueError
 
-        elements = self._xmlTree.findall(xpath, namespaces=nsmap)
+        elements = self._findAll(xpath)
         if len(elements) != 1:
             raise LookupError
 
-        elements[0].clear()
+        self.emptyElement(elements[0])
         _setBulkInternal(elements[0], value)
+        self._index.added(elements[0])
+        self._revision += 1
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
     def getBulk(self, xpath: str) -> dict:
         """Get the value at the specified path
@@ -480,7 +636,7 @@ class _CoreDB(object):
 
             return data
 
-        elements = self._xmlTree.findall(xpath, namespaces=nsmap)
+        elements = self._findAll(xpath)
         if len(elements) != 1:
             raise LookupError
 
@@ -514,63 +670,49 @@ class _CoreDB(object):
 
     def clearRegions(self):
         parent = self._xmlTree.find('.//regions', namespaces=nsmap)
-        parent.clear()
+        self.emptyElement(parent)
 
     def addCellZone(self, rname: str, zname: str) -> int:
-        zone = self._xmlTree.find(f'.//region[name="{rname}"]/cellZones/cellZone[name="{zname}"]', namespaces=nsmap)
-
-        if zone is not None:
+        region = self._index.region(rname)
+        if region.find(f'cellZones/cellZone[name="{zname}"]', namespaces=nsmap) is not None:
             raise FileExistsError
 
-        idList = self._xmlTree.xpath(f'.//x:cellZones/x:cellZone/@czid', namespaces={'x': ns})
-
-        for index in range(1, self.CELL_ZONE_MAX_INDEX):
-            if str(index) not in idList:
-                break
-        else:
+        index = self._index.cellZones.availableID(self.CELL_ZONE_MAX_INDEX)
+        if index is None:
             raise OverflowError
 
-        # 'region' cannot be None because zoneTree lookup above succeeded
-        cellZones = self._xmlTree.find(f'.//region[name="{rname}"]/cellZones', namespaces=nsmap)
+        cellZones = region.find('cellZones', namespaces=nsmap)
 
         zoneTree = etree.parse(resource.file(self.CELL_ZONE_PATH), self._xmlParser)
         zone = zoneTree.getroot()
         zone.find('name', namespaces=nsmap).text = zname
         zone.attrib['czid'] = str(index)
 
-        cellZones.append(zone)
+        self.appendElement(cellZones, zone)
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         return index
 
     def getCellZones(self, rname: str) -> list[(int, str)]:
-        elements = self._xmlTree.findall(f'.//region[name="{rname}"]/cellZones/cellZone', namespaces=nsmap)
+        elements = self._findAll(f'.//region[name="{rname}"]/cellZones/cellZone')
         return [(int(e.attrib['czid']), e.find('name', namespaces=nsmap).text) for e in elements]
 
     def getCellZonesByType(self, rname: str, zoneType: str) -> list[int]:
-        elements = self._xmlTree.findall(f'.//region[name="{rname}"]/cellZones/cellZone[zoneType="{zoneType}"]',
-                                         namespaces=nsmap)
+        elements = self._findAll(f'.//region[name="{rname}"]/cellZones/cellZone[zoneType="{zoneType}"]')
         return [e.attrib['czid'] for e in elements]
 
     def addBoundaryCondition(self, rname: str, bname: str, geometricalType: str, physicalType: str) -> int:
-        bc = self._xmlTree.find(f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition[name="{bname}"]',
-                                namespaces=nsmap)
-
-        if bc is not None:
+        if self._index.boundaryByName(rname, bname) is not None:
             raise FileExistsError
 
-        idList = self._xmlTree.xpath(f'.//x:boundaryConditions/x:boundaryCondition/@bcid', namespaces={'x': ns})
-
-        for index in range(1, self.BOUNDARY_CONDITION_MAX_INDEX):
-            if str(index) not in idList:
-                break
-        else:
+        index = self._index.boundaries.availableID(self.BOUNDARY_CONDITION_MAX_INDEX)
+        if index is None:
             raise OverflowError
 
-        parent = self._xmlTree.find(f'.//region[name="{rname}"]/boundaryConditions', namespaces=nsmap)
+        parent = self._index.region(rname).find('boundaryConditions', namespaces=nsmap)
 
         bcTree = etree.parse(resource.file(self.BOUNDARY_CONDITION_PATH), self._xmlParser)
         bc = bcTree.getroot()
@@ -582,11 +724,11 @@ class _CoreDB(object):
 
         bc.find('physicalType', namespaces=nsmap).text = physicalType
 
-        parent.append(bc)
+        self.appendElement(parent, bc)
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         return index
 
@@ -601,8 +743,7 @@ class _CoreDB(object):
         Returns:
             List of boundary conditions in tuple, '(bcid, name, physicalType)'
         """
-        elements = self._xmlTree.findall(
-            f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition', namespaces=nsmap)
+        elements = self._findAll(f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition')
         return [(int(e.attrib['bcid']),
                  e.find('name', namespaces=nsmap).text,
                  e.find('physicalType', namespaces=nsmap).text) for e in elements]
@@ -624,12 +765,15 @@ class _CoreDB(object):
         return [(int(e.attrib['bcid']), e.find('name', namespaces=nsmap).text) for e in elements]
 
     def copyBoundaryConditions(self, sourceID, targetID):
-        old = self.getElement(f'regions/region/boundaryConditions/boundaryCondition[@bcid="{targetID}"]')
-        new = copy.deepcopy(self.getElement(f'regions/region/boundaryConditions/boundaryCondition[@bcid="{sourceID}"]'))
+        old = self._index.boundary(targetID)
+        new = copy.deepcopy(self._index.boundary(sourceID))
         new.set('bcid', str(targetID))
         new.find('name', namespaces=nsmap).text = old.find('name', namespaces=nsmap).text
         new.find('geometricalType', namespaces=nsmap).text = old.find('geometricalType', namespaces=nsmap).text
-        old.getparent().replace(old, new)
+        parent = old.getparent()
+        index = parent.index(old)
+        self.detachElement(old)
+        self._insert(parent, index, new)
 
     def hasMesh(self):
         return True if self._xmlTree.findall(f'.//regions/region', namespaces=nsmap) else False
@@ -649,21 +793,20 @@ class _CoreDB(object):
         forceTree = etree.parse(resource.file(self.FORCE_MONITOR_PATH), self._xmlParser)
         forceTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(forceTree.getroot())
+        self.appendElement(parent, forceTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         return monitorName
 
     def removeForceMonitor(self, name: str):
-        monitor = self._xmlTree.find(f'.//monitors/forces/forceMonitor[name="{name}"]', namespaces=nsmap)
+        monitor = self._index.monitor('forceMonitor', name)
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/forces', namespaces=nsmap)
-        parent.remove(monitor)
+        self.detachElement(monitor)
 
         self._configCount += 1
 
@@ -673,7 +816,7 @@ class _CoreDB(object):
 
     def clearForceMonitors(self):
         parent = self._xmlTree.find('.//monitors/forces', namespaces=nsmap)
-        parent.clear()
+        self.emptyElement(parent)
 
     def addPointMonitor(self) -> str:
         names = self.getPointMonitors()
@@ -690,21 +833,20 @@ class _CoreDB(object):
         pointTree = etree.parse(resource.file(self.POINT_MONITOR_PATH), self._xmlParser)
         pointTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(pointTree.getroot())
+        self.appendElement(parent, pointTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         return monitorName
 
     def removePointMonitor(self, name: str):
-        monitor = self._xmlTree.find(f'.//monitors/points/pointMonitor[name="{name}"]', namespaces=nsmap)
+        monitor = self._index.monitor('pointMonitor', name)
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/points', namespaces=nsmap)
-        parent.remove(monitor)
+        self.detachElement(monitor)
 
         self._configCount += 1
 
@@ -714,7 +856,7 @@ class _CoreDB(object):
 
     def clearPointMonitors(self):
         parent = self._xmlTree.find('.//monitors/points', namespaces=nsmap)
-        parent.clear()
+        self.emptyElement(parent)
 
     def addSurfaceMonitor(self) -> str:
         names = self.getSurfaceMonitors()
@@ -731,21 +873,20 @@ class _CoreDB(object):
         surfaceTree = etree.parse(resource.file(self.SURFACE_MONITOR_PATH), self._xmlParser)
         surfaceTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(surfaceTree.getroot())
+        self.appendElement(parent, surfaceTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         return monitorName
 
     def removeSurfaceMonitor(self, name: str):
-        monitor = self._xmlTree.find(f'.//monitors/surfaces/surfaceMonitor[name="{name}"]', namespaces=nsmap)
+        monitor = self._index.monitor('surfaceMonitor', name)
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/surfaces', namespaces=nsmap)
-        parent.remove(monitor)
+        self.detachElement(monitor)
 
         self._configCount += 1
 
@@ -755,7 +896,7 @@ class _CoreDB(object):
 
     def clearSurfacesMonitors(self):
         parent = self._xmlTree.find('.//monitors/surfaces', namespaces=nsmap)
-        parent.clear()
+        self.emptyElement(parent)
 
     def addVolumeMonitor(self) -> str:
         names = self.getVolumeMonitors()
@@ -772,21 +913,20 @@ class _CoreDB(object):
         volumeTree = etree.parse(resource.file(self.VOLUME_MONITOR_PATH), self._xmlParser)
         volumeTree.find('name', namespaces=nsmap).text = monitorName
 
-        parent.append(volumeTree.getroot())
+        self.appendElement(parent, volumeTree.getroot())
 
         self._configCount += 1
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         return monitorName
 
     def removeVolumeMonitor(self, name: str):
-        monitor = self._xmlTree.find(f'.//monitors/volumes/volumeMonitor[name="{name}"]', namespaces=nsmap)
+        monitor = self._index.monitor('volumeMonitor', name)
         if monitor is None:
             raise LookupError
 
-        parent = self._xmlTree.find(f'.//monitors/volumes', namespaces=nsmap)
-        parent.remove(monitor)
+        self.detachElement(monitor)
 
         self._configCount += 1
 
@@ -796,7 +936,7 @@ class _CoreDB(object):
 
     def clearVolumeMonitors(self):
         parent = self._xmlTree.find('.//monitors/volumes', namespaces=nsmap)
-        parent.clear()
+        self.emptyElement(parent)
 
     def clearMonitors(self):
         self.clearForceMonitors()
@@ -821,7 +961,7 @@ class _CoreDB(object):
 
     def getSurfaceTensions(self, rname):
         xpath = f'.//region[name="{rname}"]/phaseInteractions/surfaceTensions/surfaceTension'
-        elements = self._xmlTree.findall(xpath, namespaces=nsmap)
+        elements = self._findAll(xpath)
 
         surfaceTensions = []
         for e in elements:
@@ -842,32 +982,102 @@ class _CoreDB(object):
                 for e in elements if e.attrib['scalarID'] != '0']
 
     def addElementFromString(self, xpath, text):
-        parent = self._xmlTree.find(xpath, namespaces=nsmap)
+        parent = self._find(xpath)
         if parent is None:
             raise LookupError
 
-        parent.append(etree.fromstring(text))
+        self.appendElement(parent, etree.fromstring(text))
 
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
 
         self._configCount += 1
 
     def removeElement(self, xpath):
-        element = self._xmlTree.find(xpath, namespaces=nsmap)
+        element = self._find(xpath)
         if element is None:
             return
 
-        parent = self._xmlTree.find(xpath+'/..', namespaces=nsmap)
-        parent.remove(element)
+        self.detachElement(element)
 
         self._configCount += 1
 
     def clearElement(self, xpath):
-        element = self._xmlTree.find(xpath, namespaces=nsmap)
+        element = self._find(xpath)
         if element is None:
             raise LookupError
 
+        self.emptyElement(element)
+
+    def appendElement(self, parent, element):
+        """Appends the element to the parent in the tree
+
+        Elements of the tree should be changed through CoreDB to be restored when a transaction is rolled back.
+        """
+        if self._undoLog is not None:
+            self._undoLog.inserted(element)
+
+        parent.append(element)
+        self._index.added(element)
+        self._revision += 1
+
+    def detachElement(self, element):
+        """Removes the element from the tree"""
+        if self._undoLog is not None:
+            self._undoLog.removed(element)
+
+        self._index.removing(element)
+        element.getparent().remove(element)
+        self._revision += 1
+
+    def emptyElement(self, element):
+        """Removes the children, the text and the attributes of the element"""
+        if self._undoLog is not None:
+            self._undoLog.cleared(element)
+
+        self._index.removing(element)
         element.clear()
+        self._index.added(element)
+        self._revision += 1
+
+    def setElementText(self, element, text):
+        if self._undoLog is not None:
+            self._undoLog.textChanged(element)
+
+        # Names are keys of some elements indexed
+        parent = element.getparent() if element.tag == f'{{{ns}}}name' else None
+        if parent is not None:
+            self._index.removing(parent)
+
+        element.text = text
+        self._revision += 1
+
+        if parent is not None:
+            self._index.added(parent)
+
+    def _setAttribute(self, element, name, value):
+        """Sets the attribute, or deletes it if the value is None"""
+        if self._undoLog is not None:
+            self._undoLog.attributeChanged(element, name)
+
+        if name in KEY_ATTRIBUTES:
+            self._index.removing(element)
+
+        if value is None:
+            element.attrib.pop(name, None)
+        else:
+            element.set(name, value)
+        self._revision += 1
+
+        if name in KEY_ATTRIBUTES:
+            self._index.added(element)
+
+    def _insert(self, parent, index, element):
+        if self._undoLog is not None:
+            self._undoLog.inserted(element)
+
+        parent.insert(index, element)
+        self._index.added(element)
+        self._revision += 1
 
     def getList(self, xpath) -> list[str]:
         return [e.text for e in self._xmlTree.findall(xpath, namespaces=nsmap)]
@@ -881,7 +1091,7 @@ class _CoreDB(object):
         Returns:
             True if xpath element exists, False otherwise.
         """
-        return self._xmlTree.find(xpath, namespaces=nsmap) is not None
+        return self._find(xpath) is not None
 
     def getVector(self, xpath: str):
         return [float(self.getValue(xpath + '/x')),
@@ -933,26 +1143,84 @@ class _CoreDB(object):
             tree = etree.ElementTree(root)
             self._xmlSchema.assertValid(tree)
             self._xmlTree = tree
+            self._index.rebuild(tree)
+            self._revision += 1
 
         self._configCountAtSave = self._configCount
 
     def loadDefault(self):
         self._xmlTree = etree.parse(resource.file(self.XML_PATH), self._xmlParser)
+        self._index.rebuild(self._xmlTree)
+        self._revision += 1
         # Add 'air' as default material
         # self.addMaterial('air', 'air')
 
         self._configCountAtSave = self._configCount
 
+    def frozenTree(self):
+        """Returns a copy of the tree and its index not to be changed
+
+        The copy is shared by the callers until the tree changes.
+
+        Raises:
+            RuntimeError: Called in "with" context, where changes are not committed yet
+        """
+        if self._inContext:
+            raise RuntimeError
+
+        if self._frozen is None or self._frozen[0] != self._revision:
+            tree = copy.deepcopy(self._xmlTree)
+            index = CoreDBIndex()
+            index.rebuild(tree)
+            self._frozen = (self._revision, tree, index)
+
+        return self._frozen[1], self._frozen[2]
+
     def getElement(self, xpath):
-        element = self._xmlTree.find(xpath, namespaces=nsmap)
+        element = self._find(xpath)
         if element is None:
             raise LookupError
 
         return element
 
     def getElements(self, xpath):
+        return self._findAll(xpath)
+
+    def _find(self, xpath):
+        if resolved := self._index.resolve(xpath):
+            element, rest = resolved
+            return element.find(rest, namespaces=nsmap) if element is not None and rest else element
+
+        return self._xmlTree.find(xpath, namespaces=nsmap)
+
+    def _findAll(self, xpath):
+        if resolved := self._index.resolve(xpath):
+            element, rest = resolved
+            if element is None:
+                return []
+
+            return element.findall(rest, namespaces=nsmap) if rest else [element]
+
         return self._xmlTree.findall(xpath, namespaces=nsmap)
 
+    def _schemaNode(self, element) -> Optional[_SchemaNode]:
+        path = _POSITION_PATTERN.sub('', self._xmlTree.getelementpath(element))
+        if path not in self._schemaNodes:
+            schema = self._schema.find('.//' + path, namespaces=nsmap)
+            self._schemaNodes[path] = None if schema is None else _SchemaNode(schema)
+
+        return self._schemaNodes[path]
+
+    def _assertValid(self):
+        """Validates the whole tree, or defers it to the end of the "with" context if in the context
+
+        Values set in the context are still checked against their types by validate().
+        """
+        if self._inContext:
+            self._validationPending = True
+        else:
+            self._xmlSchema.assertValid(self._xmlTree)
+
     def increaseConfigCount(self):
-        self._xmlSchema.assertValid(self._xmlTree)
+        self._assertValid()
         self._configCount += 1
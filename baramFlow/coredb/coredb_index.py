@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+from typing import Optional
+
+from baramFlow.coredb.libdb import ns
+
+
+def _tag(name):
+    return f'{{{ns}}}{name}'
+
+
+_NAME = _tag('name')
+_REGION = _tag('region')
+_REGIONS = _tag('regions')
+_BOUNDARY_CONDITION = _tag('boundaryCondition')
+_BOUNDARY_CONDITIONS = _tag('boundaryConditions')
+_CELL_ZONE = _tag('cellZone')
+_CELL_ZONES = _tag('cellZones')
+_MATERIAL = _tag('material')
+_MATERIALS = _tag('materials')
+_MONITORS = {_tag(t): t for t in ['forceMonitor', 'pointMonitor', 'surfaceMonitor', 'volumeMonitor']}
+
+_INDEXED_TAGS = [_REGION, _BOUNDARY_CONDITION, _CELL_ZONE, _MATERIAL, *_MONITORS]
+
+# Attributes used as keys. Changing them changes the keys of the element.
+KEY_ATTRIBUTES = {'bcid', 'czid', 'mid'}
+
+# XPaths made by the DB classes, such as BoundaryDB.getXPath(), for the elements indexed.
+# Each matches a path from the root to the element, and "rest" is the path after the element.
+_ROOT = r'(?:\.?/)?'
+_REGION_PATH = rf'(?:{_ROOT}regions/region|\.//(?:regions/)?region)\[name="(?P<rname>[^"]*)"\]'
+_PATH_PATTERNS = [
+    re.compile(rf'{_REGION_PATH}/boundaryConditions/boundaryCondition\[name="(?P<bcname>[^"]*)"\](?P<rest>.*)'),
+    re.compile(rf'{_REGION_PATH}(?P<rest>.*)'),
+    re.compile(rf'(?:{_ROOT}regions/region/|\.//(?:regions/region/)?)'
+               rf'boundaryConditions/boundaryCondition\[@bcid="(?P<bcid>[^"]*)"\](?P<rest>.*)'),
+    re.compile(rf'(?:{_ROOT}regions/region/|\.//(?:regions/region/)?)'
+               rf'cellZones/cellZone\[@czid="(?P<czid>[^"]*)"\](?P<rest>.*)'),
+    re.compile(rf'(?:{_ROOT}|\.//)materials/material\[@mid="(?P<mid>[^"]*)"\](?P<rest>.*)'),
+    re.compile(rf'(?:{_ROOT}|\.//)monitors/(?:forces|points|surfaces|volumes)/'
+               rf'(?P<monitorType>forceMonitor|pointMonitor|surfaceMonitor|volumeMonitor)'
+               rf'\[name="(?P<monitor>[^"]*)"\](?P<rest>.*)'),
+]
+
+
+class _IDMap(dict):
+    """Elements by ID, which also finds the lowest ID not in use"""
+    def __init__(self):
+        super().__init__()
+        self._maxID = 0
+
+    def add(self, id_, element):
+        self[id_] = element
+        if self._maxID is not None and id_.isdigit():
+            self._maxID = max(self._maxID, int(id_))
+
+    def discard(self, id_, element):
+        if self.get(id_) is element:
+            del self[id_]
+            self._maxID = None
+
+    def clear(self):
+        super().clear()
+        self._maxID = 0
+
+    def availableID(self, maxIndex) -> Optional[int]:
+        if self._maxID is None:
+            self._maxID = max((int(i) for i in self if i.isdigit()), default=0)
+
+        # IDs are usually in use from 1 without holes
+        if self._maxID == len(self) and self._maxID + 1 < maxIndex:
+            return self._maxID + 1
+
+        for index in range(1, maxIndex):
+            if str(index) not in self:
+                return index
+
+        return None
+
+
+class CoreDBIndex:
+    """Elements of regions, boundary conditions, cell zones, materials and monitors by their IDs and names
+
+    It is kept up to date by CoreDB as it changes the tree,
+    and resolves XPaths of the DB classes to the elements without scanning the tree.
+    """
+    def __init__(self):
+        self._regions = {}
+        self._boundaries = _IDMap()
+        self._boundariesByName = {}
+        self._cellZones = _IDMap()
+        self._materials = _IDMap()
+        self._monitors = {}
+
+    @property
+    def boundaries(self) -> _IDMap:
+        return self._boundaries
+
+    @property
+    def cellZones(self) -> _IDMap:
+        return self._cellZones
+
+    @property
+    def materials(self) -> _IDMap:
+        return self._materials
+
+    def region(self, rname):
+        return self._regions.get(rname)
+
+    def boundary(self, bcid):
+        return self._boundaries.get(str(bcid))
+
+    def boundaryByName(self, rname, bcname):
+        return self._boundariesByName.get((rname, bcname))
+
+    def cellZone(self, czid):
+        return self._cellZones.get(str(czid))
+
+    def material(self, mid):
+        return self._materials.get(str(mid))
+
+    def monitor(self, monitorType, name):
+        return self._monitors.get((monitorType, name))
+
+    def rebuild(self, tree):
+        self._regions = {}
+        self._boundaries.clear()
+        self._boundariesByName = {}
+        self._cellZones.clear()
+        self._materials.clear()
+        self._monitors = {}
+
+        if tree is not None:
+            self.added(tree.getroot())
+
+    def added(self, element):
+        """Index the element and its descendants, which have been put in the tree"""
+        for e in element.iter(*_INDEXED_TAGS):
+            if key := self._key(e):
+                kind, k = key
+                if kind is self._boundaries:
+                    self._boundaries.add(k, e)
+                    self._boundariesByName[(e.getparent().getparent().findtext(_NAME), e.findtext(_NAME))] = e
+                elif isinstance(kind, _IDMap):
+                    kind.add(k, e)
+                else:
+                    kind[k] = e
+
+    def removing(self, element):
+        """Remove the element and its descendants, which are about to be taken out of the tree, from the index"""
+        for e in element.iter(*_INDEXED_TAGS):
+            if key := self._key(e):
+                kind, k = key
+                if kind is self._boundaries:
+                    self._boundaries.discard(k, e)
+                    nameKey = (e.getparent().getparent().findtext(_NAME), e.findtext(_NAME))
+                    if self._boundariesByName.get(nameKey) is e:
+                        del self._boundariesByName[nameKey]
+                elif isinstance(kind, _IDMap):
+                    kind.discard(k, e)
+                elif kind.get(k) is e:
+                    del kind[k]
+
+    def resolve(self, xpath: str):
+        """Finds the element of the XPath made by the DB classes
+
+        Returns:
+            The element indexed, or None if it does not exist, and the path after the element.
+            None if the XPath is not one to be resolved with the index.
+        """
+        for pattern in _PATH_PATTERNS:
+            if m := pattern.fullmatch(xpath):
+                rest = m.group('rest')
+                if rest and (rest[0] != '/' or rest.startswith('//')):
+                    return None
+
+                groups = m.groupdict()
+                if groups.get('bcname') is not None:
+                    element = self._boundariesByName.get((groups['rname'], groups['bcname']))
+                elif groups.get('rname') is not None:
+                    element = self._regions.get(groups['rname'])
+                elif groups.get('bcid') is not None:
+                    element = self._boundaries.get(groups['bcid'])
+                elif groups.get('czid') is not None:
+                    element = self._cellZones.get(groups['czid'])
+                elif groups.get('mid') is not None:
+                    element = self._materials.get(groups['mid'])
+                else:
+                    element = self._monitors.get((groups['monitorType'], groups['monitor']))
+
+                return element, rest[1:]
+
+        return None
+
+    def _key(self, element):
+        parent = element.getparent()
+        if parent is None:
+            return None
+
+        tag = element.tag
+        kind = key = None
+        if tag == _REGION:
+            if parent.tag == _REGIONS:
+                kind, key = self._regions, element.findtext(_NAME)
+        elif tag == _BOUNDARY_CONDITION:
+            if parent.tag == _BOUNDARY_CONDITIONS:
+                kind, key = self._boundaries, element.get('bcid')
+        elif tag == _CELL_ZONE:
+            if parent.tag == _CELL_ZONES:
+                kind, key = self._cellZones, element.get('czid')
+        elif tag == _MATERIAL:
+            if parent.tag == _MATERIALS:
+                kind, key = self._materials, element.get('mid')
+        elif (name := element.findtext(_NAME)) is not None:
+            kind, key = self._monitors, (_MONITORS[tag], name)
+
+        return None if key is None else (kind, key)
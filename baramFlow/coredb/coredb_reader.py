@@ -1,12 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 from threading import Lock
 
 from PySide6.QtCore import QCoreApplication
 
 from baramFlow.coredb import coredb
 from baramFlow.coredb.coredb import ValueException, DBError, _CoreDB
+from baramFlow.coredb.libdb import nsmap
 from baramFlow.coredb.general_db import GeneralDB
 from baramFlow.coredb.initialization_db import InitializationDB
 from baramFlow.coredb.material_db import MaterialDB, UNIVERSAL_GAS_CONSTANT
@@ -135,6 +138,10 @@ class Region:
 
 class CoreDBReader(_CoreDB):
     def __new__(cls, *args, **kwargs):
+        # A snapshot is the reader in the context it is viewed
+        if isinstance(view := coredb.currentView(), CoreDBReader):
+            return view
+
         with _mutex:
             if not hasattr(cls, '_instance'):
                 cls._instance = super(CoreDBReader, cls).__new__(cls, *args, **kwargs)
@@ -151,16 +158,36 @@ class CoreDBReader(_CoreDB):
         super().__init__()
 
         self._xmlTree = coredb.CoreDB()._xmlTree
+        self._index = coredb.CoreDB()._index
         self._arguments = self.getBatchDefaults()
 
     def reloadCoreDB(self):
         self._xmlTree = coredb.CoreDB()._xmlTree
+        self._index = coredb.CoreDB()._index
 
     def setParameters(self, arguments=None):
         self._arguments = self.getBatchDefaults()
         if arguments:
             self._arguments.update(arguments)
 
+    def snapshot(self, arguments=None) -> CoreDBSnapshot:
+        """Returns an immutable view of the current configuration
+
+        The view has its own batch parameters, the current ones of the reader if "arguments" is None.
+        It should be taken in the main thread, and then can be read in any thread while the configuration changes.
+        Use it with coredb.viewing() to make CoreDB() and CoreDBReader() return it.
+        """
+        snapshot = object.__new__(CoreDBSnapshot)
+        vars(snapshot).update(vars(self))  # Shares the schemas, which take long to load
+        snapshot._xmlTree, snapshot._index = coredb.CoreDB().frozenTree()
+        if arguments is None:
+            snapshot._arguments = dict(self._arguments)
+        else:
+            snapshot._arguments = snapshot.getBatchDefaults()
+            snapshot._arguments.update(arguments)
+
+        return snapshot
+
     def getValue(self, xpath):
         value = super().getValue(xpath)
         if value == '' or value[0] != '$':
@@ -292,3 +319,22 @@ class CoreDBReader(_CoreDB):
 
     def getRegionProperties(self, rname):
         return Region(self, rname)
+
+
+class CoreDBSnapshot(CoreDBReader):
+    """Immutable view of the configuration made by CoreDBReader.snapshot()"""
+    def _readOnly(self, *args, **kwargs):
+        raise RuntimeError('CoreDB snapshot is read-only')
+
+    __enter__ = _readOnly
+    setParameters = _readOnly
+    appendElement = _readOnly
+    detachElement = _readOnly
+    emptyElement = _readOnly
+    setElementText = _readOnly
+    _setAttribute = _readOnly
+    _insert = _readOnly
+
+    def getRegions(self) -> list[str]:
+        # The name of the only region can be None, which CoreDB replaces with an empty string.
+        return [e.findtext('name', namespaces=nsmap) for e in self._xmlTree.iterfind('regions/region', nsmap)]
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import hashlib
 import shutil
 from enum import Enum
 from pathlib import Path
@@ -66,6 +67,16 @@ class FileDB:
                 else:
                     return None
 
+    def getFileHash(self, key):
+        """Returns the hash of the contents, which is kept with the contents when they are stored"""
+        if key:
+            with pd.HDFStore(self._tmpPath) as store:
+                if f'/{key}' in store.keys():
+                    # Contents stored before hashes were kept with them
+                    return getattr(store.get_storer(key).attrs, 'contentHash', None) or _contentHash(store.get(key))
+                else:
+                    return None
+
     def putText(self, key, data):
         with h5py.File(self._tmpPath, 'a') as f:
             if key in f.keys():
@@ -155,6 +166,7 @@ class FileDB:
             key = self._uniqKey(key, store.keys())
             store.put(key, df)
             store.get_storer(key).attrs.fileName = filePath.name
+            store.get_storer(key).attrs.contentHash = _contentHash(df)
 
         self._modifiedAfterSaved = True
 
@@ -166,3 +178,7 @@ class FileDB:
 
         coredb.CoreDB().save(filePath)
         self._modifiedAfterSaved = False
+
+
+def _contentHash(df: pd.DataFrame):
+    return hashlib.sha256(str(df.shape).encode() + pd.util.hash_pandas_object(df).to_numpy().tobytes()).hexdigest()
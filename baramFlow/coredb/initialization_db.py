@@ -36,31 +36,31 @@ class MaterialObserver(IMaterialObserver):
     def materialRemoving(self, db, mid: str):
         for volumeFraction in db.getElements(
                 f'{INITIALIZATION_XPATH}/initialValues/volumeFractions/volumeFraction[material="{mid}"]'):
-            volumeFraction.getparent().remove(volumeFraction)
+            db.detachElement(volumeFraction)
 
         for volumeFraction in db.getElements(
                 f'{INITIALIZATION_XPATH}/advanced/sections/section/volumeFractions/volumeFraction[material="{mid}"]'):
-            volumeFraction.getparent().remove(volumeFraction)
+            db.detachElement(volumeFraction)
 
     def specieAdded(self, db, mid: str, mixtureID):
         for mixture in db.getElements(f'{INITIALIZATION_XPATH}/initialValues/species/mixture[mid="{mixtureID}"]'):
-            mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                             f' <mid>{mid}</mid><value>0</value>'
-                                             '</specie>'))
+            db.appendElement(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                        f' <mid>{mid}</mid><value>0</value>'
+                                                        '</specie>'))
 
         for mixture in db.getElements(
                 f'{INITIALIZATION_XPATH}/advanced/sections/section/species/mixture[mid="{mixtureID}"]'):
-            mixture.append(xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
-                                             f' <mid>{mid}</mid><value>0</value>'
-                                             '</specie>'))
+            db.appendElement(mixture, xml.createElement('<specie xmlns="http://www.baramcfd.org/baram">'
+                                                        f' <mid>{mid}</mid><value>0</value>'
+                                                        '</specie>'))
 
     def specieRemoving(self, db, mid: str, primarySpecie: str):
         for specie in db.getElements(f'{INITIALIZATION_XPATH}/initialValues/species/mixture/specie[mid="{mid}"]'):
-            self._removeSpecieInComposition(primarySpecie, specie)
+            self._removeSpecieInComposition(db, primarySpecie, specie)
 
         for specie in db.getElements(
                 f'{INITIALIZATION_XPATH}/advanced/sections/section/species/mixture/specie[mid="{mid}"]'):
-            self._removeSpecieInComposition(primarySpecie, specie)
+            self._removeSpecieInComposition(db, primarySpecie, specie)
 
 
 class RegionMaterialObserver(IRegionMaterialObserver):
@@ -77,17 +77,17 @@ class RegionMaterialObserver(IRegionMaterialObserver):
 
         volumeFractions = xml.getElement(initialization, 'initialValues/volumeFractions')
         # volumeFractions.clear()
-        self._addVolumeFractions(volumeFractions, secondaries)
+        self._addVolumeFractions(db, volumeFractions, secondaries)
 
         initialSpecies = xml.getElement(initialization, 'initialValues/species')
-        initialSpecies.clear()
+        db.emptyElement(initialSpecies)
         if species:
-            initialSpecies.append(xml.createElement(initialValuesSpeciesXML))
+            db.appendElement(initialSpecies, xml.createElement(initialValuesSpeciesXML))
 
         for section in xml.getElements(initialization, 'advanced/sections/section'):
             volumeFractions = xml.getElement(section, 'volumeFractions')
             # volumeFractions.clear()
-            self._addVolumeFractions(volumeFractions, secondaries)
+            self._addVolumeFractions(db, volumeFractions, secondaries)
 
             if (not xml.getElements(section, '*[@disabled="false"]')
                     and not xml.getElements(section, 'userDefinedScalars/scalar/value[@disabled="false"]')):
@@ -103,16 +103,16 @@ class RegionMaterialObserver(IRegionMaterialObserver):
                             MaterialDB.getName(oldMaterial), xml.getText(section, 'name')))
 
             speciesElement = xml.getElement(section, 'species')
-            speciesElement.clear()
+            db.emptyElement(speciesElement)
             if species:
-                speciesElement.append(xml.createElement(sectionSpeicesXML))
+                db.appendElement(speciesElement, xml.createElement(sectionSpeicesXML))
 
-    def _addVolumeFractions(self, parent, mids: list[str]):
+    def _addVolumeFractions(self, db, parent, mids: list[str]):
         for mid in mids:
             if xml.getElement(parent, f'volumeFraction[material="{mid}"]') is None:
-                parent.append(xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
-                                                f'  <material>{mid}</material><fraction>0</fraction>'
-                                                '</volumeFraction>'))
+                db.appendElement(parent, xml.createElement('<volumeFraction xmlns="http://www.baramcfd.org/baram">'
+                                                           f'  <material>{mid}</material><fraction>0</fraction>'
+                                                           '</volumeFraction>'))
 
 
 class ScalarObserver(IUserDefinedScalarObserver):
@@ -123,14 +123,14 @@ class ScalarObserver(IUserDefinedScalarObserver):
                         </scalar>'''
 
         for scalars in db.getElements(f'{INITIALIZATION_XPATH}/initialValues/userDefinedScalars'):
-            scalars.append(xml.createElement(scalarXML))
+            db.appendElement(scalars, xml.createElement(scalarXML))
 
         for scalars in db.getElements(f'{INITIALIZATION_XPATH}/advanced/sections/section/userDefinedScalars'):
-            scalars.append(xml.createElement(scalarXML))
+            db.appendElement(scalars, xml.createElement(scalarXML))
 
     def scalarRemoving(self, db, scalarID):
         for scalars in db.getElements(f'{INITIALIZATION_XPATH}/initialValues/userDefinedScalars'):
-            xml.removeElement(scalars, f'scalar[scalarID="{scalarID}"]')
+            db.detachElement(xml.getElement(scalars, f'scalar[scalarID="{scalarID}"]'))
 
         for scalars in db.getElements(f'{INITIALIZATION_XPATH}/advanced/sections/section/userDefinedScalars'):
-            xml.removeElement(scalars, f'scalar[scalarID="{scalarID}"]')
+            db.detachElement(xml.getElement(scalars, f'scalar[scalarID="{scalarID}"]'))
@@ -39,9 +39,9 @@ class IMaterialObserver(QObject):
     def specieRemoving(self, db, mid: str, primarySpecie: str):
         pass
 
-    def _removeSpecieInComposition(self, primarySpecie, specieElement):
+    def _removeSpecieInComposition(self, db, primarySpecie, specieElement):
         mixture = specieElement.getparent()
-        mixture.remove(specieElement)
+        db.detachElement(specieElement)
 
         allZero = True
         for specie in xml.getElements(mixture, 'specie'):
@@ -49,13 +49,18 @@ class IMaterialObserver(QObject):
 
         if allZero:
             element = xml.getElement(mixture, f'specie[mid="{primarySpecie}"]')
-            xml.setText(element, 'value', '1')
+            db.setElementText(xml.getElement(element, 'value'), '1')
 
 
 def _rootElement():
     return coredb.CoreDB().getElement(MaterialDB.MATERIALS_XPATH)
 
 
+def _materialElement(db, mid):
+    elements = db.getElements(MaterialDB.getXPath(mid))
+    return elements[0] if elements else None
+
+
 def _newID(db):
     return db.availableID(MATERIAL_XPATH, 'mid')
 
@@ -163,7 +168,7 @@ class MaterialDB(object):
 
     @classmethod
     def getPrimarySpecie(cls, mid: str) -> str:
-        return xml.getText(_rootElement(), f'material[@mid="{mid}"]/mixture/primarySpecie')
+        return xml.getText(_materialElement(coredb.CoreDB(), mid), 'mixture/primarySpecie')
 
     @classmethod
     def getSpecies(cls, mid: str):
@@ -209,7 +214,7 @@ class MaterialDB(object):
     def addNonMixture(cls, db, base: str) -> str:
         mid = _newID(db)
         name = _newName(db, base)
-        _rootElement().append(MaterialSchema.newNonMixture(mid, name, base))
+        db.appendElement(_rootElement(), MaterialSchema.newNonMixture(mid, name, base))
         db.setValue(MaterialDB.getXPath(mid) + '/name', name)   # For increase configuCount of CoreDB
 
         return mid
@@ -220,12 +225,13 @@ class MaterialDB(object):
 
         mid = _newID(db)
         mixture = MaterialSchema.newMixture(mid,_newName(db, name), specieBases[0])
-        materials.append(mixture)
+        db.appendElement(materials, mixture)
 
         primary = None
         for base in specieBases:
             sid = _newID(db)
-            materials.append(
+            db.appendElement(
+                materials,
                 MaterialSchema.newSpecie(sid, _newName(db, base), base, MaterialSchema.defaultsToInherit(mixture), mid))
             if primary is None:
                 primary = sid
@@ -240,7 +246,8 @@ class MaterialDB(object):
         mid = _newID(db)
         name = _newName(db, base)
 
-        _rootElement().append(
+        db.appendElement(
+            _rootElement(),
             MaterialSchema.newSpecie(mid, name, base,
                                      MaterialSchema.defaultsToInherit(db.getElement(MaterialDB.getXPath(mixtureID))),
                                      mixtureID))
@@ -256,7 +263,7 @@ class MaterialDB(object):
     def removeMaterial(cls, db, mid: str):
         materials = _rootElement()
 
-        material = xml.getElement(materials, f'material[@mid="{mid}"]')
+        material = _materialElement(db, mid)
         materialType = MaterialType(xml.getText(material, 'type'))
         if material is None or materialType == MaterialType.SPECIE:
             raise LookupError
@@ -271,21 +278,21 @@ class MaterialDB(object):
 
         if materialType == MaterialType.MIXTURE:
             for sid in MaterialDB.getSpecies(mid):
-                xml.removeElement(materials, f'material[@mid="{sid}"]')
+                db.detachElement(_materialElement(db, sid))
 
-        materials.remove(material)
+        db.detachElement(material)
 
     @classmethod
     def removeSpecie(cls, db, mid: str):
         materials = _rootElement()
 
-        specie = xml.getElement(materials, f'material[@mid="{mid}"]')
+        specie = _materialElement(db, mid)
         if specie is None or xml.getText(specie, 'type') != 'specie':
             raise LookupError
 
         primarySpecie = None
         mixtureMid = xml.getText(specie, 'specie/mixture')
-        mixture = xml.getElement(materials, f'material[@mid="{mixtureMid}"]')
+        mixture = _materialElement(db, mixtureMid)
         if xml.getText(mixture, f'mixture/primarySpecie') == mid:
             species = xml.getElements(materials, f'material/specie[mixture="{mixtureMid}"]')
             mid1 = xml.getAttribute(species[0].getparent(), 'mid')
@@ -298,7 +305,7 @@ class MaterialDB(object):
         if primarySpecie is not None:
             db.setValue(MaterialDB.getXPath(mixtureMid) + 'mixture/primarySpecie', primarySpecie)
 
-        materials.remove(specie)
+        db.detachElement(specie)
 
 
 class TurbulenceModelObserver(ITurbulenceModelObserver):
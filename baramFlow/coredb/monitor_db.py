@@ -250,6 +250,6 @@ class MaterialObserver(IMaterialObserver):
 
         for field in referencingFields:
             monitor = field.getparent()
-            monitor.getparent().remove(monitor)
+            db.detachElement(monitor)
 
         return True
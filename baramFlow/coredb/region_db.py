@@ -71,65 +71,66 @@ class RegionDB:
             raise FileExistsError
 
         regions = db.getElement('/regions')
-        regions.append(xml.createElement('<region xmlns="http://www.baramcfd.org/baram">'
-                                         f' <name>{rname}</name>'
-                                         f' <material>{MaterialDB.getMaterials()[0][0]}</material>'
-                                         '  <secondaryMaterials/>'
-                                         '  <phaseInteractions>'
-                                         '      <surfaceTensions/>'
-                                         '      <massTransfers>'
-                                         '          <massTransfer>'
-                                         '              <from>0</from>'
-                                         '              <to>0</to>'
-                                         '              <mechanism>cavitation</mechanism>'
-                                         '              <cavitation>'
-                                         '                  <model>none</model>'
-                                         '                  <vaporizationPressure>2300</vaporizationPressure>'
-                                         '                  <schnerrSauer>'
-                                         '                      <evaporationCoefficient>1</evaporationCoefficient>'
-                                         '                      <condensationCoefficient>1</condensationCoefficient>'
-                                         '                      <bubbleDiameter>2.0e-06</bubbleDiameter>'
-                                         '                      <bubbleNumberDensity>1.6e+13</bubbleNumberDensity>'
-                                         '                  </schnerrSauer>'
-                                         '                  <kunz>'
-                                         '                      <evaporationCoefficient>1000</evaporationCoefficient>'
-                                         '                      <condensationCoefficient>1000</condensationCoefficient>'
-                                         '                      <meanFlowTimeScale>0.005</meanFlowTimeScale>'
-                                         '                      <freeStreamVelocity>20.0</freeStreamVelocity>'
-                                         '                  </kunz>'
-                                         '                  <merkle>'
-                                         '                      <evaporationCoefficient>1e-3</evaporationCoefficient>'
-                                         '                      <condensationCoefficient>80</condensationCoefficient>'
-                                         '                      <meanFlowTimeScale>0.005</meanFlowTimeScale>'
-                                         '                      <freeStreamVelocity>20.0</freeStreamVelocity>'
-                                         '                  </merkle>'
-                                         '                  <zwartGerberBelamri>'
-                                         '                      <evaporationCoefficient>1</evaporationCoefficient>'
-                                         '                      <condensationCoefficient>1</condensationCoefficient>'
-                                         '                      <bubbleDiameter>2e-6</bubbleDiameter>'
-                                         '                      <nucleationSiteVolumeFraction>1e-3</nucleationSiteVolumeFraction>'
-                                         '                  </zwartGerberBelamri>'
-                                         '              </cavitation>'
-                                         '          </massTransfer>'
-                                         '      </massTransfers>'
-                                         '  </phaseInteractions>'
-                                         '  <cellZones/>'
-                                         '  <boundaryConditions/>'
-                                         '  <initialization>'
-                                         '      <initialValues>'
-                                         '          <velocity><x>0</x><y>0</y><z>0</z></velocity>'
-                                         '          <pressure>0</pressure>'
-                                         '          <temperature>300</temperature>'
-                                         '          <scaleOfVelocity>1</scaleOfVelocity>'
-                                         '          <turbulentIntensity>1</turbulentIntensity>'
-                                         '          <turbulentViscosity>10</turbulentViscosity>'
-                                         '          <volumeFractions/>'
-                                         '          <userDefinedScalars/>'
-                                         '          <species/>'
-                                         '      </initialValues>'
-                                         '      <advanced><sections/></advanced>'
-                                         '  </initialization>'
-                                         '</region>'))
+        region = xml.createElement('<region xmlns="http://www.baramcfd.org/baram">'
+                                   f' <name>{rname}</name>'
+                                   f' <material>{MaterialDB.getMaterials()[0][0]}</material>'
+                                   '  <secondaryMaterials/>'
+                                   '  <phaseInteractions>'
+                                   '      <surfaceTensions/>'
+                                   '      <massTransfers>'
+                                   '          <massTransfer>'
+                                   '              <from>0</from>'
+                                   '              <to>0</to>'
+                                   '              <mechanism>cavitation</mechanism>'
+                                   '              <cavitation>'
+                                   '                  <model>none</model>'
+                                   '                  <vaporizationPressure>2300</vaporizationPressure>'
+                                   '                  <schnerrSauer>'
+                                   '                      <evaporationCoefficient>1</evaporationCoefficient>'
+                                   '                      <condensationCoefficient>1</condensationCoefficient>'
+                                   '                      <bubbleDiameter>2.0e-06</bubbleDiameter>'
+                                   '                      <bubbleNumberDensity>1.6e+13</bubbleNumberDensity>'
+                                   '                  </schnerrSauer>'
+                                   '                  <kunz>'
+                                   '                      <evaporationCoefficient>1000</evaporationCoefficient>'
+                                   '                      <condensationCoefficient>1000</condensationCoefficient>'
+                                   '                      <meanFlowTimeScale>0.005</meanFlowTimeScale>'
+                                   '                      <freeStreamVelocity>20.0</freeStreamVelocity>'
+                                   '                  </kunz>'
+                                   '                  <merkle>'
+                                   '                      <evaporationCoefficient>1e-3</evaporationCoefficient>'
+                                   '                      <condensationCoefficient>80</condensationCoefficient>'
+                                   '                      <meanFlowTimeScale>0.005</meanFlowTimeScale>'
+                                   '                      <freeStreamVelocity>20.0</freeStreamVelocity>'
+                                   '                  </merkle>'
+                                   '                  <zwartGerberBelamri>'
+                                   '                      <evaporationCoefficient>1</evaporationCoefficient>'
+                                   '                      <condensationCoefficient>1</condensationCoefficient>'
+                                   '                      <bubbleDiameter>2e-6</bubbleDiameter>'
+                                   '                      <nucleationSiteVolumeFraction>1e-3</nucleationSiteVolumeFraction>'
+                                   '                  </zwartGerberBelamri>'
+                                   '              </cavitation>'
+                                   '          </massTransfer>'
+                                   '      </massTransfers>'
+                                   '  </phaseInteractions>'
+                                   '  <cellZones/>'
+                                   '  <boundaryConditions/>'
+                                   '  <initialization>'
+                                   '      <initialValues>'
+                                   '          <velocity><x>0</x><y>0</y><z>0</z></velocity>'
+                                   '          <pressure>0</pressure>'
+                                   '          <temperature>300</temperature>'
+                                   '          <scaleOfVelocity>1</scaleOfVelocity>'
+                                   '          <turbulentIntensity>1</turbulentIntensity>'
+                                   '          <turbulentViscosity>10</turbulentViscosity>'
+                                   '          <volumeFractions/>'
+                                   '          <userDefinedScalars/>'
+                                   '          <species/>'
+                                   '      </initialValues>'
+                                   '      <advanced><sections/></advanced>'
+                                   '  </initialization>'
+                                   '</region>')
+        db.appendElement(regions, region)
 
         db.addCellZone(rname, CELL_ZONE_NAME_FOR_REGION)
 
@@ -145,9 +146,10 @@ class RegionDB:
     def updateMaterials(cls, rname, primary: str, secondaries: list[str]):
         def addSurfaceTension(parent, mid1, mid2):
             if xml.getElement(parent, f'surfaceTension[mid="{mid1}"][mid="{mid2}"]') is None:
-                parent.append(xml.createElement(f'<surfaceTension xmlns="http://www.baramcfd.org/baram">'
-                                                f'  <mid>{mid1}</mid><mid>{mid2}</mid><value>0</value>'
-                                                f'</surfaceTension>'))
+                db.appendElement(parent,
+                                 xml.createElement(f'<surfaceTension xmlns="http://www.baramcfd.org/baram">'
+                                                   f'  <mid>{mid1}</mid><mid>{mid2}</mid><value>0</value>'
+                                                   f'</surfaceTension>'))
 
         db = coredb.CoreDB()
 
@@ -172,7 +174,7 @@ class RegionDB:
 
         region = getRegionElement(rname)
         surfaceTensions = xml.getElement(region, 'phaseInteractions/surfaceTensions')
-        surfaceTensions.clear()
+        db.emptyElement(surfaceTensions)
         #
         # for i in range(len(secondaries)):
         #     addSurfaceTension(surfaceTensions, primary, secondaries[i])
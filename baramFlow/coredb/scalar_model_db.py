@@ -92,7 +92,8 @@ class UserDefinedScalarsDB:
         newID = db.availableID(USER_DEFINED_SCALAR_XPATH, 'scalarID')
 
         scalars = _rootElement()
-        scalars.append(
+        db.appendElement(
+            scalars,
             xml.createElement(
                 f'<scalar scalarID="{newID}" xmlns="http://www.baramcfd.org/baram">'
                 f'  <fieldName>{scalar.fieldName}</fieldName>'
@@ -124,7 +125,7 @@ class UserDefinedScalarsDB:
         for observer in cls._observers:
             observer.scalarRemoving(db, scalarID)
 
-        scalars.remove(scalar)
+        db.detachElement(scalar)
 
         db.increaseConfigCount()
 
@@ -135,7 +136,7 @@ class UserDefinedScalarsDB:
         scalars = _rootElement()
         for scalar in xml.getElements(scalars, 'scalar'):
             if xml.getAttribute(scalar, 'scalarID') != '0':
-                scalars.remove(scalar)
+                db.detachElement(scalar)
                 removed = True
 
         if removed:
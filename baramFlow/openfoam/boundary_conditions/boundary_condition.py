@@ -5,14 +5,15 @@ from enum import Enum, auto
 from math import sqrt
 import logging
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-
 from libbaram.math import calucateDirectionsByRotation
+from libbaram.openfoam.boundary_field import BoundaryFieldFile
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile, DataClass
+from libbaram.openfoam.foam_file import FoamDictFile
 
 from baramFlow.coredb.boundary_db import DirectionSpecificationMethod
 from baramFlow.coredb.coredb_reader import CoreDBReader
 from baramFlow.coredb.material_db import UNIVERSAL_GAS_CONSTANT, MaterialDB
+from baramFlow.coredb.project import Project
 from baramFlow.coredb.turbulence_model_db import TurbulenceModel
 from baramFlow.openfoam.constant.boundary_data import BoundaryData
 from baramFlow.openfoam.file_system import FileSystem
@@ -21,6 +22,11 @@ logger = logging.getLogger(__name__)
 # logger.setLevel(logging.INFO)
 
 
+class ProcessorFieldError(Exception):
+    """Raised when the field file of a processor cannot be updated in place"""
+    pass
+
+
 class BoundaryCondition(DictionaryFile):
     class TableType(Enum):
         POLYNOMIAL = auto()
@@ -46,9 +52,26 @@ class BoundaryCondition(DictionaryFile):
             self._fieldsData = None
             return self
 
-        path = self.fullPath(self._processorNo)
-        if path.is_file():
-            self._fieldsData = ParsedParameterFile(str(path), debug=None)
+        path = self.fullPath()
+        if fieldFile := BoundaryFieldFile.load(path):
+            # Patches of processors are all in their field files,
+            # and processor patches, which are not configured, are left as they are.
+            if self._processorNo is not None and not set(self._data['boundaryField']) <= set(fieldFile.patchNames()):
+                raise ProcessorFieldError(path)
+
+            # Only the patches are rewritten, not parsing internalField
+            for name, builded in self._data['boundaryField'].items():
+                if (builded['type'] == 'fixedValue' and fieldFile.get(name, 'type') == 'fixedValue'
+                        and not (fieldFile.get(name, 'value') or '').startswith('uniform')):
+                    builded['value'] = None
+
+                fieldFile.update(name, {k: v for k, v in builded.items() if v is not None})
+
+            self._fieldsData = fieldFile
+        elif self._processorNo is not None:
+            raise ProcessorFieldError(path)
+        elif path.is_file():
+            self._fieldsData = FoamDictFile(path)
 
             for name, builded in self._data['boundaryField'].items():
                 loaded = self._fieldsData.content['boundaryField'][name]
@@ -61,9 +84,13 @@ class BoundaryCondition(DictionaryFile):
 
     def fullPath(self, processorNo=None):
         # Boundary Conditions reside in Field Data Files
-        # Field Data Files are reconstructed, updated, and decomposed in sequence
-        # so that no need to handle the data under processors folders
-        timeDirPath = FileSystem.caseRoot() / self._header['location']
+        # Field Data Files of processors are updated in place if possible,
+        # otherwise they are reconstructed, updated, and decomposed in sequence
+        if processorNo is None:
+            processorNo = self._processorNo
+
+        processorDir = '' if processorNo is None else f'processor{processorNo}'
+        timeDirPath = FileSystem.caseRoot() / processorDir / self._header['location']
         boundaryFilePath = timeDirPath / self._header['object']
         boundaryFieldsPath = timeDirPath / 'boundaryFields' / self._header['object']
 
@@ -75,9 +102,16 @@ class BoundaryCondition(DictionaryFile):
         elif self._data:
             self._write(self._processorNo)
 
+    def writeContent(self, content: bytes):
+        # Patches are updated in the field file loaded, not writing the contents built
+        if self._fieldsData:
+            self._fieldsData.writeFile()
+        elif content:
+            super().writeContent(content)
+
     def _initialValueByTime(self):
-        path = self.fullPath(self._processorNo)
-        if self._time == '0' or not path.is_file():
+        path = self.fullPath()
+        if self._time == '0' or not BoundaryFieldFile.exists(path):
             return 'uniform', self._initialValue
         else:
             return None
@@ -150,8 +184,13 @@ class BoundaryCondition(DictionaryFile):
             'type': 'wedge'
         }
 
-    def _constructTimeVaryingMappedFixedValue(self, rname, bname, field, data):
-        points = BoundaryData.write(rname, bname, field, data)
+    def _constructTimeVaryingMappedFixedValue(self, rname, bname, field, key):
+        # boundaryData in the case root is shared by processors.
+        # It is written for the case, or by processor0 for decomposed cases, and the other processors only refer to it.
+        if self._processorNo is not None and self._processorNo > 0:
+            points = BoundaryData.pointsFileName(field)
+        else:
+            points = BoundaryData.write(rname, bname, field, Project.instance().fileDB(), key)
 
         return {
             'type': 'timeVaryingMappedFixedValue',
@@ -5,7 +5,6 @@ from baramFlow.coredb.boundary_db import BoundaryDB, BoundaryType, FlowRateInlet
 from baramFlow.coredb.boundary_db import TemperatureProfile, TemperatureTemporalDistribution, InterfaceMode
 from baramFlow.coredb.material_db import MaterialDB
 from baramFlow.coredb.models_db import ModelsDB
-from baramFlow.coredb.project import Project
 from baramFlow.openfoam.boundary_conditions.boundary_condition import BoundaryCondition
 
 
@@ -63,9 +62,7 @@ class T(BoundaryCondition):
                 }.get(type_)()
             elif profile == TemperatureProfile.SPATIAL_DISTRIBUTION.value:
                 field[name] = self._constructTimeVaryingMappedFixedValue(
-                    self._region.rname, name, 'T',
-                    Project.instance().fileDB().getFileContents(
-                        self._db.getValue(xpath + '/temperature/spatialDistribution')))
+                    self._region.rname, name, 'T', self._db.getValue(xpath + '/temperature/spatialDistribution'))
             elif profile == TemperatureProfile.TEMPORAL_DISTRIBUTION.value:
                 spec = self._db.getValue(xpath + '/temperature/temporalDistribution/specification')
                 if spec == TemperatureTemporalDistribution.PIECEWISE_LINEAR.value:
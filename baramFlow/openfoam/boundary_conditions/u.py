@@ -3,7 +3,6 @@
 
 from math import sqrt
 
-from baramFlow.coredb.project import Project
 from baramFlow.coredb.boundary_db import BoundaryDB, BoundaryType, VelocitySpecification, VelocityProfile
 from baramFlow.coredb.boundary_db import FlowRateInletSpecification, WallVelocityCondition, InterfaceMode
 from baramFlow.coredb.material_db import MaterialDB, UNIVERSAL_GAS_CONSTANT
@@ -153,8 +152,7 @@ class U(BoundaryCondition):
             elif profile == VelocityProfile.SPATIAL_DISTRIBUTION.value:
                 return self._constructTimeVaryingMappedFixedValue(
                     self._region.rname, name, 'U',
-                    Project.instance().fileDB().getFileContents(
-                        self._db.getValue(xpath + '/velocityInlet/velocity/component/spatialDistribution')))
+                    self._db.getValue(xpath + '/velocityInlet/velocity/component/spatialDistribution'))
             elif profile == VelocityProfile.TEMPORAL_DISTRIBUTION.value:
                 return self._constructUniformFixedValue(
                     xpath + '/velocityInlet/velocity/component/temporalDistribution/piecewiseLinear',
@@ -167,8 +165,7 @@ class U(BoundaryCondition):
             elif profile == VelocityProfile.SPATIAL_DISTRIBUTION.value:
                 return self._constructTimeVaryingMappedFixedValue(
                     self._region.rname, name, 'U',
-                    Project.instance().fileDB().getFileContents(
-                        self._db.getValue(xpath + '/velocityInlet/velocity/magnitudeNormal/spatialDistribution')))
+                    self._db.getValue(xpath + '/velocityInlet/velocity/magnitudeNormal/spatialDistribution'))
             elif profile == VelocityProfile.TEMPORAL_DISTRIBUTION.value:
                 return self._constructUniformNormalFixedValue(
                     xpath + '/velocityInlet/velocity/magnitudeNormal/temporalDistribution/piecewiseLinear',
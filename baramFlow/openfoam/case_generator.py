@@ -2,12 +2,16 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 from PySide6.QtCore import QCoreApplication, QObject, Signal
 
 from libbaram import utils
 from libbaram.exception import CanceledException
+from libbaram.openfoam.dictionary.generation_manifest import GenerationManifest
 from libbaram.run import RunUtility, RunParallelUtility
 
 from baramFlow.app import app
@@ -28,6 +32,7 @@ from baramFlow.openfoam.constant.transport_properties import TransportProperties
 from baramFlow.openfoam.constant.turbulence_properties import TurbulenceProperties
 from baramFlow.openfoam.boundary_conditions.alpha import Alpha
 from baramFlow.openfoam.boundary_conditions.alphat import Alphat
+from baramFlow.openfoam.boundary_conditions.boundary_condition import ProcessorFieldError
 from baramFlow.openfoam.boundary_conditions.epsilon import Epsilon
 from baramFlow.openfoam.boundary_conditions.k import K
 from baramFlow.openfoam.boundary_conditions.nut import Nut
@@ -53,17 +58,28 @@ logger = logging.getLogger(__name__)
 class CaseGenerator(QObject):
     progress = Signal(str)
 
-    def __init__(self):
+    def __init__(self, db: CoreDBReader = None):
+        """Generates the case from a snapshot of the configuration
+
+        Args:
+            db: Snapshot to generate the case from. A snapshot of the current configuration is taken if None.
+        """
         super().__init__()
-        self._db = CoreDBReader()
+        self._db = CoreDBReader().snapshot() if db is None else db
         self._errors = None
         self._cm = None
         self._canceled: bool = False
         self._files = None
+        self._processorFields = False
+        self._manifest = None
 
     def getErrors(self):
         return self._errors
 
+    def getChangedFiles(self):
+        """Returns the files written in the last generation, which have changed since the generation before"""
+        return self._manifest.changedFiles() if self._manifest else []
+
     def _gatherFiles(self):
         solver = findSolver()
         if errors := self._validate(solver):
@@ -92,9 +108,12 @@ class CaseGenerator(QObject):
             processorNo = 0
             while path := FileSystem.processorPath(processorNo):
                 self._files.append(Boundary(rname, processorNo))
+                if self._processorFields:
+                    self._gatherBoundaryConditionsFiles(region, path, processorNo)
                 processorNo += 1
 
-            self._gatherBoundaryConditionsFiles(region, FileSystem.caseRoot())
+            if not self._processorFields:
+                self._gatherBoundaryConditionsFiles(region, FileSystem.caseRoot())
 
             self._files.append(FvSchemes(rname))
             self._files.append(FvSolution(rname))
@@ -116,10 +135,49 @@ class CaseGenerator(QObject):
         return errors
 
     def _generateFiles(self):
+        """Builds and writes the files in a thread pool
+
+        Files of the same path are generated in the order they were gathered.
+        Others do not depend on each other and are generated in parallel.
+        Only the files that have changed are written if there is the manifest of the last generation.
+        """
+        chains = {}
         for file in self._files:
-            if self._canceled:
-                return
-            file.build().write()
+            chains.setdefault(file.fullPath(), []).append(file)
+
+        total = len(self._files)
+        done = 0
+        failed = False
+        lock = Lock()
+
+        def generateChain(files):
+            nonlocal done
+
+            for f in files:
+                if self._canceled or failed:
+                    return
+
+                f.build()
+                if self._manifest is None:
+                    f.write()
+                else:
+                    self._manifest.write(f)
+
+                with lock:
+                    done += 1
+                    count = done
+                self.progress.emit(self.tr('Generating Files... ({0}/{1})').format(count, total))
+
+        with ThreadPoolExecutor() as executor:
+            # Workers do not inherit the context, which has the view of CoreDB the files are generated from
+            futures = [executor.submit(contextvars.copy_context().run, generateChain, files)
+                       for files in chains.values()]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                failed = True  # Stops the others
+                raise
 
     def _validate(self, solver):
         if not GeneralDB.isTimeTransient():
@@ -182,6 +240,17 @@ class CaseGenerator(QObject):
         processorFolders = FileSystem.processorFolders()
         nProcessorFolders = len(processorFolders)
 
+        if nProcessorFolders > 1 and len(FileSystem.times()) > 0 and self._canUpdateProcessorFields(nProcessorFolders):
+            # Boundary conditions are updated in the field files of processors,
+            # which saves reconstructing and decomposing whole fields.
+            self._processorFields = True
+            try:
+                await self._generateCase()
+                return
+            except ProcessorFieldError as e:
+                logger.info(f'Fields of processors cannot be updated in place: {e}')
+                self._processorFields = False
+
         if nProcessorFolders > 0 and len(FileSystem.times()) > 0:
             self.progress.emit(self.tr(f'Reconstructing Field Data...'))
 
@@ -195,16 +264,7 @@ class CaseGenerator(QObject):
             if result != 0:
                 raise RuntimeError(self.tr('Reconstructing Field Data failed. 0'))
 
-        self.progress.emit(self.tr(f'Generating Files...'))
-
-        if errors := self._gatherFiles():
-            raise RuntimeError(errors)
-
-        errors = await asyncio.to_thread(self._generateFiles)
-        if self._canceled:
-            raise CanceledException
-        if errors:
-            raise RuntimeError(self.tr('Case generating fail. - ') + errors)
+        await self._generateCase()
 
         if nProcessorFolders > 1:
             self.progress.emit(self.tr('Decomposing Field Data...'))
@@ -228,6 +288,36 @@ class CaseGenerator(QObject):
             for time in FileSystem.times(parent=caseRoot):
                 utils.rmtree(caseRoot / time)
 
+    async def _generateCase(self):
+        self.progress.emit(self.tr(f'Generating Files...'))
+
+        # Files and the DB classes read the snapshot, even in the thread, while the configuration can be edited
+        with coredb.viewing(self._db):
+            if errors := self._gatherFiles():
+                raise RuntimeError(errors)
+
+            self._manifest = GenerationManifest(FileSystem.caseRoot())
+            try:
+                errors = await asyncio.to_thread(self._generateFiles)
+            finally:
+                self._manifest.save()
+                logger.info(self._manifest.report())
+
+        if self._canceled:
+            raise CanceledException
+        if errors:
+            raise RuntimeError(self.tr('Case generating fail. - ') + errors)
+
+    def _canUpdateProcessorFields(self, nProcessorFolders):
+        """Checks if the case is decomposed into uncollated processor folders at the same time"""
+        paths = [FileSystem.processorPath(i) for i in range(nProcessorFolders)]
+        if not all(paths):  # Collated, "processors<N>", or missing some
+            return False
+
+        latestTime = FileSystem.latestTime(paths[0])
+
+        return all(FileSystem.latestTime(path) == latestTime for path in paths)
+
     async def initialize(self):
         self._canceled = False
 
@@ -243,7 +333,7 @@ class CaseGenerator(QObject):
             self._cm.cancel()
 
     async def _initializeRegion(self, rname):
-        sectionNames: [str] = coredb.CoreDB().getList(
+        sectionNames: [str] = self._db.getList(
             f'.//regions/region[name="{rname}"]/initialization/advanced/sections/section/name')
         if len(sectionNames) > 0:
             self.progress.emit(self.tr('Setting Section Values'))
@@ -1,36 +1,45 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import os
+from libbaram.openfoam.foam_file import FoamFileWriter
 
 from baramFlow.openfoam.file_system import FileSystem
 
 
 class BoundaryData:
     @classmethod
-    def write(cls, rname, bname, field, data):
+    def pointsFileName(cls, field):
+        return f'points_{field}'
+
+    @classmethod
+    def write(cls, rname, bname, field, fileDB, key):
+        """Writes the points and values of the profile stored in FileDB with the key
+
+        The files are not written again if they have been written from the same contents.
+        """
         rpath = FileSystem.makeDir(FileSystem.constantPath(rname), 'boundaryData')
         pointsPath = FileSystem.makeDir(rpath, bname)
         fieldTablePath = FileSystem.makeDir(pointsPath, '0')
 
-        pointFileName = f'points_{field}'
-        pointsFile = os.path.join(pointsPath, pointFileName)
-        fieldTableFile = os.path.join(fieldTablePath, field)
-        with open(pointsFile, 'w') as points, open(fieldTableFile, 'w') as fieldTable:
-            rows = len(data)
-            points.write(f'{rows}\n(\n')
-            fieldTable.write(f'{rows}\n(\n')
-
-            if len(data.columns) == 6:
-                for row in data.itertuples(index=False):
-                    points.write(f'({row[0]} {row[1]} {row[2]})\n')
-                    fieldTable.write(f'({row[3]} {row[4]} {row[5]})\n')
-            else:
-                for row in data.itertuples(index=False):
-                    points.write(f'({row[0]} {row[1]} {row[2]})\n')
-                    fieldTable.write(f'{row[3]}\n')
-
-            points.write(f')')
-            fieldTable.write(f')')
+        pointFileName = cls.pointsFileName(field)
+        pointsFile = pointsPath / pointFileName
+        fieldTableFile = fieldTablePath / field
+        hashFile = pointsPath / f'.{field}.hash'
+
+        contentHash = fileDB.getFileHash(key)
+        if (pointsFile.is_file() and fieldTableFile.is_file() and hashFile.is_file()
+                and hashFile.read_text() == contentHash):
+            return pointFileName
+
+        hashFile.unlink(missing_ok=True)
+
+        # Columns are the coordinates of points followed by a vector or a scalar
+        data = fileDB.getFileContents(key)
+        values = data.iloc[:, 3:6] if len(data.columns) == 6 else data.iloc[:, 3]
+        with open(pointsFile, 'wb') as points, open(fieldTableFile, 'wb') as fieldTable:
+            FoamFileWriter(points).write(data.iloc[:, 0:3].to_numpy())
+            FoamFileWriter(fieldTable).write(values.to_numpy())
+
+        hashFile.write_text(contentHash)
 
         return pointFileName
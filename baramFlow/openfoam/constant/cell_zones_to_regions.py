@@ -1,9 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
+from libbaram.openfoam.foam_file import FoamDictFile
 
 from baramFlow.openfoam.file_system import FileSystem
 
@@ -13,7 +12,7 @@ class CellZonesToRegions(DictionaryFile):
         super().__init__(FileSystem.caseRoot(), self.constantLocation(), 'cellZonesToRegions')
 
     def loadCellZones(self):
-        return ParsedParameterFile(self.fullPath()).content['fluentCellZones']
+        return FoamDictFile(self.fullPath()).content['fluentCellZones']
 
     def setCellZoneRegions(self, cellZones, regions):
         self._data = {
@@ -1,10 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
-
 from libbaram.openfoam.constants import Directory
 from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
+from libbaram.openfoam.foam_file import FoamDictFile
 
 from baramFlow.coredb.coredb_reader import CoreDBReader
 from baramFlow.coredb.region_db import RegionDB
@@ -25,7 +24,7 @@ class RegionProperties(DictionaryFile):
         regionPropFile = path / Directory.REGION_PROPERTIES_FILE_NAME
 
         if regionPropFile.is_file():
-            regionsDict = ParsedParameterFile(regionPropFile).content['regions']
+            regionsDict = FoamDictFile(regionPropFile).content['regions']
             for i in range(1, len(regionsDict), 2):
                 for region in regionsDict[i]:
                     if not path.joinpath(region).is_dir():
@@ -51,7 +51,7 @@ class Boundary(DictionaryFile):
 
         self._db = CoreDBReader()
 
-        fullPath = self.fullPath(self._processorNo)
+        fullPath = self.fullPath()
 
         self._boundaryDict = PolyMeshLoader.loadBoundaryDict(fullPath, longListOutputThreshold=1)
         for bcname in self._boundaryDict.content:
@@ -89,9 +89,19 @@ class Boundary(DictionaryFile):
 
         return self
 
+    def fullPath(self, processorNo=None):
+        return super().fullPath(self._processorNo if processorNo is None else processorNo)
+
+    def serialize(self) -> bytes:
+        return str(self._boundaryDict).encode()
+
     def write(self):
         self._boundaryDict.writeFile()
 
+    def writeContent(self, content: bytes):
+        # Written in the format of the file loaded, which can be binary
+        self._boundaryDict.writeFile()
+
     def _generateMappedWall(self, bcname, xpath, cpid):
         self._removeEntry(bcname, 'transform')
         self._removeEntry(bcname, 'neighbourPatch')
@@ -6,13 +6,13 @@ import asyncio
 import re
 from pathlib import Path
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict
 from PySide6.QtCore import QObject, Signal
 from vtkmodules.vtkIOParallel import vtkPOpenFOAMReader
 from vtkmodules.vtkCommonDataModel import vtkCompositeDataSet
 from vtkmodules.vtkCommonCore import VTK_MULTIBLOCK_DATA_SET, VTK_UNSTRUCTURED_GRID, VTK_POLY_DATA, vtkCommand
 
 from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.foam_file import BoundaryDictFile
 
 from baramFlow.app import app
 from baramFlow.coredb import coredb
@@ -92,8 +92,8 @@ class PolyMeshLoader(QObject):
     progress = Signal(str)
 
     @classmethod
-    def loadBoundaryDict(cls, path, listLengthUnparsed=None, longListOutputThreshold=None):
-        return ParsedBoundaryDict(path, listLengthUnparsed=listLengthUnparsed, treatBinaryAsASCII=True, longListOutputThreshold=longListOutputThreshold)
+    def loadBoundaryDict(cls, path, longListOutputThreshold=None):
+        return BoundaryDictFile(path, longListOutputThreshold=longListOutputThreshold)
 
     async def loadMesh(self):
         self.progress.emit(self.tr("Loading Mesh..."))
@@ -223,43 +223,45 @@ class PolyMeshLoader(QObject):
                     for rname in boundaries):
             return False
 
-        UserDefinedScalarsDB.clearUserDefinedScalars(db)
-        db.clearRegions()
-        db.clearMonitors()
-
-        for rname in boundaries:
-            RegionDB.addRegion(rname)
-
-            # Initial value of "0" for pressure in density-based solvers causes trouble by making density zero
-            # because operating pressure is fixed to "0" for density-based solvers
-            if GeneralDB.isDensityBased():
-                pressurePath = f'.//regions/region[name="{rname}"]/initialization/initialValues/pressure'
-                db.setValue(pressurePath, '101325')
-
-            for bcname in vtkMesh[rname]['boundary']:
-                boundary = boundaries[rname][bcname]
-                geometricalType = GeometricalType(boundary['type'])
-                boundaryType = defaultBoundaryType(bcname, geometricalType)
-                boundary['bcid'] = str(db.addBoundaryCondition(rname, bcname, boundary['type'], boundaryType.value))
-
-                if boundaryType == BoundaryType.INTERFACE:
-                    coupledBoundary = None
-                    if geometricalType == GeometricalType.MAPPED_WALL and 'samplePatch' in boundary:
-                        sampleRegion, samplePatch = getSamplePatch(rname, bcname)
-                        if samplePatch and getSamplePatch(sampleRegion, samplePatch) == (rname, bcname):
-                            coupledBoundary = boundaries[sampleRegion][samplePatch]
-                    elif 'neighbourPatch' in boundary:
-                        neighbourPatch = getNeighbourPatch(rname, bcname)
-                        if neighbourPatch and getNeighbourPatch(rname, neighbourPatch) == bcname:
-                            coupledBoundary = boundaries[rname][neighbourPatch]
-
-                    if coupledBoundary and 'bcid' in coupledBoundary:
-                        db.setValue(BoundaryDB.getXPath(boundary['bcid']) + '/coupledBoundary', coupledBoundary['bcid'])
-                        db.setValue(BoundaryDB.getXPath(coupledBoundary['bcid']) + '/coupledBoundary', boundary['bcid'])
-
-            if 'zones' in vtkMesh[rname] and 'cellZones' in vtkMesh[rname]['zones']:
-                for czname in vtkMesh[rname]['zones']['cellZones']:
-                    db.addCellZone(rname, czname)
+        # Validated once at the end of the context, not for each of thousands of boundaries
+        with db:
+            UserDefinedScalarsDB.clearUserDefinedScalars(db)
+            db.clearRegions()
+            db.clearMonitors()
+
+            for rname in boundaries:
+                RegionDB.addRegion(rname)
+
+                # Initial value of "0" for pressure in density-based solvers causes trouble by making density zero
+                # because operating pressure is fixed to "0" for density-based solvers
+                if GeneralDB.isDensityBased():
+                    pressurePath = f'.//regions/region[name="{rname}"]/initialization/initialValues/pressure'
+                    db.setValue(pressurePath, '101325')
+
+                for bcname in vtkMesh[rname]['boundary']:
+                    boundary = boundaries[rname][bcname]
+                    geometricalType = GeometricalType(boundary['type'])
+                    boundaryType = defaultBoundaryType(bcname, geometricalType)
+                    boundary['bcid'] = str(db.addBoundaryCondition(rname, bcname, boundary['type'], boundaryType.value))
+
+                    if boundaryType == BoundaryType.INTERFACE:
+                        coupledBoundary = None
+                        if geometricalType == GeometricalType.MAPPED_WALL and 'samplePatch' in boundary:
+                            sampleRegion, samplePatch = getSamplePatch(rname, bcname)
+                            if samplePatch and getSamplePatch(sampleRegion, samplePatch) == (rname, bcname):
+                                coupledBoundary = boundaries[sampleRegion][samplePatch]
+                        elif 'neighbourPatch' in boundary:
+                            neighbourPatch = getNeighbourPatch(rname, bcname)
+                            if neighbourPatch and getNeighbourPatch(rname, neighbourPatch) == bcname:
+                                coupledBoundary = boundaries[rname][neighbourPatch]
+
+                        if coupledBoundary and 'bcid' in coupledBoundary:
+                            db.setValue(BoundaryDB.getXPath(boundary['bcid']) + '/coupledBoundary', coupledBoundary['bcid'])
+                            db.setValue(BoundaryDB.getXPath(coupledBoundary['bcid']) + '/coupledBoundary', boundary['bcid'])
+
+                if 'zones' in vtkMesh[rname] and 'cellZones' in vtkMesh[rname]['zones']:
+                    for czname in vtkMesh[rname]['zones']['cellZones']:
+                        db.addCellZone(rname, czname)
 
         return True
 
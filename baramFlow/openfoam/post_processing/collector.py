@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+
+from PySide6.QtCore import QObject, QThread, QTimer, QCoreApplication
+
+
+COLLECTING_INTERVAL = 500
+
+_mutex = Lock()
+
+
+class _CollectorWorker(QObject):
+    def __init__(self):
+        super().__init__()
+
+        self._sources = []
+        self._timer = None
+
+    def add(self, source):
+        if source not in self._sources:
+            self._sources.append(source)
+
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setInterval(COLLECTING_INTERVAL)
+            self._timer.timeout.connect(self._collect)
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def remove(self, source):
+        if source in self._sources:
+            self._sources.remove(source)
+
+        if not self._sources and self._timer is not None:
+            self._timer.stop()
+
+    def _collect(self):
+        # Sources can be removed while collecting
+        for source in list(self._sources):
+            if source in self._sources:
+                source.collect()
+
+
+class PostProcessingCollector(QObject):
+    """Single thread collecting the files solvers are writing, such as monitor outputs and solver information
+
+    A source is a QObject moved into the collector thread by "moveToCollector()",
+    which implements "collect()" to read the files it is interested in.
+    Sources call "add()" and "remove()" in their slots, that is, in the collector thread,
+    and "collect()" of all the sources added is called in turn on every tick.
+    So, the number of threads does not depend on the number of monitors.
+    """
+    def __new__(cls, *args, **kwargs):
+        with _mutex:
+            if not hasattr(cls, '_instance'):
+                cls._instance = super(PostProcessingCollector, cls).__new__(cls, *args, **kwargs)
+
+        return cls._instance
+
+    def __init__(self):
+        with _mutex:
+            if hasattr(self, '_initialized'):
+                return
+            else:
+                self._initialized = True
+
+        super().__init__()
+
+        self._thread = None
+        self._worker = None
+
+        if app := QCoreApplication.instance():
+            app.aboutToQuit.connect(self.quit)
+
+    def moveToCollector(self, source: QObject):
+        if self._thread is None:
+            self._thread = QThread()
+            self._worker = _CollectorWorker()
+            self._worker.moveToThread(self._thread)
+            self._thread.start()
+
+        source.moveToThread(self._thread)
+
+    def add(self, source):
+        """Start calling "collect()" of the source on every tick
+
+        Should be called in the collector thread
+        """
+        self._worker.add(source)
+
+    def remove(self, source):
+        """Stop calling "collect()" of the source
+
+        Should be called in the collector thread
+        """
+        self._worker.remove(source)
+
+    def quit(self):
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+            self._thread = None
+            self._worker = None
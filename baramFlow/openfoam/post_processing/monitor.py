@@ -1,10 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import time
-
 import pandas as pd
-from PySide6.QtCore import QThread, QObject, QTimer, Signal, Qt
+from PySide6.QtCore import QObject, Signal, Qt
 
 from baramFlow.case_manager import CaseManager
 from baramFlow.coredb import coredb
@@ -15,6 +13,7 @@ from baramFlow.coredb.run_calculation_db import RunCalculationDB
 from baramFlow.coredb.monitor_db import FieldHelper, Field
 from baramFlow.coredb.boundary_db import BoundaryDB
 from baramFlow.coredb.cell_zone_db import CellZoneDB
+from baramFlow.openfoam.post_processing.collector import PostProcessingCollector
 from baramFlow.openfoam.post_processing.post_file_reader import PostFileReader
 
 
@@ -46,51 +45,72 @@ class Worker(QObject):
         self._project = Project.instance()
         self._name = name
         self._reader = None
-        self._timer = None
+        self._waiting = False
+        self._monitoring = False
 
     def createReader(self, rname, fileName, extension):
         self._reader = PostFileReader(self._name, rname, fileName, extension)
 
     def startMonitor(self):
-        changedFiles = self._reader.chagedFiles()
-        while not changedFiles and CaseManager().isRunning():
-            time.sleep(0.5)
-            changedFiles = self._reader.chagedFiles()
+        if self._waiting or self._monitoring:
+            return
 
-        if changedFiles:
-            for path in changedFiles[1:]:
-                data = self._reader.readDataFrame(path)
-                self.dataUpdated.emit(data)
+        self._waiting = True
+        PostProcessingCollector().add(self)
+        self.collect()
+
+    def stopMonitor(self):
+        self._waiting = False
+        PostProcessingCollector().remove(self)
+
+        if self._monitoring:
+            self._monitoring = False
+            self._monitor()
+            self._reader.closeMonitor()
+            self.stopped.emit()
 
-            self._reader.openMonitor()
+    def collect(self):
+        if self._waiting:
+            self._waitFiles()
+        elif self._monitoring:
             self._monitor()
 
-            self.flushed.emit()
+    def _waitFiles(self):
+        changedFiles = self._reader.chagedFiles()
+        if not changedFiles:
+            if not CaseManager().isRunning():
+                self._waiting = False
+                PostProcessingCollector().remove(self)
 
-            if CaseManager().isRunning():
-                self._timer = QTimer()
-                self._timer.setInterval(500)
-                self._timer.timeout.connect(self._monitor)
-                self._timer.start()
-            else:
-                self._reader.closeMonitor()
+            return
 
-    def stopMonitor(self):
-        if self._timer:
-            self._timer.stop()
-            self._timer = None
-            self._monitor()
+        self._waiting = False
+
+        for path in changedFiles[1:]:
+            if (data := self._reader.readDataFrame(path)) is not None:
+                self.dataUpdated.emit(data)
+
+        self._reader.openMonitor()
+        self._monitor()
+
+        self.flushed.emit()
+
+        if CaseManager().isRunning():
+            self._monitoring = True
+        else:
             self._reader.closeMonitor()
-            self.stopped.emit()
+            PostProcessingCollector().remove(self)
 
     def _monitor(self):
         data = self._reader.readTailDataFrame()
         if data is not None:
             self.dataUpdated.emit(data)
 
+
 class Monitor(QObject):
     startWorker = Signal()
     stopWorker = Signal()
+    quitWorker = Signal()
     stopped = Signal(str)
 
     def __init__(self, name):
@@ -98,7 +118,6 @@ class Monitor(QObject):
 
         self._name = name
         self._rname = ''
-        self._thread = None
         self._worker = None
         self._showChart = True
 
@@ -117,36 +136,33 @@ class Monitor(QObject):
     def visibility(self):
         return self._showChart
 
-    def startThread(self):
-        self._thread = QThread()
+    def createWorker(self):
         self._worker = Worker(self.name)
-        self._worker.moveToThread(self._thread)
         self._worker.createReader(self._rname, self.fileName, self.extension)
+        PostProcessingCollector().moveToCollector(self._worker)
+
         self._worker.dataUpdated.connect(self._updateChart, type=Qt.ConnectionType.QueuedConnection)
         self._worker.stopped.connect(self._stopped, type=Qt.ConnectionType.QueuedConnection)
         self._worker.flushed.connect(self._fitChart, type=Qt.ConnectionType.QueuedConnection)
 
-        self._thread.started.connect(self._worker.startMonitor, type=Qt.ConnectionType.QueuedConnection)
-        self._thread.start()
-
         self.startWorker.connect(self._worker.startMonitor, type=Qt.ConnectionType.QueuedConnection)
         self.stopWorker.connect(self._worker.stopMonitor, type=Qt.ConnectionType.QueuedConnection)
+        # The worker should be out of the collector before it is released
+        self.quitWorker.connect(self._worker.stopMonitor, type=Qt.ConnectionType.BlockingQueuedConnection)
 
     def start(self):
-        if self._worker:
-            self.startWorker.emit()
-        else:
-            self.startThread()
+        if self._worker is None:
+            self.createWorker()
+
+        self.startWorker.emit()
 
     def stop(self):
         self.stopWorker.emit()
 
     def quit(self):
-        self.stop()
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait()
-            self._thread = None
+        if self._worker:
+            self.quitWorker.emit()
+            self._worker = None
 
     def _updateChart(self, data):
         pass
@@ -157,6 +173,7 @@ class Monitor(QObject):
     def _stopped(self):
         self.stopped.emit(self._name)
 
+
 class ForceMonitor(Monitor):
     def __init__(self, name, chart1, chart2, chart3):
         super().__init__(name)
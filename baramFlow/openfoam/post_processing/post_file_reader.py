@@ -1,35 +1,28 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from io import StringIO
-
 import pandas as pd
 from PySide6.QtCore import QObject
 
+from libbaram.file_watcher import FileWatcher
+from libbaram.openfoam.post_file_parser import PostFileTail, parsePostFile
+
 from baramFlow.openfoam.file_system import FileSystem
 
 
-def readPostFile(path) -> pd.DataFrame:
-    with path.open(mode='r') as f:
-        header = None
-        line = f.readline()
-        while line[0] == '#':
-            p = f.tell()
-            header = line
-            line = f.readline()
-
-        names = header[1:].split()  # read header
-        if names[0] != 'Time':
-            raise RuntimeError
+def _toDataFrame(data: dict) -> pd.DataFrame:
+    df = pd.DataFrame(data)
+    df.set_index('Time', inplace=True)
+
+    return df
 
-        if len(names) == 1:
-            names.append(path.stem)
 
-        f.seek(p)
-        df = pd.read_csv(f, sep=r'\s+', names=names, skiprows=0)
-        df.set_index('Time', inplace=True)
+def readPostFile(path) -> pd.DataFrame:
+    data = parsePostFile(path, path.stem)
+    if data is None or 'Time' not in data:
+        raise RuntimeError
 
-        return df
+    return _toDataFrame(data)
 
 
 class PostFileReader(QObject):
@@ -40,100 +33,57 @@ class PostFileReader(QObject):
         self._fileName = f'{fileName}{extension}'
         self._pattern = f'{fileName}_*{extension}'
         self._nameLen = len(fileName) + 1
-        self._files = {}
+        self._extLen = len(extension)
+        self._watcher = FileWatcher(self._path, [f'[0-9.]*/{self._fileName}', f'[0-9.]*/{self._pattern}'])
+        self._valueName = fileName
         self._currentFilePath = None
-        self._currentFile = None
-        self._header = None
-        self._newLine = ''
-        self._cols = None
+        self._tail = None
 
     def chagedFiles(self):
         self._currentFilePath = None
         changedFiles = []
 
-        dirs = sorted([(d.name, d) for d in self._path.glob('[0-9.]*') if d.name.count('.') < 2],
-                      key=lambda x: float(x[0]))
-        for dirTime, dirPath in dirs:
-            path = dirPath / self._fileName
-            if path.is_file() and self._updateFileInfo(path):
-                changedFiles.append(self._currentFilePath)
-                self._currentFilePath = path
-
-            files = [(f.stem[self._nameLen:], f) for f in dirPath.glob(self._pattern)]
-            for time, path in sorted(files, key=lambda x: int(x[0])):
-                if self._updateFileInfo(path):
-                    changedFiles.append(self._currentFilePath)
-                    self._currentFilePath = path
+        files = []
+        for path, _ in self._watcher.changedFiles():
+            try:
+                if path.name == self._fileName:
+                    files.append(((float(path.parent.name), -1), path))
+                else:
+                    time = path.name[self._nameLen:len(path.name) - self._extLen]
+                    files.append(((float(path.parent.name), float(time)), path))
+            except ValueError:  # Not a time directory or not a file written on restart
+                continue
+
+        for _, path in sorted(files, key=lambda x: x[0]):
+            changedFiles.append(self._currentFilePath)
+            self._currentFilePath = path
 
         return changedFiles
 
     def readDataFrame(self, path):
-        with path.open(mode='r') as f:
-            header = None
-            line = f.readline()
-            while line[0] == '#':
-                p = f.tell()
-                header = line
-                line = f.readline()
-
-            names = header[1:].split()  # read header
-            if names[0] != 'Time':
-                raise RuntimeError
-            if len(names) == 1:
-                names.append(self._currentFilePath.stem)
-
-            f.seek(p)
-            df = pd.read_csv(f, sep=r'\s+', names=names, skiprows=0)
-            df.set_index('Time', inplace=True)
-
-            return df
+        data = parsePostFile(path, self._valueName)
+        if data is None:
+            return None
+        if 'Time' not in data:
+            raise RuntimeError
 
-    def readTailDataFrame(self):
-        if tail := self._readUpdatedLines():
-            stream = StringIO(tail)
-            df = pd.read_csv(stream, sep=r'\s+', names=self._header)
-            stream.close()
-            df.set_index('Time', inplace=True)
+        return _toDataFrame(data)
 
-            return df
+    def readTailDataFrame(self):
+        if data := self._tail.read():
+            return _toDataFrame(data)
 
         return None
 
     def openMonitor(self):
         if self._currentFilePath:
-            self._currentFile = open(self._currentFilePath, 'r')
+            self._tail = PostFileTail(self._currentFilePath, self._valueName)
+            self._tail.open()
 
     def closeMonitor(self):
-        if self._currentFile:
-            self._currentFile.close()
-            self._currentFile = None
-            self._files[self._currentFilePath] = self._currentFilePath.stat().st_size
+        if self._tail:
+            self._tail.close()
+            # Lines not complete yet will be reported as changed
+            self._watcher.setSize(self._currentFilePath, self._tail.offset)
+            self._tail = None
             self._currentFilePath = None
-
-    def _updateFileInfo(self, path):
-        size = path.stat().st_size
-        if path not in self._files or size != self._files[path]:
-            self._files[path] = size
-            return True
-
-        return False
-
-    def _readUpdatedLines(self):
-        lines = self._newLine
-
-        line = self._currentFile.readline()
-        if line and line.endswith('\n'):     # complete at least one line including comments
-            while line.endswith('\n'):
-                lines += line
-                if lines[0] == '#':
-                    self._header = lines[1:].split()
-                    if len(self._header) == 1:
-                        self._header.append(self._currentFilePath.stem)
-                    lines = ''
-                line = self._currentFile.readline()
-
-            self._newLine = line    # Incomplete line is replaced by the new line
-            return lines
-
-        self._newLine += line       # New line is still incomplete.
-        return ''
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+INITIAL_CAPACITY = 1024
+
+
+@dataclass
+class TimeSeriesDelta:
+    """Rows appended to a TimeSeries
+
+    Rows of the target series at or after "times[0]" are obsoleted by this delta,
+    as the solver restarted from that time.
+    """
+    key: str
+    times: np.ndarray
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def start(self):
+        return float(self.times[0])
+
+
+class RangeExtrema:
+    """Segment trees of the minimum and the maximum of an array for range queries in O(log n)
+
+    Updating a range of "k" values costs O(k + log n), done level by level with vectorized operations.
+    NaN values are ignored.
+    """
+    def __init__(self, capacity, positive=False):
+        """
+        Args:
+            capacity: Size of the array
+            positive: Only positive values are considered, for log scale charts
+        """
+        self._positive = positive
+        self._mins = []
+        self._maxs = []
+
+        self._build(capacity)
+
+    def update(self, start: int, values: np.ndarray):
+        """Replace values from "start"
+
+        Args:
+            start: Index of the first value to replace
+            values: New values
+        """
+        end = start + len(values)
+        if end <= start:
+            return
+
+        if self._positive:
+            valid = values > 0
+        else:
+            valid = ~np.isnan(values)
+
+        self._mins[0][start:end] = np.where(valid, values, np.inf)
+        self._maxs[0][start:end] = np.where(valid, values, -np.inf)
+
+        for level in range(1, len(self._mins)):
+            start >>= 1
+            end = (end + 1) >> 1
+            np.minimum(self._mins[level-1][2*start:2*end:2], self._mins[level-1][2*start+1:2*end:2],
+                       out=self._mins[level][start:end])
+            np.maximum(self._maxs[level-1][2*start:2*end:2], self._maxs[level-1][2*start+1:2*end:2],
+                       out=self._maxs[level][start:end])
+
+    def reset(self, start: int, end: int):
+        """Forget values in the range, such as the ones truncated"""
+        self.update(start, np.full(end - start, np.nan))
+
+    def query(self, start: int, end: int) -> (float, float):
+        """Minimum and maximum of values in [start, end)
+
+        Returns:
+            (inf, -inf) if there is no value in the range
+        """
+        minValue = np.inf
+        maxValue = -np.inf
+        for mins, maxs in zip(self._mins, self._maxs):
+            if start >= end:
+                break
+
+            if start & 1:
+                minValue = min(minValue, mins[start])
+                maxValue = max(maxValue, maxs[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                minValue = min(minValue, mins[end])
+                maxValue = max(maxValue, maxs[end])
+
+            start >>= 1
+            end >>= 1
+
+        return float(minValue), float(maxValue)
+
+    def grow(self, capacity):
+        if capacity <= len(self._mins[0]):
+            return
+
+        mins = self._mins[0]
+        maxs = self._maxs[0]
+        self._build(capacity)
+        self._mins[0][:len(mins)] = mins
+        self._maxs[0][:len(maxs)] = maxs
+
+        for level in range(1, len(self._mins)):
+            np.minimum(self._mins[level-1][0::2], self._mins[level-1][1::2], out=self._mins[level])
+            np.maximum(self._maxs[level-1][0::2], self._maxs[level-1][1::2], out=self._maxs[level])
+
+    def _build(self, capacity):
+        size = 1
+        while size < capacity:
+            size *= 2
+
+        self._mins = []
+        self._maxs = []
+        while True:
+            self._mins.append(np.full(size, np.inf))
+            self._maxs.append(np.full(size, -np.inf))
+            if size == 1:
+                break
+            size //= 2
+
+
+class TimeSeries:
+    """Columnar, append-only series of values indexed by monotonically increasing time
+
+    Arrays are preallocated and grow by doubling, so appending costs amortized O(new rows).
+    Data is accessed through views, which are valid until the next append.
+    Range minimum and maximum of a column are indexed on the first query of the column,
+    and the index is maintained on appends.
+    """
+    def __init__(self, capacity=INITIAL_CAPACITY, positive=False):
+        """
+        Args:
+            capacity: Number of rows to preallocate
+            positive: Range extrema consider only positive values, for log scale charts
+        """
+        self._capacity = capacity
+        self._size = 0
+        self._times = np.empty(capacity, dtype=np.float64)
+        self._columns: dict[str, np.ndarray] = {}
+        self._positive = positive
+        self._extrema: dict[str, RangeExtrema] = {}
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns.keys())
+
+    def times(self) -> np.ndarray:
+        return self._times[:self._size]
+
+    def column(self, name) -> np.ndarray:
+        return self._columns[name][:self._size]
+
+    def firstTime(self):
+        return float(self._times[0]) if self._size else None
+
+    def lastTime(self):
+        return float(self._times[self._size - 1]) if self._size else None
+
+    def indexOf(self, time, side='left') -> int:
+        return int(np.searchsorted(self._times[:self._size], time, side=side))
+
+    def extrema(self, name, start=0, end=None) -> (float, float):
+        """Minimum and maximum of a column in rows [start, end), in O(log n)
+
+        Returns:
+            (inf, -inf) if there is no value in the range
+        """
+        if name not in self._extrema:
+            self._extrema[name] = RangeExtrema(self._capacity, self._positive)
+            self._extrema[name].update(0, self.column(name))
+
+        end = self._size if end is None else min(end, self._size)
+
+        return self._extrema[name].query(start, end)
+
+    def truncate(self, time):
+        """Drop rows at or after "time"
+
+        Args:
+            time: the time the solver restarted from
+        """
+        size = self.indexOf(time)
+        for extrema in self._extrema.values():
+            extrema.reset(size, self._size)
+
+        self._size = size
+
+    def append(self, times: np.ndarray, columns: dict[str, np.ndarray]) -> int:
+        """Append rows, replacing the rows obsoleted by them
+
+        Args:
+            times: time values of the new rows in increasing order
+            columns: values of the new rows by column name. Columns missing here are filled with NaN
+
+        Returns:
+            Index of the first row appended
+        """
+        count = len(times)
+        if count == 0:
+            return self._size
+
+        self.truncate(times[0])
+
+        start = self._size
+        end = start + count
+        if end > self._capacity:
+            self._grow(end)
+
+        self._times[start:end] = times
+        for name, values in columns.items():
+            if name not in self._columns:
+                self._columns[name] = self._newColumn()
+            self._columns[name][start:end] = values
+
+        for name, array in self._columns.items():
+            if name not in columns:
+                array[start:end] = np.nan
+
+        for name, extrema in self._extrema.items():
+            extrema.update(start, self._columns[name][start:end])
+
+        self._size = end
+
+        return start
+
+    def appendDelta(self, delta: TimeSeriesDelta) -> int:
+        return self.append(delta.times, delta.columns)
+
+    def delta(self, key, start=0) -> TimeSeriesDelta:
+        """Rows from "start" as a delta, copied so that they can be passed to other threads"""
+        return TimeSeriesDelta(key,
+                               self._times[start:self._size].copy(),
+                               {name: array[start:self._size].copy() for name, array in self._columns.items()})
+
+    def toDataFrame(self) -> pd.DataFrame:
+        df = pd.DataFrame({name: self.column(name) for name in self._columns}, index=self.times())
+        df.index.name = 'Time'
+        return df
+
+    def clear(self):
+        self._size = 0
+        self._columns = {}
+        self._extrema = {}
+
+    def _newColumn(self):
+        array = np.empty(self._capacity, dtype=np.float64)
+        array[:self._size] = np.nan
+        return array
+
+    def _grow(self, required):
+        capacity = self._capacity
+        while capacity < required:
+            capacity *= 2
+
+        self._times = self._resize(self._times, capacity)
+        for name in self._columns:
+            self._columns[name] = self._resize(self._columns[name], capacity)
+        for extrema in self._extrema.values():
+            extrema.grow(capacity)
+
+        self._capacity = capacity
+
+    def _resize(self, array, capacity):
+        resized = np.empty(capacity, dtype=array.dtype)
+        resized[:self._size] = array[:self._size]
+        return resized
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6.QtCore import QObject, Signal
 
@@ -9,7 +11,9 @@ from baramFlow.app import app
 from baramFlow.case_manager import BATCH_DIRECTORY_NAME
 from baramFlow.coredb.project import Project
 from libbaram import utils
+from libbaram.affinity import availableCores
 from libbaram.openfoam.constants import CASE_DIRECTORY_NAME
+from libbaram.openfoam.field_decomposer import FieldDecomposer
 from libbaram.run import RunUtility
 from libbaram.openfoam.dictionary.decomposePar_dict import DecomposeParDict
 
@@ -78,38 +82,31 @@ class RedistributionTask(QObject):
             if numCores > 1:
                 self.progress.emit(self.tr('Decomposing the case.'))
 
-                for caseRoot in caseFolders:
-                    if caseRoot == liveCaseFolder:
-                        decomposeParDict = DecomposeParDict(caseRoot, numCores).build()
-                        if len(regions) > 1:
-                            decomposeParDict.write()
-                        for rname in regions:
-                            decomposeParDict.setRegion(rname).write()
+                decomposeParDict = DecomposeParDict(liveCaseFolder, numCores).build()
+                if len(regions) > 1:
+                    decomposeParDict.write()
+                for rname in regions:
+                    decomposeParDict.setRegion(rname).write()
 
-                        args = ('-allRegions', '-time', '0:', '-case', caseRoot)
-                    else:
+                await self._runDecomposePar(liveCaseFolder, '-allRegions', '-time', '0:', '-case', liveCaseFolder)
+                self._removeTimes(liveCaseFolder)
+
+                # Batch cases share the decomposed mesh of the live case, and only their fields are decomposed
+                batchCases = caseFolders[1:]
+                if batchCases:
+                    for caseRoot in batchCases:
                         FileSystem.linkLivePolyMeshTo(liveCaseFolder, caseRoot, regions, processorOnly=True)
 
-                        args = ('-allRegions', '-fields', '-time', '0:', '-case', caseRoot)
+                    with ThreadPoolExecutor() as executor:
+                        decomposer = await asyncio.to_thread(FieldDecomposer, liveCaseFolder, regions, executor)
+                        processes = asyncio.Semaphore(sum(len(cores) for cores in availableCores()))
+                        results = await asyncio.gather(
+                            *[self._decomposeFields(caseRoot, decomposer, processes) for caseRoot in batchCases],
+                            return_exceptions=True)
 
-                    console = app.window.dockView.consoleView()
-                    cm = RunUtility('decomposePar', *args, cwd=caseRoot)
-                    cm.output.connect(console.append)
-                    cm.errorOutput.connect(console.append)
-
-                    app.window.dockView.showConsoleDock()
-                    await cm.start()
-                    result = await cm.wait()
-                    if result != 0:
-                        raise RuntimeError(self.tr('Decomposition failed.'))
-
-                    # Delete time folders in case root
-                    #
-                    # Do NOT delete the polyMesh in case root
-                    # It was decided to be kept
-                    #
-                    for time in FileSystem.times(caseRoot):
-                        utils.rmtree(caseRoot / time)
+                    for result in results:
+                        if isinstance(result, Exception):
+                            raise result
 
                 self.progress.emit(self.tr(f'Decomposition done.'))
 
@@ -121,6 +118,38 @@ class RedistributionTask(QObject):
             logger.info(ex, exc_info=True)
             raise
 
+    async def _decomposeFields(self, caseRoot, decomposer: FieldDecomposer, processes: asyncio.Semaphore):
+        """Splits the fields of the case in Python, or by decomposePar if they are not simple enough"""
+        if not await asyncio.to_thread(decomposer.decompose, caseRoot):
+            async with processes:
+                await self._runDecomposePar(caseRoot, '-allRegions', '-fields', '-time', '0:', '-case', caseRoot)
+
+        self._removeTimes(caseRoot)
+
+    async def _runDecomposePar(self, caseRoot, *args):
+        console = app.window.dockView.consoleView()
+        cm = RunUtility('decomposePar', *args, cwd=caseRoot)
+        cm.output.connect(console.append)
+        cm.errorOutput.connect(console.append)
+
+        app.window.dockView.showConsoleDock()
+        await cm.start()
+        result = await cm.wait()
+        if result != 0:
+            raise RuntimeError(self.tr('Decomposition failed.'))
+
+    def _removeTimes(self, caseRoot):
+        # Delete time folders in case root
+        #
+        # Do NOT delete the polyMesh in case root
+        # It was decided to be kept
+        #
+        for time in FileSystem.times(caseRoot):
+            utils.rmtree(caseRoot / time)
+
     def _reportTimeProgress(self, msg):
-        if msg.startswith('Time = '):
-            self.progress.emit(self.tr(f'Reconstructing the case. {self._caseName} ({msg.strip()}/{self._latestTime})'))
+        # Output comes in batches of lines. The last time in the batch is reported
+        for line in reversed(msg.splitlines()):
+            if line.startswith('Time = '):
+                self.progress.emit(self.tr(f'Reconstructing the case. {self._caseName} ({line.strip()}/{self._latestTime})'))
+                break
@@ -1,19 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import glob
 import re
-from typing import TextIO, Optional
-from io import StringIO
+from typing import Optional
 from pathlib import Path
 from dataclasses import dataclass
 import logging
 
 import numpy as np
-import pandas as pd
-from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal
+from PySide6.QtCore import Qt, QObject, Signal
+
+from libbaram.file_watcher import FileWatcher
+from libbaram.openfoam.post_file_parser import PostFileTail
 
 from baramFlow.case_manager import CaseManager
+from baramFlow.openfoam.post_processing.collector import PostProcessingCollector
+from baramFlow.openfoam.post_processing.time_series import TimeSeries, TimeSeriesDelta
 
 
 # "solverInfo.dat" sample
@@ -30,6 +32,10 @@ from baramFlow.case_manager import CaseManager
 mrRegexPattern = r'(?P<rname>[^/\\]+)[/\\]solverInfo_\d+[/\\](?P<time>[0-9]+(?:\.[0-9]+)?)[/\\]solverInfo(?:_(?P<dup>[0-9]+(?:\.[0-9]+)?))?\.dat'
 srRegexPattern = r'[/\\]solverInfo_\d+[/\\](?P<time>[0-9]+(?:\.[0-9]+)?)[/\\]solverInfo(?:_(?P<dup>[0-9]+(?:\.[0-9]+)?))?\.dat'
 
+# Relative to "postProcessing" directory
+mrGlobPattern = '*/solverInfo_*/*/solverInfo*.dat'
+srGlobPattern = 'solverInfo_*/*/solverInfo*.dat'
+
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -42,88 +48,33 @@ class _SolverInfo:
     dup: str
     size: int
     path: Path
-    f: Optional[TextIO]
-
-
-def readCompleteLineOnly(f):
-    line = f.readline()
-    if line.endswith('\n'):
-        if hasattr(f, 'incompleteLine'):
-            line = f.incompleteLine + line
-            f.incompleteLine = ''
-        return line
-    else:
-        if hasattr(f, 'incompleteLine'):
-            f.incompleteLine += line
-        else:
-            f.incompleteLine = line
-        return ''
-
-
-def readOutFile(f: TextIO):
-    lines = ''
-
-    while line := readCompleteLineOnly(f):
-        if not hasattr(f, 'residualHeader'):  # Initial State
-            if not line.startswith('# Solver information'):
-                raise RuntimeError
-            f.residualHeader = None
-        elif not f.residualHeader:  # Waiting residual header
-            names = line.split()
-            names.pop(0)  # remove '#' from the list
-            if names[0] != 'Time':
-                raise RuntimeError
-            f.residualHeader = names
-        else:  # Parse residuals
-            lines += line
-
-    if hasattr(f, 'residualHeader'):
-        return lines, f.residualHeader
-    else:
-        return lines, None
-
-
-def mergeDataFrames(data: [pd.DataFrame]):
-    merged = None
-    for df in data:
-        if merged is None:
-            merged = df
-        else:
-            left_on = {'Time', *(merged.columns.values.tolist())}
-            right_on = {'Time', *(df.columns.values.tolist())}
-            on = list(left_on.intersection(right_on))
-            merged = pd.merge(merged, df, how='outer', on=on)
+    tail: Optional[PostFileTail]
 
-    return merged
 
-
-def updateData(target, source):
-    if target is None:
-        return source
-    else:
-        # Drop obsoleted rows.
-        # Dataframes should be kept PER REGION because of this dropping.
-        # If dataframes of regions are merged, updated data in other regions can be lost.
-        time = source.first_valid_index()
-        filtered = target[target.index < time]
-        return mergeDataFrames([filtered, source])
+def _isResidualColumn(name: str):
+    return name == 'Time' or name.endswith('_initial')
 
 
 class Worker(QObject):
     start = Signal()
     stop = Signal()
     updateResiduals = Signal()
-    residualsUpdated = Signal(pd.DataFrame)
+    residualsUpdated = Signal(list)
     flushed = Signal()
 
     def __init__(self, casePath: Path, regions: [str]):
         super().__init__()
 
-        self.mrGlobPattern = casePath / 'postProcessing' / '*' / 'solverInfo_*' / '*' / 'solverInfo*.dat'
-        self.srGlobPattern = casePath / 'postProcessing' / 'solverInfo_*' / '*' / 'solverInfo*.dat'
-
         self.regions = regions
 
+        if len(self.regions) > 1:
+            self.watcher = FileWatcher(casePath / 'postProcessing', [mrGlobPattern])
+        else:
+            self.watcher = FileWatcher(casePath / 'postProcessing', [srGlobPattern])
+
+        # Directories having info files created by restart, which obsolete "solverInfo.dat" in them
+        self.newerFiles = set()
+
         self.changingFiles = None
         self.data = None
 
@@ -131,31 +82,30 @@ class Worker(QObject):
 
         self.infoFiles = None
 
-        self.timer = None
+        self.collecting = False
         self.running = False
 
         self.start.connect(self.startRun, type=Qt.ConnectionType.QueuedConnection)
-        self.stop.connect(self.stopRun, type=Qt.ConnectionType.QueuedConnection)
+        # The worker should be out of the collector before it is released
+        self.stop.connect(self.stopRun, type=Qt.ConnectionType.BlockingQueuedConnection)
 
     def startRun(self):
-        if self.running:
+        if self.collecting:
             return
 
+        self.collecting = True
         self.running = CaseManager().isRunning()
 
         self.collectionReady = False
 
         self.changingFiles = {r: None for r in self.regions}
-        self.data = {r: None for r in self.regions}
+        self.data = {r: TimeSeries() for r in self.regions}
 
         if self.running:
             # Get current snapshot of info files
             self.infoFiles = self.getInfoFiles()
 
-            self.timer = QTimer()
-            self.timer.setInterval(500)
-            self.timer.timeout.connect(self.process)
-            self.timer.start()
+            PostProcessingCollector().add(self)
         else:
             self.infoFiles = {}
             self.process()
@@ -163,19 +113,27 @@ class Worker(QObject):
             self.flushed.emit()
 
     def stopRun(self):
+        if not self.collecting:
+            return
+
         if self.running:
-            self.timer.stop()
+            PostProcessingCollector().remove(self)
 
         self.process()
 
         for s in self.changingFiles.values():
-            if s is not None:  # "s" could remain "None" if the solver stops by error as soon as it starts
-                s.f.close()
-        QThread.currentThread().quit()
+            # "s" could remain "None" if the solver stops by error as soon as it starts
+            if s is not None and s.tail is not None:
+                s.tail.close()
+        self.watcher.close()
         self.running = False
+        self.collecting = False
+
+    def collect(self):
+        self.process()
 
     def process(self):
-        updatedFiles = self.getUpdatedFiles(self.infoFiles)
+        updatedFiles = self.getInfoFiles()
         for p, s in updatedFiles.items():
             if p in self.infoFiles:
                 self.infoFiles[p].size = s.size
@@ -191,170 +149,152 @@ class Worker(QObject):
                 return
             else:  # Now, Ready to collect
                 self.collectionReady = True
-                hasUpdate = False
                 for s in self.infoFiles.values():
                     if s not in self.changingFiles.values():  # not-changing files
-                        df = self._getDataFrame(s.rname, s.path)
-                        if df is not None:
-                            self.data[s.rname] = updateData(self.data[s.rname], df)
+                        self._readFile(s.rname, s.path)
 
                 for s in self.changingFiles.values():
-                    s.f = open(s.path, 'r')
-                    updated, df = self._updateDataFromFile(self.data[s.rname], s.rname, s.f)
-                    if updated:
-                        self.data[s.rname] = updateData(self.data[s.rname], df)
-                        hasUpdate = True
+                    s.tail = PostFileTail(s.path)
+                    self._updateDataFromFile(s.rname, s.tail, s.size)
 
-                if hasUpdate:
-                    self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
+                # Emit whole history once per region instead of the pieces read from each file
+                deltas = [series.delta(rname) for rname, series in self.data.items() if len(series) > 0]
+                if deltas:
+                    self.residualsUpdated.emit(deltas)
 
                 return
 
         # regular update routine
-        hasUpdate = False
+        deltas = []
         for s in updatedFiles.values():
-            updated, df = self._updateDataFromFile(self.data[s.rname], s.rname, self.infoFiles[s.path].f)
-            if updated:
-                self.data[s.rname] = df
-                hasUpdate = True
-
-        if hasUpdate:
-            self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
-
-    def getUpdatedFiles(self, current: {Path: _SolverInfo}) -> {Path: _SolverInfo}:
-        infoFiles = self.getInfoFiles()
+            if delta := self._updateDataFromFile(s.rname, self.infoFiles[s.path].tail, s.size):
+                deltas.append(delta)
 
-        updatedFiles = {}
+        if deltas:
+            self.residualsUpdated.emit(deltas)
 
-        for p, s in infoFiles.items():
-            if (p not in current) or (s.size != current[p].size):
-                updatedFiles[p] = s
-
-        return updatedFiles
-
-    def _getInfoFilesMultiRegion(self) -> {Path: _SolverInfo}:
-        mrFiles = [((p := Path(pstr)), p.stat().st_size) for pstr in glob.glob(str(self.mrGlobPattern))]
+    def _getInfoFilesMultiRegion(self, files: [(Path, int)]) -> {Path: _SolverInfo}:
         infoFiles = {}
-        for path, size in mrFiles:
+        for path, size in files:
             m = re.search(mrRegexPattern, str(path))
-            if m.group('rname') not in self.regions:
+            if m is None or m.group('rname') not in self.regions:
                 continue
             infoFiles[path] = _SolverInfo(m.group('rname'), float(m.group('time')), m.group('dup'), size, path, None)
         return infoFiles
 
-    def _getInfoFilesSingleRegion(self) -> {Path: _SolverInfo}:
-        srFiles = [((p := Path(pstr)), p.stat().st_size) for pstr in glob.glob(str(self.srGlobPattern))]
+    def _getInfoFilesSingleRegion(self, files: [(Path, int)]) -> {Path: _SolverInfo}:
         infoFiles = {}
-        for path, size in srFiles:
+        for path, size in files:
             m = re.search(srRegexPattern, str(path))
+            if m is None:
+                continue
             infoFiles[path] = _SolverInfo('', float(m.group('time')), m.group('dup'), size, path, None)
         return infoFiles
 
     def getInfoFiles(self) -> {Path: _SolverInfo}:
+        """Info files created or grown since the last call
+
+        All the info files are returned on the first call.
+        """
+        files = self.watcher.changedFiles()
+        if not files:
+            return {}
+
         if len(self.regions) > 1:
-            infoFiles = self._getInfoFilesMultiRegion()
+            infoFiles = self._getInfoFilesMultiRegion(files)
         else:
-            infoFiles = self._getInfoFilesSingleRegion()
+            infoFiles = self._getInfoFilesSingleRegion(files)
 
         # Drop obsoleted info file, which has newer info file in the same directory
-        newerFiles = [p.parent for p, s in infoFiles.items() if s.dup is not None]
-        infoFiles = {p: s for p, s in infoFiles.items() if s.dup is not None or s.path.parent not in newerFiles}
+        self.newerFiles.update(s.path.parent for s in infoFiles.values() if s.dup is not None)
+        infoFiles = {p: s for p, s in infoFiles.items() if s.dup is not None or s.path.parent not in self.newerFiles}
 
         infoFiles = dict(sorted(infoFiles.items(), key=lambda x: (x[1].rname, x[1].time)))
 
         return infoFiles
 
     def update(self):
-        self.residualsUpdated.emit(mergeDataFrames(self.data.values()))
-
-    def _updateDataFromFile(self, target: pd.DataFrame, rname: str, f: TextIO) -> (bool, pd.DataFrame):
-        lines, names = readOutFile(f)
-        if not lines:
-            return False, target
+        self.residualsUpdated.emit([series.delta(rname) for rname, series in self.data.items() if len(series) > 0])
 
-        names, columns = self._getResidualHeader(names, rname)
+    def _updateDataFromFile(self, rname: str, tail: PostFileTail, size: int = None) -> Optional[TimeSeriesDelta]:
+        """Read lines appended to the info file
 
-        stream = StringIO(lines)
-        df = pd.read_csv(stream, sep=r'\s+', names=names, dtype={'Time': np.float64})[columns]
-        stream.close()
+        Args:
+            rname: Region name
+            tail: Reader of the info file
+            size: Size of the file to read up to. Lines written after the size is reported are read next time
+        """
+        if tail is None:    # Info file written before the collection started, which is read as a whole
+            return None
 
-        df.set_index('Time', inplace=True)
+        data = tail.read(size, _isResidualColumn)
+        if data is None:
+            return None
 
-        return True, updateData(target, df)
+        if tail.header[0] != 'Time':
+            raise RuntimeError
 
-    def _getDataFrame(self, rname, path) -> Optional[pd.DataFrame]:
-        with path.open(mode='r') as f:
-            f.readline()  # skip '# Solver information' comment
-            names = f.readline().split()  # read header
-            if len(names) == 0:
-                return None
+        return self._appendData(rname, data)
 
-            names.pop(0)  # remove '#' from the list
-            if names[0] != 'Time':
-                raise RuntimeError
+    def _readFile(self, rname, path) -> Optional[TimeSeriesDelta]:
+        tail = PostFileTail(path)
+        try:
+            return self._updateDataFromFile(rname, tail)
+        finally:
+            tail.close()
 
-            names, columns = self._getResidualHeader(names, rname)
+    def _appendData(self, rname, data: {str: np.ndarray}) -> TimeSeriesDelta:
+        """Append rows to the series of the region
 
-            df = pd.read_csv(f, sep=r'\s+', names=names, dtype={'Time': np.float64}, skiprows=0)[columns]
-            df.set_index('Time', inplace=True)
-            return df
+        Rows at or after the first time of the new rows are dropped by the series,
+        because the solver has restarted from that time.
+        Series should be kept PER REGION because of this dropping.
+        If they are merged, updated data in other regions can be lost.
+        """
+        prefix = '' if rname == '' else rname + ':'
+        times = data.pop('Time')
+        residuals = {prefix + name[:-len('_initial')]: values for name, values in data.items()}
+        delta = TimeSeriesDelta(rname, times, residuals)
+        self.data[rname].appendDelta(delta)
 
-    def _getResidualHeader(self, names: [str], rname: str):
-        header = names.copy()
-        columns = [names[0]]     # Time
-        for i in range(1, len(names)):
-            if names[i].endswith('_initial'):
-                header[i] = names[i][:-8]
-                columns.append(header[i])
-
-        if rname != '':
-            header = [k if k == 'Time' else rname + ':' + k for k in header]
-            columns = [k if k == 'Time' else rname + ':' + k for k in columns]
-
-        return header, columns
+        return delta
 
 
 class SolverInfoManager(QObject):
-    residualsUpdated = Signal(pd.DataFrame)
+    residualsUpdated = Signal(list)
     flushed = Signal()
 
     def __init__(self):
         super().__init__()
 
         self.worker = None
-        self.thread = None
 
     def startCollecting(self, casePath: Path, regions: [str]):
-        if self.thread is not None:
+        if self.worker is not None:
             self.stopCollecting()
 
         if not casePath.is_absolute():
             raise AssertionError
 
-        self.thread = QThread()
         self.worker = Worker(casePath, regions)
 
-        self.worker.moveToThread(self.thread)
+        PostProcessingCollector().moveToCollector(self.worker)
 
         self.worker.residualsUpdated.connect(self.residualsUpdated, type=Qt.ConnectionType.QueuedConnection)
         self.worker.flushed.connect(self.flushed, type=Qt.ConnectionType.QueuedConnection)
 
-        self.thread.start()
-
         self.worker.start.emit()
 
     def stopCollecting(self):
-        if self.thread is None:
+        if self.worker is None:
             return
 
         self.worker.stop.emit()
-        self.thread.wait(1000)  # usually 1ms is sufficient, yet delay over 500ms was seen once
 
         self.worker = None
-        self.thread = None
 
     def updateResiduals(self):
-        if self.thread is None:
+        if self.worker is None:
             raise FileNotFoundError
 
         self.worker.updateResiduals.emit()
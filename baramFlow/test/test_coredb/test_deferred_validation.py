@@ -0,0 +1,54 @@
+import unittest
+
+from lxml import etree
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.libdb import ns
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestDeferredValidation(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addNonMixture(self.db, 'air')
+        RegionDB.addRegion('')
+        self.path = './/runConditions/numberOfIterations'
+        self.invalid = f'<unknown xmlns="{ns}"/>'
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testValidatedImmediatelyOutOfContext(self):
+        with self.assertRaises(etree.DocumentInvalid):
+            self.db.addElementFromString('.//runConditions', self.invalid)
+
+    def testValidatedAtCommit(self):
+        self.db.setValue(self.path, '10')
+        with self.assertRaises(etree.DocumentInvalid):
+            with coredb.CoreDB() as db:
+                db.setValue(self.path, '20')
+                db.addElementFromString('.//runConditions', self.invalid)
+                self.assertEqual('20', db.getValue(self.path))  # Not validated yet
+
+        self.assertEqual('10', self.db.getValue(self.path))
+        self.assertFalse(self.db.exists('.//runConditions/unknown'))
+
+    def testCommit(self):
+        with coredb.CoreDB() as db:
+            for i in range(10):
+                db.addBoundaryCondition('', f'patch{i}', 'patch', 'wall')
+
+        self.assertEqual(10, len(self.db.getBoundaryConditions('')))
+
+        with self.assertRaises(FileExistsError):
+            self.db.addBoundaryCondition('', 'patch0', 'patch', 'wall')
+
+    def testValueCheckedLocally(self):
+        with coredb.CoreDB() as db:
+            with self.assertRaises(coredb.ValueException):
+                db.setValue(self.path, '1.5')
+
+
+if __name__ == '__main__':
+    unittest.main()
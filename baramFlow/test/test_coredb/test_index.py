@@ -0,0 +1,70 @@
+import unittest
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.boundary_db import BoundaryDB
+from baramFlow.coredb.cell_zone_db import CellZoneDB
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.monitor_db import MonitorDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestCoreDBIndex(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        self.mid = MaterialDB.addNonMixture(self.db, 'air')
+        RegionDB.addRegion('a')
+        self.bcids = [self.db.addBoundaryCondition('a', f'patch{i}', 'patch', 'wall') for i in range(3)]
+        self.czid = self.db.addCellZone('a', 'zone')
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testLookups(self):
+        self.assertEqual('patch1', BoundaryDB.getBoundaryName(self.bcids[1]))
+        self.assertEqual('a', BoundaryDB.getBoundaryRegion(self.bcids[1]))
+        self.assertEqual('wall', BoundaryDB.getBoundaryTypeByName('a', 'patch2'))
+        self.assertEqual('zone', CellZoneDB.getCellZoneName(self.czid))
+        self.assertEqual('air', MaterialDB.getName(self.mid))
+        self.assertFalse(self.db.exists(BoundaryDB.getXPath(999)))
+        self.assertEqual([], self.db.getElements(BoundaryDB.getXPath(999) + '/name'))
+
+    def testRemoveAndReuseID(self):
+        self.db.removeElement(BoundaryDB.getXPath(self.bcids[1]))
+
+        self.assertFalse(self.db.exists(BoundaryDB.getXPathByName('a', 'patch1')))
+        self.assertEqual(self.bcids[1], self.db.addBoundaryCondition('a', 'new', 'patch', 'wall'))
+        self.assertEqual('new', BoundaryDB.getBoundaryName(self.bcids[1]))
+
+    def testRename(self):
+        self.db.setValue(BoundaryDB.getXPath(self.bcids[0]) + '/name', 'renamed')
+        self.assertTrue(self.db.exists(BoundaryDB.getXPathByName('a', 'renamed')))
+        self.assertFalse(self.db.exists(BoundaryDB.getXPathByName('a', 'patch0')))
+
+        self.db.setValue(RegionDB.getXPath('a') + '/name', 'b')
+        self.assertEqual(self.bcids[0], int(self.db.getAttribute(BoundaryDB.getXPathByName('b', 'renamed'), 'bcid')))
+        self.assertEqual(3, len(self.db.getBoundaryConditions('b')))
+        self.assertEqual([], self.db.getBoundaryConditions('a'))
+
+    def testMonitors(self):
+        name = self.db.addForceMonitor()
+        self.assertTrue(self.db.exists(MonitorDB.getForceMonitorXPath(name)))
+
+        self.db.removeForceMonitor(name)
+        self.assertFalse(self.db.exists(MonitorDB.getForceMonitorXPath(name)))
+        with self.assertRaises(LookupError):
+            self.db.removeForceMonitor(name)
+
+    def testRollback(self):
+        with coredb.CoreDB() as db:
+            db.removeElement(BoundaryDB.getXPath(self.bcids[0]))
+            db.addBoundaryCondition('a', 'new', 'patch', 'wall')
+            db.clearRegions()
+            raise coredb.Cancel
+
+        self.assertEqual('patch0', BoundaryDB.getBoundaryName(self.bcids[0]))
+        self.assertFalse(self.db.exists(BoundaryDB.getXPathByName('a', 'new')))
+        self.assertEqual('zone', CellZoneDB.getCellZoneName(self.czid))
+
+
+if __name__ == '__main__':
+    unittest.main()
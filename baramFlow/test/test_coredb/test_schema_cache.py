@@ -0,0 +1,38 @@
+import unittest
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.libdb import DBError, ValueException
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestSchemaCache(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addNonMixture(self.db, 'air')
+        RegionDB.addRegion('a')
+        RegionDB.addRegion('b')
+        self.db.addBoundaryCondition('a', 'wall', 'patch', 'wall')
+        self.db.addBoundaryCondition('b', 'wall', 'patch', 'wall')
+
+    def testElementsAtDifferentPositions(self):
+        for rname in ['a', 'b']:
+            xpath = f'.//region[name="{rname}"]/boundaryConditions/boundaryCondition[name="wall"]/physicalType'
+            self.assertEqual('wall', self.db.getValue(xpath))
+
+            with self.assertRaises(ValueError):
+                self.db.setValue(xpath, 'wrongValue')
+
+    def testRestrictionsKept(self):
+        xpath = './/runConditions/numberOfIterations'
+        for _ in range(2):
+            with self.assertRaises(ValueException) as context:
+                self.db.setValue(xpath, '1.5')
+            self.assertEqual(DBError.INTEGER_ONLY, context.exception.args[0])
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import asyncio
+import unittest
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.coredb_reader import CoreDBReader
+from baramFlow.coredb.libdb import ns
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestCoreDBSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addNonMixture(self.db, 'air')
+        RegionDB.addRegion('')
+        self.db.addBoundaryCondition('', 'patch', 'patch', 'wall')
+
+        self.path = './/operatingConditions/pressure'
+        self.db.addElementFromString('.//runCalculation/batch/parameters',
+                                     f'<parameter xmlns="{ns}"><name>n</name><value>10</value></parameter>')
+        self.db.setValue(self.path, '$n')
+
+        self.reader = CoreDBReader()
+        self.reader.reloadCoreDB()
+        self.reader.setParameters()
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testIsolatedFromChanges(self):
+        snapshot = self.reader.snapshot()
+        self.db.setValue(self.path, '20')
+        self.db.addBoundaryCondition('', 'new', 'patch', 'wall')
+
+        self.assertEqual('10', snapshot.getValue(self.path))
+        self.assertEqual(['patch'], [name for _, name, _ in snapshot.getBoundaryConditions('')])
+        self.assertEqual('20', self.reader.getValue(self.path))
+
+    def testOwnParameters(self):
+        first = self.reader.snapshot({'n': '30'})
+        second = self.reader.snapshot({'n': '40'})
+
+        self.assertEqual('30', first.getValue(self.path))
+        self.assertEqual('40', second.getValue(self.path))
+        self.assertEqual('10', self.reader.getValue(self.path))
+
+    def testTreeShared(self):
+        first = self.reader.snapshot()
+        self.assertIs(first._xmlTree, self.reader.snapshot()._xmlTree)
+
+        self.db.setValue(self.path, '20')
+        self.assertIsNot(first._xmlTree, self.reader.snapshot()._xmlTree)
+
+    def testReadOnly(self):
+        snapshot = self.reader.snapshot()
+        with self.assertRaises(RuntimeError):
+            snapshot.setValue(self.path, '20')
+        with self.assertRaises(RuntimeError):
+            snapshot.removeElement('.//boundaryCondition[name="patch"]')
+
+    def testViewing(self):
+        snapshot = self.reader.snapshot({'n': '30'})
+        with coredb.viewing(snapshot):
+            self.assertIs(snapshot, coredb.CoreDB())
+            self.assertIs(snapshot, CoreDBReader())
+            self.assertIs(snapshot, asyncio.run(asyncio.to_thread(coredb.CoreDB)))
+
+        self.assertIs(self.db, coredb.CoreDB())
+        self.assertIs(self.reader, CoreDBReader())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from lxml import etree
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+
+
+class TestUndoLog(unittest.TestCase):
+    def setUp(self):
+        self.db = coredb.createDB()
+        MaterialDB.addNonMixture(self.db, 'air')
+        RegionDB.addRegion('a')
+        for i in range(3):
+            self.db.addBoundaryCondition('a', f'patch{i}', 'patch', 'wall')
+        self.db.addForceMonitor()
+
+    def tearDown(self) -> None:
+        coredb.destroy()
+
+    def testRollback(self):
+        original = etree.tostring(self.db._xmlTree)
+
+        with coredb.CoreDB() as db:
+            db.setValue('.//runConditions/numberOfIterations', '77')
+            db.addBoundaryCondition('a', 'new', 'patch', 'wall')
+            db.removeElement('.//region[name="a"]/boundaryConditions/boundaryCondition[name="patch1"]')
+            db.copyBoundaryConditions(1, 3)
+            db.setBulk('.//monitors/forces/forceMonitor', db.getBulk('.//monitors/forces/forceMonitor'))
+            db.clearMonitors()
+            RegionDB.addRegion('b')
+            MaterialDB.addNonMixture(db, 'oxygen')
+            db.clearRegions()
+            raise coredb.Cancel
+
+        self.assertEqual(original, etree.tostring(self.db._xmlTree))
+
+    def testCommit(self):
+        with coredb.CoreDB() as db:
+            db.removeElement('.//region[name="a"]/boundaryConditions/boundaryCondition[name="patch1"]')
+            db.addBoundaryCondition('a', 'new', 'patch', 'wall')
+
+        self.assertEqual(['patch0', 'patch2', 'new'], [name for _, name, _ in self.db.getBoundaryConditions('a')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from libbaram.affinity import availableCores, parseCPUList, partitionCores
+
+
+class TestAffinity(unittest.TestCase):
+    def testParseCPUList(self):
+        self.assertEqual([0, 1, 2, 3, 8, 10, 11], parseCPUList('0-3,8,10-11\n'))
+        self.assertEqual([], parseCPUList(''))
+
+    def testPartitionWithinNodes(self):
+        nodes = [list(range(0, 8)), list(range(8, 16))]
+        self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11], [12, 13, 14, 15]], partitionCores(4, nodes))
+
+    def testPartitionRest(self):
+        nodes = [list(range(0, 6)), list(range(6, 12))]
+        # Cores left in the nodes are put together
+        self.assertEqual([[0, 1, 2, 3], [6, 7, 8, 9], [4, 5, 10, 11]], partitionCores(4, nodes))
+        self.assertEqual([], partitionCores(16, nodes))
+
+    def testAvailableCores(self):
+        cores = sum(availableCores(), [])
+        self.assertTrue(cores)
+        self.assertEqual(sorted(set(cores)), sorted(cores))
+
+
+if __name__ == '__main__':
+    unittest.main()
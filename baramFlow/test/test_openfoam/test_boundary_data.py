@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from baramFlow.coredb.filedb import BcFileRole, FileDB
+from baramFlow.openfoam.constant.boundary_data import BoundaryData
+from baramFlow.openfoam.file_system import FileSystem
+from libbaram.openfoam.foam_file import FoamFileParser
+
+
+def _vectors(path):
+    return [str(v) for v in FoamFileParser(path.read_bytes()).parse()[1]]
+
+
+class TestBoundaryData(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        path = Path(self._dir.name)
+        FileSystem.setCaseRoot(path / 'case')
+        self._fileDB = FileDB(path)
+        self._csv = path / 'profile.csv'
+
+        self._pointsFile = path / 'case' / 'constant' / 'boundaryData' / 'inlet' / 'points_U'
+        self._valuesFile = self._pointsFile.parent / '0' / 'U'
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _put(self, rows):
+        self._csv.write_text(''.join(','.join(map(str, row)) + '\n' for row in rows))
+
+        return self._fileDB.putBcFile(1, BcFileRole.BC_VELOCITY_COMPONENT, self._csv)
+
+    def testWrite(self):
+        key = self._put([(0, 0, 0, 1, 0, 0), (0, 0.5, 0, 2.5, 0, 0)])
+        self.assertEqual('points_U', BoundaryData.write('', 'inlet', 'U', self._fileDB, key))
+
+        self.assertEqual(['(0 0 0)', '(0 0.5 0)'], _vectors(self._pointsFile))
+        self.assertEqual(['(1 0 0)', '(2.5 0 0)'], _vectors(self._valuesFile))
+
+    def testUnchanged(self):
+        key = self._put([(0, 0, 0, 1, 0, 0)])
+        BoundaryData.write('', 'inlet', 'U', self._fileDB, key)
+
+        # Not written again from the same contents
+        self._pointsFile.write_text('1((9 9 9))')
+        BoundaryData.write('', 'inlet', 'U', self._fileDB, key)
+        self.assertEqual('1((9 9 9))', self._pointsFile.read_text())
+
+        key = self._put([(0, 0, 1, 1, 0, 0)])
+        BoundaryData.write('', 'inlet', 'U', self._fileDB, key)
+        self.assertEqual(['(0 0 1)'], _vectors(self._pointsFile))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import gzip
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from PyFoam.RunDictionary.ParsedParameterFile import ParsedParameterFile
+
+from libbaram.openfoam.boundary_field import BoundaryFieldFile
+
+
+def _header(fileFormat):
+    return f'''FoamFile
+{{
+    version     2.0;
+    format      {fileFormat};
+    arch        "LSB;label=32;scalar=64";
+    class       volVectorField;
+    location    "0.1";
+    object      U;
+}}
+// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+
+dimensions      [0 1 -1 0 0 0 0];
+
+'''.encode()
+
+
+_BOUNDARY_FIELD = b'''
+boundaryField
+{
+    inlet
+    {
+        type            fixedValue;
+        value           uniform (1 0 0);
+    }
+    outlet
+    {
+        type            zeroGradient;
+    }
+    wall
+    {
+        type            fixedValue;
+        value           nonuniform List<vector> 2((0 0 0) (1 1 1));
+    }
+    #includeEtc "caseDicts/setConstraintTypes"
+}
+
+
+// ************************************************************************* //
+'''
+
+ASCII_INTERNAL_FIELD = (b'internalField   nonuniform List<vector> \n5\n(\n'
+                        + b''.join(f'({i} 0 0)\n'.encode() for i in range(5)) + b')\n;\n')
+
+# Binary data may have any bytes, even ones looking like boundaryField
+BINARY_INTERNAL_FIELD = (b'internalField   nonuniform List<vector> 6('
+                         + b''.join(struct.pack('<3d', i, 0, 0) for i in range(5)) + b'boundaryField {)(;'
+                         + struct.pack('<d', 0)[:6] + b')\n;\n')
+
+
+class TestBoundaryFieldFile(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name) / 'U'
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _update(self, fieldFile):
+        fieldFile.update('inlet', {'type': 'fixedValue', 'value': ('uniform', [2, 0, 0])})
+        fieldFile.update('outlet', {'type': 'inletOutlet', 'inletValue': ('uniform', [0, 0, 0])})
+        fieldFile.update('newPatch', {'type': 'wall'})
+        fieldFile.writeFile()
+
+    def testAscii(self):
+        prefix = _header('ascii') + ASCII_INTERNAL_FIELD
+        self._path.write_bytes(prefix + _BOUNDARY_FIELD)
+
+        fieldFile = BoundaryFieldFile.load(self._path)
+        self.assertEqual(['inlet', 'outlet', 'wall'], fieldFile.patchNames())
+        self.assertEqual('fixedValue', fieldFile.get('inlet', 'type'))
+        self.assertEqual('nonuniform List<vector> 2((0 0 0) (1 1 1))', fieldFile.get('wall', 'value'))
+        self.assertIsNone(fieldFile.get('outlet', 'value'))
+
+        self._update(fieldFile)
+        self.assertTrue(self._path.read_bytes().startswith(prefix))
+
+        content = ParsedParameterFile(str(self._path), debug=None).content
+        boundaryField = content['boundaryField']
+        self.assertEqual(5, len(content['internalField'].val))
+        self.assertEqual([2, 0, 0], list(boundaryField['inlet']['value'].val))
+        self.assertEqual('inletOutlet', boundaryField['outlet']['type'])
+        self.assertEqual([0, 0, 0], list(boundaryField['outlet']['inletValue'].val))
+        self.assertFalse(boundaryField['wall']['value'].isUniform())
+        self.assertEqual('wall', boundaryField['newPatch']['type'])
+
+    def testUpdateInReverseOrder(self):
+        self._path.write_bytes(_header('ascii') + ASCII_INTERNAL_FIELD + _BOUNDARY_FIELD)
+
+        fieldFile = BoundaryFieldFile.load(self._path)
+        fieldFile.update('wall', {'type': 'noSlip'})
+        fieldFile.update('inlet', {'value': ('uniform', [3, 0, 0]), 'type': 'fixedValue'})
+        fieldFile.writeFile()
+
+        self.assertEqual(1, self._path.read_bytes().count(b'inlet'))
+        boundaryField = ParsedParameterFile(str(self._path), debug=None).content['boundaryField']
+        self.assertEqual(['inlet', 'outlet', 'wall'], [k for k in boundaryField if isinstance(k, str)])
+        self.assertEqual('fixedValue', boundaryField['inlet']['type'])
+        self.assertEqual([3, 0, 0], list(boundaryField['inlet']['value'].val))
+        self.assertEqual('noSlip', boundaryField['wall']['type'])
+
+    def testBinary(self):
+        prefix = _header('binary') + BINARY_INTERNAL_FIELD
+        self._path.write_bytes(prefix + _BOUNDARY_FIELD)
+
+        fieldFile = BoundaryFieldFile.load(self._path)
+        self.assertEqual(['inlet', 'outlet', 'wall'], fieldFile.patchNames())
+
+        self._update(fieldFile)
+        data = self._path.read_bytes()
+        self.assertTrue(data.startswith(prefix))
+        self.assertEqual('inletOutlet', BoundaryFieldFile.load(self._path).get('outlet', 'type'))
+        self.assertEqual('wall', BoundaryFieldFile.load(self._path).get('newPatch', 'type'))
+
+    def testCompressed(self):
+        prefix = _header('ascii') + ASCII_INTERNAL_FIELD
+        compressed = self._path.with_name('U.gz')
+        compressed.write_bytes(gzip.compress(prefix + _BOUNDARY_FIELD))
+
+        self.assertTrue(BoundaryFieldFile.exists(self._path))
+        self._update(BoundaryFieldFile.load(self._path))
+
+        self.assertFalse(self._path.exists())
+        self.assertTrue(gzip.decompress(compressed.read_bytes()).startswith(prefix))
+        self.assertEqual('wall', BoundaryFieldFile.load(self._path).get('newPatch', 'type'))
+
+    def testNotFound(self):
+        self.assertFalse(BoundaryFieldFile.exists(self._path))
+        self.assertIsNone(BoundaryFieldFile.load(self._path))
+
+        self._path.write_bytes(_header('ascii') + ASCII_INTERNAL_FIELD)
+        self.assertIsNone(BoundaryFieldFile.load(self._path))
+
+
+if __name__ == '__main__':
+    unittest.main()
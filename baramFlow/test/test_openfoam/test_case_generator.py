@@ -0,0 +1,84 @@
+import unittest
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+
+from baramFlow.coredb import coredb
+from baramFlow.openfoam.case_generator import CaseGenerator
+
+
+class _File:
+    def __init__(self, path, log, action=None):
+        self._path = Path(path)
+        self._log = log
+        self._action = action
+
+    def fullPath(self):
+        return self._path
+
+    def build(self):
+        if self._action:
+            self._action()
+
+        return self
+
+    def write(self):
+        self._log.append(self)
+
+
+class TestCaseGenerator(unittest.TestCase):
+    def setUp(self):
+        self._generator = CaseGenerator(db=object())
+        self._log = []
+        self._messages = []
+        self._generator.progress.connect(self._messages.append, Qt.ConnectionType.DirectConnection)
+
+    def testAllGenerated(self):
+        files = [_File(f'f{i}', self._log) for i in range(50)]
+        self._generator._files = files
+        self._generator._generateFiles()
+
+        self.assertCountEqual(files, self._log)
+        self.assertEqual(50, len(self._messages))
+        self.assertIn('(50/50)', self._messages[-1])
+
+    def testSameObjectInOrder(self):
+        files = [_File('boundary', self._log) for _ in range(20)]
+        self._generator._files = files
+        self._generator._generateFiles()
+
+        self.assertEqual(files, self._log)
+
+    def testCoreDBView(self):
+        db = object()
+        views = []
+
+        files = [_File(f'f{i}', self._log, lambda: views.append(coredb.currentView())) for i in range(10)]
+        self._generator._files = files
+        with coredb.viewing(db):
+            self._generator._generateFiles()
+
+        self.assertEqual([db] * 10, views)
+
+    def testCancel(self):
+        def cancel():
+            self._generator.cancel()
+
+        files = [_File('a', self._log, cancel)] + [_File('a', self._log) for _ in range(10)]
+        self._generator._files = files
+        self._generator._generateFiles()
+
+        self.assertEqual(files[:1], self._log)
+
+    def testError(self):
+        def fail():
+            raise RuntimeError
+
+        files = [_File('a', self._log, fail)] + [_File(f'b{i}', self._log) for i in range(5)]
+        self._generator._files = files
+        with self.assertRaises(RuntimeError):
+            self._generator._generateFiles()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+import numpy as np
+
+from baramFlow.view.widgets.chart_lod import decimate, visibleRange
+
+
+class TestChartLod(unittest.TestCase):
+    def testShortLineIsNotDecimated(self):
+        x = np.arange(10, dtype=np.float64)
+        y = x * 2
+
+        dx, dy = decimate(x, y, 5)
+
+        np.testing.assert_array_equal(x, dx)
+        np.testing.assert_array_equal(y, dy)
+
+    def testMinMaxKept(self):
+        x = np.arange(1000, dtype=np.float64)
+        y = np.sin(x / 10)
+        y[123] = 5
+        y[777] = -5
+        y[500] = np.nan
+
+        dx, dy = decimate(x, y, 100)
+
+        self.assertLessEqual(len(dx), 200)
+        self.assertTrue(np.all(np.diff(dx) >= 0))
+        self.assertEqual(5, np.nanmax(dy))
+        self.assertEqual(-5, np.nanmin(dy))
+        self.assertIn(123, dx)
+        self.assertIn(777, dx)
+        self.assertEqual(x[0], dx[0])
+
+    def testVisibleRange(self):
+        x = np.arange(10, dtype=np.float64)
+
+        self.assertEqual((2, 8), visibleRange(x, 2.5, 6.5))
+        self.assertEqual((0, 10), visibleRange(x, -1, 20))
+        self.assertEqual((9, 10), visibleRange(x, 20, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from libbaram.openfoam.field_decomposer import FieldDecomposer
+from libbaram.openfoam.foam_file import FoamDictFile
+
+HEADER = '''FoamFile
+{{
+    version     2.0;
+    format      ascii;
+    class       {};
+    object      {};
+}}
+'''
+
+BOUNDARY = '''
+{}
+(
+    inlet
+    {{
+        type            patch;
+        nFaces          {};
+        startFace       {};
+    }}
+    outlet
+    {{
+        type            patch;
+        nFaces          {};
+        startFace       {};
+    }}
+{})
+'''
+
+PROCESSOR_PATCH = '''    procBoundary{}
+    {{
+        type            processor;
+        nFaces          1;
+        startFace       {};
+        myProcNo        {};
+        neighbProcNo    {};
+    }}
+'''
+
+FIELD = '''
+dimensions      [0 1 -1 0 0 0 0];
+
+internalField   {};
+
+boundaryField
+{{
+    inlet
+    {{
+        type            fixedValue;
+        value           nonuniform List<vector> 2((1 0 0) (2 0 0));
+    }}
+    "out.*"
+    {{
+        type            zeroGradient;
+    }}
+}}
+'''
+
+
+class TestFieldDecomposer(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name)
+
+        self._writeFile('constant/polyMesh/boundary', 'polyBoundaryMesh', BOUNDARY.format(2, 2, 10, 2, 12, ''))
+        # The second face of the inlet is in processor0, and the first in processor1
+        self._writeFile('processor0/constant/polyMesh/boundary', 'polyBoundaryMesh',
+                        BOUNDARY.format(3, 1, 5, 2, 6, PROCESSOR_PATCH.format('0to1', 8, 0, 1)))
+        self._writeFile('processor0/constant/polyMesh/faceProcAddressing', 'labelList',
+                        '9(1 2 3 4 5 12 13 14 -6)')
+        self._writeFile('processor1/constant/polyMesh/boundary', 'polyBoundaryMesh',
+                        BOUNDARY.format(3, 1, 3, 0, 4, PROCESSOR_PATCH.format('1to0', 4, 1, 0)))
+        self._writeFile('processor1/constant/polyMesh/faceProcAddressing', 'labelList', '5(7 8 9 11 6)')
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def testDecompose(self):
+        self._writeFile('0/U', 'volVectorField', FIELD.format('uniform (5 0 0)'))
+        self._writeFile('0/uniform/time', 'dictionary', 'value 0;')
+
+        with ThreadPoolExecutor() as executor:
+            self.assertTrue(FieldDecomposer(self._path, [''], executor).decompose(self._path))
+
+        boundaryField = FoamDictFile(self._path / 'processor0/0/U').content['boundaryField']
+        self.assertEqual(['inlet', 'outlet', 'procBoundary0to1'], list(boundaryField.keys()))
+        self.assertEqual(['(2 0 0)'], [str(v) for v in boundaryField['inlet']['value'].val])
+        self.assertEqual('zeroGradient', boundaryField['outlet']['type'])
+        self.assertEqual('processor', boundaryField['procBoundary0to1']['type'])
+        self.assertEqual('(5 0 0)', str(boundaryField['procBoundary0to1']['value'].val))
+
+        content = FoamDictFile(self._path / 'processor1/0/U').content
+        self.assertEqual('(5 0 0)', str(content['internalField'].val))
+        self.assertEqual(['(1 0 0)'], [str(v) for v in content['boundaryField']['inlet']['value'].val])
+        self.assertTrue((self._path / 'processor1/0/uniform/time').is_file())
+
+    def testNonuniformInternalField(self):
+        self._writeFile('0/U', 'volVectorField', FIELD.format('nonuniform List<vector> 2((1 0 0) (2 0 0))'))
+
+        with ThreadPoolExecutor() as executor:
+            self.assertFalse(FieldDecomposer(self._path, [''], executor).decompose(self._path))
+
+        self.assertFalse((self._path / 'processor0/0').exists())
+
+    def _writeFile(self, path, class_, content):
+        path = self._path / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(HEADER.format(class_, path.name) + content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+import gzip
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PyFoam.Basics.DataStructures import BoolProxy, DictProxy, Dimension, Field, TupleProxy, Vector
+from PyFoam.Basics.FoamFileGenerator import FoamFileGenerator
+from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict, ParsedParameterFile
+
+from libbaram.openfoam.foam_file import BoundaryDictFile, FoamDictFile, FoamFileError, FoamFileParser, FoamFileWriter
+from libbaram.openfoam.foam_file import arrayField, foamString
+
+HEADER = '''FoamFile
+{{
+    version     2.0;
+    format      {};
+    arch        "LSB;label=32;scalar=64";
+    class       volScalarField;
+    object      p;
+}}
+'''
+
+DICTIONARY = '''
+a 1; b -1.5e-3; c word; d "quoted"; e (1 2 3); f (a b c); g [0 1 -1 0 0 0 0];
+h uniform (1 0 0); i uniform 3; j nonuniform List<scalar> 3(1 2 3); k nonuniform List<vector> 2((1 2 3)(4 5 6));
+l { x 1; y (1 2); #includeEtc "caseDicts/setConstraintTypes"
+}
+m 2(1 2); n yes; o table ((0 1) (1 2)); p $a; q 10{0}; "(r|s)" { type empty; }
+t List<word> 1(wall); u a b c; v ( name1 { a 1; } name2 { a 2; } );
+x table ((0 (1 0 0)) (1 (2 0 0))); y (2(1 2) 3(4 5 6)); z 3(1 2 3);
+div(phi,U) Gauss linear; // comment
+/* comment */ w;
+'''
+
+BOUNDARY = '''FoamFile
+{
+    version     2.0;
+    format      ascii;
+    class       polyBoundaryMesh;
+    location    "constant/polyMesh";
+    object      boundary;
+}
+
+2
+(
+    outlet
+    {
+        type            patch;
+        nFaces          10;
+        startFace       110;
+    }
+    wall
+    {
+        type            wall;
+        inGroups        List<word> 1(wall);
+        nFaces          20;
+        startFace       90;
+    }
+)
+'''
+
+
+def _entries(dictionary: DictProxy):
+    return [(k, type(dictionary[k]), str(dictionary[k])) for k in dictionary._order if not dictionary.isRegexp(k)]
+
+
+class TestFoamFileParser(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name) / 'p'
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def testSameAsPyFoam(self):
+        self._path.write_text(HEADER.format('ascii') + DICTIONARY)
+
+        expected = ParsedParameterFile(str(self._path))
+        header, content = FoamFileParser(self._path.read_bytes()).parse()
+
+        self.assertEqual(_entries(expected.header), _entries(header))
+        self.assertEqual(_entries(expected.content), _entries(content))
+        self.assertEqual(_entries(expected.content['l']), _entries(content['l']))
+        self.assertEqual('empty', content['s']['type'])
+
+        self.assertIsInstance(content['e'], Vector)
+        self.assertIsInstance(content['g'], Dimension)
+        self.assertIsInstance(content['n'], BoolProxy)
+        self.assertIsInstance(content['t'], TupleProxy)
+        self.assertFalse(content['j'].isUniform())
+        self.assertEqual(['name1', {'a': 1}, 'name2', {'a': 2}], content['v'])
+        self.assertIsNone(content['w'])
+
+    def testBoundaryDict(self):
+        self._path.write_text(BOUNDARY)
+
+        expected = ParsedBoundaryDict(str(self._path), treatBinaryAsASCII=True, longListOutputThreshold=1)
+        boundaryDict = BoundaryDictFile(self._path, longListOutputThreshold=1)
+        self.assertEqual(['outlet', 'wall'], list(boundaryDict.content.keys()))
+        self.assertEqual(_entries(expected.content['wall']), _entries(boundaryDict.content['wall']))
+
+        # Written in the order of startFace
+        self.assertTrue(str(expected).endswith(str(boundaryDict)))
+
+        boundaryDict.content['wall']['type'] = 'patch'
+        del boundaryDict.content['outlet']
+        boundaryDict.writeFile()
+
+        content = BoundaryDictFile(self._path).content
+        self.assertEqual(['wall'], list(content.keys()))
+        self.assertEqual('patch', content['wall']['type'])
+
+    def testAsciiArray(self):
+        self._path.write_text(HEADER.format('ascii')
+                              + 'internalField nonuniform List<vector> 200\n(\n'
+                              + ''.join(f'({i} 0 -{i}.5)\n' for i in range(200)) + ');\n'
+                              + 'small nonuniform List<scalar> 3(1 2 3);\n')
+
+        dictFile = FoamDictFile(self._path)
+        field = dictFile.content['internalField']
+        self.assertIsInstance(field, Field)
+        self.assertFalse(field.isUniform())
+        self.assertEqual('List<vector>', field.name)
+        self.assertEqual((200, 3), field.val.shape)
+        self.assertEqual([199, 0, -199.5], field.val[199].tolist())
+        self.assertEqual([1, 2, 3], dictFile.content['small'].val)
+
+        dictFile.writeFile()
+        np.testing.assert_array_equal(field.val, FoamDictFile(self._path).content['internalField'].val)
+
+    def testBinaryArray(self):
+        self._path.write_bytes(HEADER.format('binary').encode()
+                               + b'internalField nonuniform List<scalar> 3(' + struct.pack('<3d', 1, 2, 3) + b');\n'
+                               + b'labels List<label> 2(' + struct.pack('<2i', 4, 5) + b');\n'
+                               + b'ascii nonuniform List<scalar> 2(6 7);\n')
+
+        content = FoamDictFile(self._path).content
+        self.assertEqual([1, 2, 3], content['internalField'].val.tolist())
+        self.assertEqual([4, 5], content['labels'][2].tolist())
+        self.assertEqual([6, 7], content['ascii'].val.tolist())
+
+    def testCompressed(self):
+        compressed = self._path.with_name('p.gz')
+        compressed.write_bytes(gzip.compress((HEADER.format('ascii') + 'a 1;\n').encode()))
+
+        dictFile = FoamDictFile(self._path)
+        dictFile.content['a'] = 2
+        dictFile.writeFile()
+
+        self.assertFalse(self._path.exists())
+        self.assertEqual(2, FoamDictFile(self._path).content['a'])
+
+    def testError(self):
+        with self.assertRaises(FoamFileError):
+            FoamFileParser(b'a { b 1;').parse()
+        with self.assertRaises(FoamFileError):
+            FoamFileParser(b'a nonuniform List<scalar> 200(1 2 3);').parse()
+
+
+FIELD = '''
+dimensions      [0 1 -1 0 0 0 0];
+
+internalField   uniform (0 0 0);
+
+boundaryField
+{
+    inlet
+    {
+        type            uniformFixedValue;
+        uniformValue    table ((0 (1 0 0)) (1 (2 0 0)));
+    }
+    outlet
+    {
+        type            zeroGradient;
+    }
+}
+'''
+
+BANNER = '// ************************************************************************* //'
+
+
+class TestFoamFileWriter(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name) / 'U'
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def testSameAsFoamFileGenerator(self):
+        header, content = FoamFileParser((HEADER.format('ascii') + DICTIONARY).encode()).parse()
+        self.assertEqual(FoamFileGenerator(content, header=header).makeString(firstLevel=True),
+                         foamString(content, header, firstLevel=True))
+
+        data = {
+            'a': ('uniform', [7, 0, 0]),
+            'b': ('table', [[0, [1, 2, 3]], [1, [2, 3, 4]]]),
+            'c': list(range(30)),
+            'd': [{'type': 'wall'}, 'word', ('box', [0, 1])],
+            'e': Field([[1, 0, 0], [2, 0, 0]], 'List<vector>'),
+            'f': 'a/b',
+            'g': True,
+            'h': None
+        }
+        self.assertEqual(str(FoamFileGenerator(data)), foamString(data))
+
+    def testSameAsParsedParameterFile(self):
+        self._path.write_text(HEADER.format('ascii') + FIELD)
+
+        # ParsedParameterFile writes a comment that it has generated the file before them
+        self.assertTrue(str(ParsedParameterFile(str(self._path))).endswith(str(FoamDictFile(self._path))))
+
+    def testLastDecoration(self):
+        self._path.write_text(HEADER.format('ascii') + 'a 1;\n\n' + BANNER + '\n')
+
+        dictFile = FoamDictFile(self._path)
+        self.assertEqual(BANNER, dictFile.lastDecoration)
+        self.assertTrue(str(ParsedParameterFile(str(self._path))).endswith(str(dictFile)))
+
+        self._path.write_text(HEADER.format('ascii') + FIELD + '\n\n' + BANNER + '\n')
+        FoamDictFile(self._path).writeFile()
+        self.assertTrue(self._path.read_text().endswith('}\n\n\n\n' + BANNER))
+
+    def testAsciiArray(self):
+        array = np.arange(600, dtype=np.float64).reshape(200, 3) / 7
+        with self._path.open('wb') as f:
+            FoamFileWriter(f, {'version': 2.0, 'format': 'ascii', 'class': 'volVectorField', 'object': 'U'}).write({
+                'internalField': arrayField(array, 'List<vector>'),
+                'labels': TupleProxy(['List<label>', 200, np.arange(200)])
+            })
+
+        content = ParsedParameterFile(str(self._path)).content
+        self.assertEqual(array[199].tolist(), content['internalField'].val[199].vals)
+        np.testing.assert_array_equal(array, FoamDictFile(self._path).content['internalField'].val)
+        self.assertEqual(list(range(200)), FoamDictFile(self._path).content['labels'][2].tolist())
+
+    def testBinary(self):
+        array = np.arange(600, dtype=np.float64).reshape(200, 3) / 7
+        with self._path.open('wb') as f:
+            FoamFileWriter(f, {'version': 2.0, 'format': 'binary', 'class': 'volVectorField', 'object': 'U'}).write({
+                'internalField': arrayField(array, 'List<vector>'),
+                'value': Field([1, 2], 'List<scalar>'),
+                'labels': TupleProxy(['List<label>', 2, np.array([3, 4])])
+            })
+
+        data = self._path.read_bytes()
+        self.assertIn(b'arch "LSB;label=32;scalar=64";', data)
+        self.assertIn(b'200(' + array.astype('<f8').tobytes() + b')', data)
+        self.assertIn(b'2(' + struct.pack('<2d', 1, 2) + b')', data)
+        self.assertIn(b'2(' + struct.pack('<2i', 3, 4) + b')', data)
+
+        # Written back in binary
+        FoamDictFile(self._path).writeFile()
+        self.assertIn(b'200(' + array.astype('<f8').tobytes() + b')', self._path.read_bytes())
+        np.testing.assert_array_equal(array, FoamDictFile(self._path).content['internalField'].val)
+
+
+if __name__ == '__main__':
+    unittest.main()
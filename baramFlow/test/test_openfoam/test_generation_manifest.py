@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
+from libbaram.openfoam.dictionary.generation_manifest import GenerationManifest
+
+
+class _Dictionary(DictionaryFile):
+    def __init__(self, casePath, data):
+        super().__init__(casePath, self.systemLocation(), 'testDict')
+        self._data = data
+
+    def build(self):
+        return self
+
+    def serialize(self):
+        self.serialized = getattr(self, 'serialized', 0) + 1
+        return super().serialize()
+
+
+class TestGenerationManifest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._casePath = Path(self._dir.name)
+        self._path = self._casePath / 'system' / 'testDict'
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _write(self, data):
+        manifest = GenerationManifest(self._casePath)
+        written = manifest.write(_Dictionary(self._casePath, data))
+        manifest.save()
+
+        return written, manifest
+
+    def testUnchanged(self):
+        self.assertTrue(self._write({'a': 1})[0])
+        mtime = self._path.stat().st_mtime_ns
+
+        written, manifest = self._write({'a': 1})
+        self.assertFalse(written)
+        self.assertEqual(mtime, self._path.stat().st_mtime_ns)
+        self.assertEqual([], manifest.changedFiles())
+        self.assertIn('No files changed', manifest.report())
+
+    def testChanged(self):
+        self._write({'a': 1})
+
+        written, manifest = self._write({'a': 2})
+        self.assertTrue(written)
+        self.assertEqual(['system/testDict'], manifest.changedFiles())
+        self.assertIn('a 2;', self._path.read_text())
+
+    def testSerializedOnce(self):
+        file = _Dictionary(self._casePath, {'a': 1})
+        self.assertTrue(GenerationManifest(self._casePath).write(file))
+
+        self.assertEqual(1, file.serialized)
+        self.assertEqual(file.serialize(), self._path.read_bytes())
+
+    def testModifiedByOthers(self):
+        self._write({'a': 1})
+        self._path.write_text('modified')
+
+        self.assertTrue(self._write({'a': 1})[0])
+        self.assertIn('a 1;', self._path.read_text())
+
+        self._path.unlink()
+        self.assertTrue(self._write({'a': 1})[0])
+        self.assertTrue(self._path.is_file())
+
+
+if __name__ == '__main__':
+    unittest.main()
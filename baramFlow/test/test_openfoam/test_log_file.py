@@ -0,0 +1,101 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from libbaram.log_file import LogFile, LINE_INDEX_STRIDE
+
+
+class TestLogFile(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name) / 'stdout.log'
+        self._lines = [f'Time = {i}' for i in range(LINE_INDEX_STRIDE * 3 + 5)]
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _append(self, text):
+        with self._path.open('a') as f:
+            f.write(text)
+
+    def testGrowingFile(self):
+        log = LogFile(self._path)
+        self.assertEqual(0, log.update())
+
+        self._append('\n'.join(self._lines[:40]) + '\nTime')
+        self.assertEqual(40, log.update())
+        self.assertEqual(self._lines[39], log.line(39))
+
+        self._append(' = 40\n' + '\n'.join(self._lines[41:]))
+        self.assertEqual(len(self._lines) - 41, log.update())
+        self.assertEqual(1, log.update(final=True))
+        self.assertEqual(self._lines, [log.line(i) for i in range(log.lineCount())])
+
+        log.close()
+
+    def testTruncatedFile(self):
+        self._append('\n'.join(self._lines) + '\n')
+        log = LogFile(self._path)
+        log.update()
+
+        self._path.write_text('Starting\n')
+        self.assertEqual('', log.line(90))
+        self.assertEqual(1, log.update())
+        self.assertEqual(1, log.lineCount())
+        self.assertEqual('Starting', log.line(0))
+
+        self._append('\n'.join(self._lines[:40]) + '\n')
+        self.assertEqual(40, log.update())
+        self.assertEqual(self._lines[39], log.line(40))
+
+        log.close()
+
+    def testReplacedFile(self):
+        self._append('\n'.join(self._lines) + '\n')
+        log = LogFile(self._path)
+        log.update()
+
+        replacement = self._path.with_name('new.log')
+        replacement.write_text('\n'.join(reversed(self._lines)) + '\n')
+        replacement.replace(self._path)
+        self.assertEqual(len(self._lines), log.update())
+        self.assertEqual(self._lines[-1], log.line(0))
+
+        log.close()
+
+    def testScanWhileReading(self):
+        self._append('\n'.join(self._lines[:40]) + '\n')
+        log = LogFile(self._path)
+        log.update()
+
+        self._append('\n'.join(self._lines[40:]) + '\n')
+        index = log.scan()
+        self.assertEqual(40, log.lineCount())
+        self.assertEqual(self._lines[39], log.line(39))
+        self.assertEqual(len(self._lines) - 40, log.apply(index))
+
+        self._path.unlink()
+        self._path.write_text('Starting\n')
+        index = log.scan()
+        self.assertEqual(len(self._lines), log.lineCount())
+        self.assertEqual(self._lines[90], log.line(90))  # The file replaced is still mapped
+        self.assertEqual(1, log.apply(index))
+        self.assertEqual('Starting', log.line(0))
+
+        log.close()
+
+    def testFind(self):
+        self._append('\n'.join(self._lines) + '\n')
+        log = LogFile(self._path)
+        log.update(final=True)
+
+        self.assertEqual(70, log.find('Time = 70', 0, log.lineCount()))
+        self.assertEqual(-1, log.find('Time = 70', 71, log.lineCount()))
+        self.assertEqual(79, log.find('Time = 7', 0, 80, backward=True))
+        self.assertEqual(-1, log.find('Courant', 0, log.lineCount()))
+
+        log.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from libbaram.openfoam.post_file_parser import PostFileTail, parsePostFile, columnLayout
+
+
+SOLVER_INFO_HEADER = (
+    '# Solver information\n'
+    '# Time          \tU_solver        \tUx_initial      \tUx_final        \tUx_iters        \tU_converged     \n'
+)
+
+
+class TestPostFileParser(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name) / 'solverInfo.dat'
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _append(self, text):
+        with self._path.open('a') as f:
+            f.write(text)
+
+    def testColumnLayout(self):
+        columns, numeric = columnLayout(['Time', 'total', 'p_solver', 'p'],
+                                        b'0.1\t(1 2 3)\tGAMG\tN/A')
+
+        self.assertEqual(['Time', 'total_x', 'total_y', 'total_z', 'p_solver', 'p'], columns)
+        self.assertEqual([True, True, True, True, False, True], numeric)
+
+    def testReadCompleteLinesOnly(self):
+        self._append(SOLVER_INFO_HEADER + '0.01\tDILUPBiCGStab\t1.0e+00\t8.5e-08\t1\tfalse\n0.02\tDILU')
+        tail = PostFileTail(self._path)
+
+        data = tail.read(select=lambda c: c == 'Time' or c.endswith('_initial'))
+        self.assertEqual(['Time', 'U_solver', 'Ux_initial', 'Ux_final', 'Ux_iters', 'U_converged'], tail.header)
+        self.assertEqual(['Time', 'Ux_initial'], list(data.keys()))
+        np.testing.assert_array_equal([0.01], data['Time'])
+        np.testing.assert_array_equal([1.0], data['Ux_initial'])
+
+        self.assertIsNone(tail.read())
+
+        self._append('PBiCGStab\t3.6e-01\t2.1e-13\t1\tfalse\n')
+        data = tail.read()
+        self.assertEqual(['Time', 'Ux_initial', 'Ux_final', 'Ux_iters'], list(data.keys()))
+        np.testing.assert_array_equal([0.02], data['Time'])
+        np.testing.assert_array_equal([0.36], data['Ux_initial'])
+        self.assertEqual(self._path.stat().st_size, tail.offset)
+
+        tail.close()
+
+    def testReadUpToSize(self):
+        self._append(SOLVER_INFO_HEADER + '0.01\tDILU\t1.0\t0.1\t1\tfalse\n')
+        size = self._path.stat().st_size
+        self._append('0.02\tDILU\t0.5\t0.1\t1\tfalse\n')
+
+        tail = PostFileTail(self._path)
+        np.testing.assert_array_equal([0.01], tail.read(size)['Time'])
+        np.testing.assert_array_equal([0.02], tail.read()['Time'])
+        tail.close()
+
+    def testVectorsAndNotAvailable(self):
+        self._append('# Probe 0 (0 0 0)\n'
+                     '# Time\n'
+                     '0.1 (1 2 3)\n'
+                     '0.2 (N/A N/A N/A)\n')
+
+        data = parsePostFile(self._path, 'U')
+
+        self.assertEqual(['Time', 'U_x', 'U_y', 'U_z'], list(data.keys()))
+        np.testing.assert_array_equal([1, np.nan], data['U_x'])
+        np.testing.assert_array_equal([3, np.nan], data['U_z'])
+
+
+if __name__ == '__main__':
+    unittest.main()
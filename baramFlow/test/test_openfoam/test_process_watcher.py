@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import psutil
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from libbaram.process import ProcessWatcher
+from libbaram.run import SOLVER_STATUS_FILE_NAME, readSolverRun
+
+
+class TestProcessWatcher(unittest.TestCase):
+    def setUp(self):
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+
+    def testExited(self):
+        process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(0.3)'])
+        watcher = ProcessWatcher(process.pid, psutil.Process(process.pid).create_time())
+
+        loop = QEventLoop()
+        watcher.exited.connect(loop.quit)
+        QTimer.singleShot(5000, loop.quit)
+
+        start = time.monotonic()
+        watcher.start()
+        loop.exec()
+        process.wait()
+
+        self.assertLess(time.monotonic() - start, 3)
+        self.assertIsNotNone(process.poll())
+
+    def testNotRunning(self):
+        exited = []
+        watcher = ProcessWatcher(psutil.Process().pid, 1)  # Another process with the pid
+        watcher.exited.connect(lambda: exited.append(True))
+        watcher.start()
+        QCoreApplication.processEvents()
+
+        self.assertEqual([True], exited)
+
+    def testReadSolverRun(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d)
+            self.assertIsNone(readSolverRun(path))
+
+            (path / SOLVER_STATUS_FILE_NAME).write_text('pid 10\nsolverPid 11\n')
+            self.assertFalse(readSolverRun(path).isEnded())
+
+            (path / SOLVER_STATUS_FILE_NAME).write_text('pid 10\nsolverPid 11\nexitCode 1\ncpuTime 2.5\nmaxRSS 300\n')
+            run = readSolverRun(path)
+            self.assertTrue(run.isEnded())
+            self.assertEqual((10, 1, 2.5, 300), (run.pid, run.exitCode, run.cpuTime, run.maxRSS))
+
+
+if __name__ == '__main__':
+    unittest.main()
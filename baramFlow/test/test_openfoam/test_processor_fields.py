@@ -0,0 +1,95 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.boundary_db import BoundaryDB
+from baramFlow.coredb.coredb_reader import CoreDBReader
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+from baramFlow.openfoam.boundary_conditions.boundary_condition import ProcessorFieldError
+from baramFlow.openfoam.boundary_conditions.u import U
+from baramFlow.openfoam.file_system import FileSystem
+from libbaram.openfoam.boundary_field import BoundaryFieldFile
+
+FIELD = '''FoamFile
+{
+    version     2.0;
+    format      ascii;
+    class       volVectorField;
+    location    "0.5";
+    object      U;
+}
+
+dimensions      [0 1 -1 0 0 0 0];
+
+internalField   nonuniform List<vector> 2((1 0 0) (2 0 0));
+
+boundaryField
+{
+    inlet
+    {
+        type            zeroGradient;
+    }
+    procBoundary0to1
+    {
+        type            processor;
+        value           nonuniform List<vector> 2((3 0 0) (4 0 0));
+    }
+}
+'''
+
+
+class TestProcessorFields(unittest.TestCase):
+    def setUp(self):
+        self._db = coredb.createDB()
+        MaterialDB.addNonMixture(self._db, 'air')
+        RegionDB.addRegion('')
+        bcid = self._db.addBoundaryCondition('', 'inlet', 'patch', 'velocityInlet')
+        xpath = BoundaryDB.getXPath(bcid) + '/velocityInlet/velocity'
+        self._db.setValue(xpath + '/specification', 'component')
+        self._db.setValue(xpath + '/component/profile', 'constant')
+        self._db.setValue(xpath + '/component/constant/x', '7')
+
+        self._reader = CoreDBReader()
+        self._reader.reloadCoreDB()
+        self._reader.setParameters()
+
+        self._dir = tempfile.TemporaryDirectory()
+        FileSystem.setCaseRoot(Path(self._dir.name))
+        self._path = Path(self._dir.name) / 'processor0' / '0.5' / 'U'
+        self._path.parent.mkdir(parents=True)
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+        coredb.destroy()
+
+    def testUpdateInPlace(self):
+        self._path.write_text(FIELD)
+
+        u = U(self._reader.getRegionProperties(''), '0.5', 0)
+        self.assertEqual(self._path, u.fullPath())
+        u.build().write()
+
+        content = self._path.read_text()
+        self.assertIn('internalField   nonuniform List<vector> 2((1 0 0) (2 0 0));', content)
+        self.assertIn('        type            processor;\n'
+                      '        value           nonuniform List<vector> 2((3 0 0) (4 0 0));', content)
+
+        fieldFile = BoundaryFieldFile.load(self._path)
+        self.assertEqual('fixedValue', fieldFile.get('inlet', 'type'))
+        self.assertEqual('uniform  (7 0 0)', fieldFile.get('inlet', 'value'))
+
+    def testFieldNotDecomposed(self):
+        with self.assertRaises(ProcessorFieldError):
+            U(self._reader.getRegionProperties(''), '0.5', 0).build()
+
+    def testPatchNotDecomposed(self):
+        self._path.write_text(FIELD.replace('inlet', 'outlet'))
+
+        with self.assertRaises(ProcessorFieldError):
+            U(self._reader.getRegionProperties(''), '0.5', 0).build()
+
+
+if __name__ == '__main__':
+    unittest.main()
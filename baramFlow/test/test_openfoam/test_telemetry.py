@@ -0,0 +1,57 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from libbaram.telemetry import ResourceSampler, readResourceUsage
+
+BUSY_RANK = '''
+import time
+end = time.time() + 2
+while time.time() < end:
+    pass
+'''
+
+
+class TestResourceSampler(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = Path(self._dir.name)
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def testSample(self):
+        process = subprocess.Popen([sys.executable, '-c', BUSY_RANK], env={**os.environ, 'OMPI_COMM_WORLD_RANK': '3'})
+        sampled = []
+
+        async def sample():
+            sampler = ResourceSampler(process.pid, self._path, interval=0.2)
+            sampler.sampled.connect(lambda path, samples: sampled.append(samples))
+            sampler.start()
+            await asyncio.sleep(1)
+            sampler.stop()
+
+        try:
+            asyncio.run(sample())
+        finally:
+            process.kill()
+            process.wait()
+
+        samples = readResourceUsage(self._path)
+        self.assertEqual(sum(len(s) for s in sampled), len(samples))
+        self.assertGreater(len(samples), 2)
+        self.assertEqual({3}, set(samples['rank'].tolist()))
+        self.assertGreater(samples['cpu'][-1], 10)
+        self.assertGreater(samples['rss'][-1], 0)
+        self.assertTrue((samples['time'][1:] >= samples['time'][:-1]).all())
+
+    def testNoSamples(self):
+        self.assertEqual(0, len(readResourceUsage(self._path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
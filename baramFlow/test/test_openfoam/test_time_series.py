@@ -0,0 +1,90 @@
+import unittest
+
+import numpy as np
+
+from baramFlow.openfoam.post_processing.time_series import TimeSeries, TimeSeriesDelta, RangeExtrema
+
+
+class TestTimeSeries(unittest.TestCase):
+    def setUp(self):
+        self.series = TimeSeries(capacity=4)
+
+    def testAppend(self):
+        self.series.append(np.array([1., 2., 3.]), {'p': np.array([.1, .2, .3])})
+        self.series.append(np.array([4., 5., 6.]), {'p': np.array([.4, .5, .6])})
+
+        self.assertEqual(6, len(self.series))
+        np.testing.assert_array_equal([1., 2., 3., 4., 5., 6.], self.series.times())
+        np.testing.assert_array_equal([.1, .2, .3, .4, .5, .6], self.series.column('p'))
+
+    def testRestartTruncation(self):
+        self.series.append(np.array([1., 2., 3., 4.]), {'p': np.array([.1, .2, .3, .4])})
+        start = self.series.append(np.array([3., 4.5]), {'p': np.array([.7, .8])})
+
+        self.assertEqual(2, start)
+        np.testing.assert_array_equal([1., 2., 3., 4.5], self.series.times())
+        np.testing.assert_array_equal([.1, .2, .7, .8], self.series.column('p'))
+
+    def testNewAndMissingColumns(self):
+        self.series.append(np.array([1., 2.]), {'p': np.array([.1, .2])})
+        self.series.append(np.array([3.]), {'k': np.array([.3])})
+
+        np.testing.assert_array_equal([.1, .2, np.nan], self.series.column('p'))
+        np.testing.assert_array_equal([np.nan, np.nan, .3], self.series.column('k'))
+
+    def testDelta(self):
+        self.series.append(np.array([1., 2., 3.]), {'p': np.array([.1, .2, .3])})
+        delta = self.series.delta('region', 1)
+
+        self.assertEqual('region', delta.key)
+        self.assertEqual(2., delta.start)
+        np.testing.assert_array_equal([.2, .3], delta.columns['p'])
+
+        target = TimeSeries()
+        target.append(np.array([1., 2., 5.]), {'p': np.array([.1, .9, .9])})
+        target.appendDelta(delta)
+        np.testing.assert_array_equal(self.series.times(), target.times())
+        np.testing.assert_array_equal(self.series.column('p'), target.column('p'))
+
+    def testToDataFrame(self):
+        self.series.appendDelta(TimeSeriesDelta('', np.array([1., 2.]), {'p': np.array([.1, .2])}))
+        df = self.series.toDataFrame()
+
+        self.assertEqual('Time', df.index.name)
+        self.assertEqual([.1, .2], df['p'].tolist())
+
+    def testExtrema(self):
+        self.series.append(np.array([1., 2., 3.]), {'p': np.array([.3, np.nan, .1])})
+
+        self.assertEqual((.1, .3), self.series.extrema('p'))
+        self.assertEqual((.3, .3), self.series.extrema('p', 0, 2))
+
+        self.series.append(np.array([3., 4., 5., 6., 7.]), {'p': np.array([.5, .9, .2, .4, .6])})
+        self.assertEqual((.2, .9), self.series.extrema('p'))
+        self.assertEqual((.3, .5), self.series.extrema('p', 0, 3))
+
+        self.series.truncate(4.)
+        self.assertEqual((.3, .5), self.series.extrema('p'))
+        self.assertEqual((np.inf, -np.inf), self.series.extrema('p', 1, 2))
+
+    def testExtremaPositive(self):
+        series = TimeSeries(capacity=4, positive=True)
+        series.append(np.array([1., 2., 3.]), {'p': np.array([0., .2, -1.])})
+
+        self.assertEqual((.2, .2), series.extrema('p'))
+
+    def testRangeExtremaMatchesScan(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=1000)
+        extrema = RangeExtrema(10)
+        for start in range(0, 1000, 70):
+            extrema.grow(start + 70)
+            extrema.update(start, values[start:start+70])
+
+        for start, end in rng.integers(0, 1000, size=(100, 2)):
+            start, end = min(start, end), max(start, end) + 1
+            self.assertEqual((values[start:end].min(), values[start:end].max()), extrema.query(start, end))
+
+
+if __name__ == '__main__':
+    unittest.main()
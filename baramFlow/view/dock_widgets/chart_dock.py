@@ -5,7 +5,6 @@ import typing
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import qasync
 from matplotlib import style as mplstyle
 from matplotlib import ticker
@@ -23,7 +22,9 @@ from baramFlow.coredb.general_db import GeneralDB
 from baramFlow.coredb.project import Project, SolverStatus
 from baramFlow.coredb.run_calculation_db import RunCalculationDB, TimeSteppingMethod
 from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.openfoam.post_processing.time_series import TimeSeries, TimeSeriesDelta
 from baramFlow.openfoam.solver_info_manager import SolverInfoManager
+from baramFlow.view.widgets.chart_lod import BlitManager, decimate, visibleRange
 
 SIDE_MARGIN = 0.05  # 5% margin on left and right
 
@@ -34,7 +35,7 @@ class ChartView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._data = None
+        self._data: typing.Dict[str, TimeSeries] = {}
 
         self._lines: typing.Dict[str, Line2D] = {}
 
@@ -43,6 +44,8 @@ class ChartView(QWidget):
 
         self._canvas = FigureCanvas(Figure(figsize=(5, 3)))
         self._canvas.mpl_connect('scroll_event', self.onScroll)
+        self._canvas.mpl_connect('resize_event', lambda event: self._updateLines())
+        self._blitManager = BlitManager(self._canvas)
 
         layout.addWidget(self._canvas)
 
@@ -88,11 +91,10 @@ class ChartView(QWidget):
             self.stopDrawing()
 
     def fitChart(self):
-        if self._data is None:
+        if not self._data:
             return
 
-        minX = float(self._data.first_valid_index())
-        maxX = float(self._data.last_valid_index())
+        minX, maxX = self._timeRange()
 
         if maxX <= minX:
             maxX = minX + 1
@@ -102,37 +104,48 @@ class ChartView(QWidget):
 
         self._axes.set_xlim([minX-margin, maxX+margin])
         self._adjustYRange(minX, maxX)
+        self._updateLines()
 
-        self._canvas.draw()
+        self._canvas.draw_idle()
 
-    def updated(self, data: pd.DataFrame):
-        self._data = data
+    def updated(self, deltas: typing.List[TimeSeriesDelta]):
+        newLines = False
+        for delta in deltas:
+            if delta.key not in self._data:
+                self._data[delta.key] = TimeSeries(positive=True)  # Residual value of "0" has been shown once
 
-        d = data.reset_index()  # "Time" is back to a column to serve as X value in numpy transpose below
+            series = self._data[delta.key]
+            series.appendDelta(delta)
 
-        for c in data.columns.values.tolist():
-            if c not in self._lines:
-                self._lines[c], = self._axes.plot('Time', c, '', label=c, data=d)
-                self._lines[c].set_linewidth(0.8)
-            else:
-                self._lines[c].set_data(d[['Time', c]].to_numpy().transpose())
+            for c in series.columns:
+                if c not in self._lines:
+                    self._lines[c], = self._axes.plot([], [], '', label=c)
+                    self._lines[c].set_linewidth(0.8)
+                    self._blitManager.add(self._lines[c])
+                    newLines = True
 
-        legend = self._axes.legend()
-        for h in legend.legendHandles:
-            h.set_linewidth(1.6)
+        if newLines:
+            legend = self._axes.legend()
+            for h in legend.legendHandles:
+                h.set_linewidth(1.6)
 
-        self._updateChart(1.0)
+        self._updateChart(1.0, newLines)
 
     def onScroll(self, event):
         scale = np.power(1.05, -event.step)
         self._updateChart(scale)
 
-    def _updateChart(self, scale: float):
-        if self._data is None:
+    def _timeRange(self):
+        timeMin = min(s.firstTime() for s in self._data.values())
+        timeMax = max(s.lastTime() for s in self._data.values())
+
+        return timeMin, timeMax
+
+    def _updateChart(self, scale: float, redraw=False):
+        if not self._data:
             return
 
-        timeMin = float(self._data.first_valid_index())
-        timeMax = float(self._data.last_valid_index())
+        timeMin, timeMax = self._timeRange()
 
         dataWidth = timeMax - timeMin
 
@@ -151,19 +164,41 @@ class ChartView(QWidget):
             maxX = timeMax
             minX = maxX - chartWidth
 
-        self._axes.set_xlim([minX-margin, maxX+margin])
+        limits = (self._axes.get_xlim(), self._axes.get_ylim())
 
+        self._axes.set_xlim([minX-margin, maxX+margin])
         self._adjustYRange(minX, maxX)
+        self._updateLines()
 
-        self._canvas.draw()  # force re-draw the next time the GUI refreshes
-        # self._canvas.draw_idle()
+        self._blitManager.update(redraw or limits != (self._axes.get_xlim(), self._axes.get_ylim()))
 
-    def _adjustYRange(self, minX: float, maxX: float):
-        data = self._data
+    def _updateLines(self):
+        """Set the lines to the points in the visible range, decimated to the width of the axes"""
+        left, right = self._axes.get_xlim()
+        columns = max(int(self._axes.bbox.width), 1)
+
+        for series in self._data.values():
+            times = series.times()
+            start, end = visibleRange(times, left, right)
+            for c in series.columns:
+                self._lines[c].set_data(*decimate(times[start:end], series.column(c)[start:end], columns))
 
-        d = data[(data.index >= minX) & (data.index <= maxX)]
-        minY = d[d > 0].min().min()  # Residual value of "0" has been shown once
-        maxY = d.max().max()
+    def _adjustYRange(self, minX: float, maxX: float):
+        minY = np.inf
+        maxY = -np.inf
+        for series in self._data.values():
+            start = series.indexOf(minX)
+            end = series.indexOf(maxX, side='right')
+            if start >= end:
+                continue
+
+            for c in series.columns:
+                low, high = series.extrema(c, start, end)
+                minY = min(minY, low)
+                maxY = max(maxY, high)
+
+        if minY > maxY:
+            return
 
         minY = minY / 10  # margin in log scale
         maxY = maxY * 10  # margin in log scale
@@ -172,8 +207,9 @@ class ChartView(QWidget):
 
     def _clear(self):
         self._axes.cla()
+        self._blitManager.clear()
 
-        self._data = None
+        self._data = {}
         self._lines = {}
 
         self._axes.grid(alpha=0.6, linestyle='--')
@@ -202,7 +238,7 @@ class ChartView(QWidget):
         maxX = dataWidth + margin
         self._axes.set_xlim([minX, maxX])
 
-        self._canvas.draw()
+        self._canvas.draw_idle()
 
 
 class ChartDock(CDockWidget):
@@ -5,14 +5,17 @@ from typing import Optional
 import asyncio
 import qasync
 
-from PySide6.QtWidgets import QVBoxLayout, QWidget, QPlainTextEdit, QCheckBox
-from PySide6.QtCore import Qt, QMargins, QEvent, QCoreApplication
-from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QWidget, QCheckBox, QLineEdit
+from PySide6.QtCore import QMargins, QEvent, QCoreApplication
 from PySide6QtAds import CDockWidget
 
+from libbaram.file_watcher import FileWatcher
+from libbaram.output_throttle import OutputThrottle
+
 from baramFlow.case_manager import CaseManager
 from baramFlow.coredb.project import Project, SolverStatus
 from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.view.widgets.log_view import LogView
 
 
 class ConsoleView(QWidget):
@@ -25,26 +28,30 @@ class ConsoleView(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(QMargins(0, 0, 0, 0))
 
-        self._textView = QPlainTextEdit()
-        self._textView.setReadOnly(True)
-        # small case may print 2,000 lines per second
-        self._textView.setMaximumBlockCount(100000)
-        self._textView.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        self._textView.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self._textView.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
-        self._textView.verticalScrollBar().setTracking(True)
-        charFormat = self._textView.currentCharFormat()
-        fixedFont = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
-        charFormat.setFont(fixedFont)
-        self._textView.setCurrentCharFormat(charFormat)
+        # Lines are read from the log files only when they are shown, so the size of the log does not matter
+        self._textView = LogView()
+        self._log = self._textView.logModel()
+
+        # Outputs of utilities are kept in memory. They are coalesced per frame within a budget
+        self._outputThrottle = OutputThrottle()
+        self._outputThrottle.released.connect(self._log.appendText)
 
         layout.addWidget(self._textView)
 
+        bottomLayout = QHBoxLayout()
+
         self._lineWrap = QCheckBox()
         self._lineWrap.setChecked(False)
         self._lineWrap.stateChanged.connect(self._lineWrapStateChanged)
 
-        layout.addWidget(self._lineWrap)
+        self._find = QLineEdit()
+        self._find.setClearButtonEnabled(True)
+        self._find.returnPressed.connect(self._findNext)
+
+        bottomLayout.addWidget(self._lineWrap)
+        bottomLayout.addStretch()
+        bottomLayout.addWidget(self._find)
+        layout.addLayout(bottomLayout)
 
         self._project = Project.instance()
         self._project.projectClosed.connect(self._projectClosed)
@@ -64,33 +71,30 @@ class ConsoleView(QWidget):
 
     def translate(self):
         self._lineWrap.setText(self.tr('Line-Wrap'))
+        self._find.setPlaceholderText(self.tr('Find'))
 
     def _lineWrapStateChanged(self):
-        if self._lineWrap.isChecked():
-            self._textView.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
-        else:
-            self._textView.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._textView.setLineWrap(self._lineWrap.isChecked())
+
+    def _findNext(self):
+        self._textView.find(self._find.text())
 
     async def readLogForever(self):
         root = FileSystem.caseRoot()
 
-        stdout = None
-        stderr = None
+        watcher = None
 
         try:
-            stdout = open(root/'stdout.log', 'r')
-            stderr = open(root/'stderr.log', 'r')
+            logs = [root/'stdout.log', root/'stderr.log']
+            for path in logs:
+                self._log.openFile(path)
+
+            watcher = FileWatcher(root, [path.name for path in logs])
 
             idleCount = 0
             while True:
-                hasOutput = False
-                while lines := stdout.readlines():
-                    self._textView.appendPlainText(''.join(lines).rstrip())
-                    hasOutput = True
-                while lines := stderr.readlines():
-                    self._textView.appendPlainText(''.join(lines).rstrip())
-                    hasOutput = True
-                if hasOutput:
+                changed = [path for path, _ in watcher.changedFiles()]
+                if changed and await self._log.update(changed):
                     await asyncio.sleep(0.1)
                     idleCount = 0
                     continue
@@ -104,20 +108,22 @@ class ConsoleView(QWidget):
         except asyncio.CancelledError:
             print('cancel console reading')
         finally:
-            if stdout:
-                stdout.close()
-            if stderr:
-                stderr.close()
+            if watcher:
+                watcher.close()
             self.readTask = None
 
     def append(self, text):
-        self._textView.appendPlainText(text)
+        self._outputThrottle.append(text)
+
+    def _clear(self):
+        self._outputThrottle.clear()
+        self._log.clear()
 
     @qasync.asyncSlot()
     async def _caseLoaded(self):
         if self.readTask is not None:
             self.readTask.cancel()
-        self._textView.clear()
+        self._clear()
 
         if CaseManager().isRunning():
             self.startCollecting()
@@ -129,7 +135,7 @@ class ConsoleView(QWidget):
         if self.readTask is not None:
             self.readTask.cancel()
         if self._textView is not None:
-            self._textView.clear()
+            self._clear()
 
     def _projectClosed(self):
         if self.readTask is not None:
@@ -138,22 +144,20 @@ class ConsoleView(QWidget):
     @qasync.asyncSlot()
     async def _solverStatusChanged(self, status, name, liveStatusChanged):
         if status == SolverStatus.NONE:
-            self._textView.clear()
+            self._clear()
         elif status == SolverStatus.RUNNING:
             self.startCollecting()
         else:
             self.stopCollecting()
 
     async def _readAllLog(self):
-        async def _readLog(path):
-            if path.is_file():
-                with path.open() as file:
-                    self._textView.appendPlainText(file.read())
-                    self._textView.verticalScrollBar().setValue(self._textView.verticalScrollBar().maximum())
-
         root = FileSystem.caseRoot()
-        await _readLog(root / 'stdout.log')
-        await _readLog(root / 'stderr.log')
+        for path in [root / 'stdout.log', root / 'stderr.log']:
+            self._log.openFile(path)
+
+        # Lines are indexed in a worker thread
+        await self._log.update(final=True)
+        self._textView.scrollToBottom()
 
     def closeEvent(self, event):
         self._textView = None
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+
+import numpy as np
+from matplotlib import style as mplstyle
+from matplotlib import ticker
+from matplotlib.backends.qt_compat import QtWidgets
+from matplotlib.backends.backend_qtagg import FigureCanvas
+from matplotlib.figure import Figure
+from PySide6.QtCore import QMargins, QCoreApplication, QEvent
+from PySide6.QtWidgets import QWidget
+from PySide6QtAds import CDockWidget
+
+from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.foam_file import FoamDictFile, FoamFileError
+from libbaram.telemetry import SAMPLE_DTYPE, readResourceUsage
+
+from baramFlow.case_manager import CaseManager
+from baramFlow.coredb.project import Project
+from baramFlow.openfoam.file_system import FileSystem
+from baramFlow.view.widgets.chart_lod import decimate
+
+mplstyle.use('fast')
+
+
+class ResourceView(QWidget):
+    """CPU usage of the ranks of the solver over time, and their memory and I/O
+
+    Ranks busy for shorter than the others show load imbalance of the decomposition.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._caseRoot = None
+        self._method = ''
+        self._samples = np.empty(0, SAMPLE_DTYPE)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(QMargins(0, 0, 0, 0))
+
+        self._canvas = FigureCanvas(Figure(figsize=(5, 3), layout='tight'))
+        self._canvas.mpl_connect('resize_event', lambda event: self._draw())
+        layout.addWidget(self._canvas)
+
+        self._cpuAxes, self._rankAxes = self._canvas.figure.subplots(1, 2, width_ratios=[3, 1])
+
+        self._draw()
+
+        Project.instance().projectClosed.connect(self._clear)
+        CaseManager().caseLoaded.connect(self._caseLoaded)
+        CaseManager().caseCleared.connect(self._clear)
+        CaseManager().resourcesSampled.connect(self._sampled)
+
+    def _caseLoaded(self):
+        self._caseRoot = Path(FileSystem.caseRoot()).resolve()
+        self._method = self._decompositionMethod()
+        self._samples = readResourceUsage(self._caseRoot)
+        self._draw()
+
+    def _clear(self):
+        self._caseRoot = None
+        self._method = ''
+        self._samples = np.empty(0, SAMPLE_DTYPE)
+        self._draw()
+
+    def _sampled(self, caseRoot: Path, samples: np.ndarray):
+        if caseRoot.resolve() != self._caseRoot:
+            return
+
+        self._samples = np.concatenate([self._samples, samples])
+        if self.isVisible():
+            self._draw()
+
+    def showEvent(self, event):
+        self._draw()
+        super().showEvent(event)
+
+    def _draw(self):
+        self._cpuAxes.cla()
+        self._rankAxes.cla()
+
+        self._cpuAxes.set_title(self._method, fontsize='small')
+        self._cpuAxes.set_xlabel(QCoreApplication.translate('ResourceView', 'Time [s]'))
+        self._cpuAxes.set_ylabel(QCoreApplication.translate('ResourceView', 'CPU [%]'))
+        self._cpuAxes.grid(alpha=0.6, linestyle='--')
+        self._cpuAxes.xaxis.set_major_formatter(ticker.FuncFormatter(lambda num, _: '{:g}'.format(num)))
+
+        ranks = np.unique(self._samples['rank'])
+        columns = max(int(self._cpuAxes.bbox.width), 1)
+        for rank in ranks:
+            samples = self._samples[self._samples['rank'] == rank]
+            line, = self._cpuAxes.plot(*decimate(samples['time'], samples['cpu'].astype(np.float64), columns),
+                                       label=str(rank))
+            line.set_linewidth(0.8)
+
+        self._cpuAxes.set_ylim(bottom=0)
+
+        if 0 < len(ranks) <= 16:
+            self._cpuAxes.legend(title=QCoreApplication.translate('ResourceView', 'Rank'), fontsize='x-small')
+
+        if len(ranks):
+            latest = [self._samples[self._samples['rank'] == rank][-1] for rank in ranks]
+            self._rankAxes.bar(ranks, [s['rss'] / 2 ** 20 for s in latest])
+            self._rankAxes.set_title(QCoreApplication.translate('ResourceView', 'Memory [MB]'), fontsize='small')
+            self._rankAxes.xaxis.set_major_locator(ticker.MaxNLocator(integer=True))
+
+            io = sum(int(s['readBytes']) + int(s['writeBytes']) for s in latest) / 2 ** 20
+            switches = sum(int(s['ctxSwitches']) for s in latest)
+            self._rankAxes.set_xlabel(QCoreApplication.translate(
+                'ResourceView', 'Rank\nI/O {0:.0f} MB, context switches {1}').format(io, switches), fontsize='small')
+
+        self._canvas.draw_idle()
+
+    def _decompositionMethod(self):
+        try:
+            method = FoamDictFile(
+                self._caseRoot / Directory.SYSTEM_DIRECTORY_NAME / 'decomposeParDict').content['method']
+        except (OSError, KeyError, FoamFileError):
+            return ''
+
+        return QCoreApplication.translate('ResourceView', 'Decomposition: {0}').format(method)
+
+
+class ResourceDock(CDockWidget):
+    def __init__(self):
+        super().__init__(self._title())
+
+        self._widget = ResourceView()
+        self.setWidget(self._widget)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.setWindowTitle(self._title())
+
+        super().changeEvent(event)
+
+    def _title(self):
+        return QCoreApplication.translate('ResourceDock', 'Resources')
@@ -9,6 +9,7 @@ from baramFlow.view.dock_widgets.chart_dock import ChartDock
 from baramFlow.view.dock_widgets.console_dock import ConsoleDock
 from baramFlow.view.dock_widgets.monitor_dock import MonitorDock
 from baramFlow.view.dock_widgets.rendering_dock import RenderingDock
+from baramFlow.view.dock_widgets.resource_dock import ResourceDock
 
 
 class DockView(QWidget):
@@ -22,6 +23,7 @@ class DockView(QWidget):
         self._consoleDock = ConsoleDock()
         self._renderingDock = RenderingDock()
         self._chartDock = ChartDock()
+        self._resourceDock = ResourceDock()
         self._monitorDock = MonitorDock()
 
         layout = QVBoxLayout(self)
@@ -31,6 +33,7 @@ class DockView(QWidget):
         self._dockArea = self._addDock(self._consoleDock)
         self._addDock(self._renderingDock)
         self._addDock(self._chartDock)
+        self._addDock(self._resourceDock)
         self._addDock(self._monitorDock)
 
     def consoleView(self):
@@ -54,6 +57,7 @@ class DockView(QWidget):
         self._consoleDock.widget().close()
         self._renderingDock.widget().close()
         self._chartDock.widget().close()
+        self._resourceDock.widget().close()
         self._monitorDock.widget().close()
 
         super().close()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.lines import Line2D
+
+
+def visibleRange(x: np.ndarray, left: float, right: float) -> (int, int):
+    """Index range of the points between "left" and "right", with one more point on each side
+
+    The points outside are included so that the line reaches the edges of the axes.
+    """
+    start = max(int(np.searchsorted(x, left, side='left')) - 1, 0)
+    end = min(int(np.searchsorted(x, right, side='right')) + 1, len(x))
+
+    return start, end
+
+
+def decimate(x: np.ndarray, y: np.ndarray, columns: int) -> (np.ndarray, np.ndarray):
+    """Min/max decimation of a line for a chart "columns" pixels wide
+
+    Points are grouped into at most "columns" buckets,
+    and the minimum and the maximum of each bucket are kept in their original order.
+    So, the drawn envelope is the same as the one of the full line,
+    while the number of points does not depend on the length of the line.
+
+    Args:
+        x: x values in increasing order
+        y: y values
+        columns: Number of pixel columns to draw the line on
+
+    Returns:
+        Decimated x and y
+    """
+    n = len(x)
+    if n <= columns * 2:
+        return x, y
+
+    size = -(-n // columns)     # Points in a bucket, ceil(n / columns)
+    buckets = -(-n // size)
+    padding = buckets * size - n
+
+    yy = np.concatenate([y, np.full(padding, np.nan)]).reshape(buckets, size)
+
+    # NaN should not be selected unless all the values in the bucket are NaN
+    iMin = np.argmin(np.where(np.isnan(yy), np.inf, yy), axis=1)
+    iMax = np.argmax(np.where(np.isnan(yy), -np.inf, yy), axis=1)
+
+    offsets = np.arange(buckets) * size
+    indices = np.sort(np.stack([iMin, iMax], axis=1), axis=1) + offsets[:, None]
+    indices = np.minimum(indices.ravel(), n - 1)
+
+    return x[indices], y[indices]
+
+
+class BlitManager:
+    """Redraws only the lines when the axes have not changed
+
+    Lines are animated artists, excluded from the normal draw of the figure.
+    The background rendered by the normal draw is cached and the lines are drawn over it.
+    """
+    def __init__(self, canvas: FigureCanvasBase):
+        self._canvas = canvas
+        self._background = None
+        self._artists = []
+
+        self._canvas.mpl_connect('draw_event', self._onDraw)
+
+    def add(self, artist: Line2D):
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+    def clear(self):
+        self._artists = []
+        self._background = None
+
+    def update(self, limitsChanged: bool):
+        """Schedule redraw of the chart
+
+        Args:
+            limitsChanged: The background, such as ticks and grids, should be drawn again
+        """
+        if limitsChanged or self._background is None:
+            self._canvas.draw_idle()
+        else:
+            self._canvas.restore_region(self._background)
+            self._drawArtists()
+            self._canvas.blit(self._canvas.figure.bbox)
+
+    def _onDraw(self, event):
+        self._background = self._canvas.copy_from_bbox(self._canvas.figure.bbox)
+        self._drawArtists()
+
+    def _drawArtists(self):
+        figure = self._canvas.figure
+        for artist in self._artists:
+            figure.draw_artist(artist)
@@ -19,6 +19,8 @@ from matplotlib.lines import Line2D
 from baramFlow.coredb import coredb
 from baramFlow.coredb.general_db import GeneralDB
 from baramFlow.coredb.run_calculation_db import TimeSteppingMethod, RunCalculationDB
+from baramFlow.openfoam.post_processing.time_series import TimeSeries
+from baramFlow.view.widgets.chart_lod import BlitManager, decimate, visibleRange
 
 SIDE_MARGIN = 0.05  # 5% margin between line end and right axis
 
@@ -27,7 +29,7 @@ class ChartWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._data = None
+        self._data = TimeSeries()
 
         self._lines: typing.Dict[str, Line2D] = {}
 
@@ -39,6 +41,8 @@ class ChartWidget(QWidget):
 
         self._canvas = FigureCanvas(Figure(figsize=(5, 3), layout='tight'))
         self._canvas.mpl_connect('scroll_event', self._onScroll)
+        self._canvas.mpl_connect('resize_event', lambda event: self._updateLines())
+        self._blitManager = BlitManager(self._canvas)
 
         layout.addWidget(self._canvas)
 
@@ -52,16 +56,16 @@ class ChartWidget(QWidget):
         self._logScale = True
         self._axes.set_yscale('log')
 
-    def setData(self, data):
-        self._data = data
-        self._updateChart(1.0)
+    def setData(self, data: pd.DataFrame):
+        self._data.clear()
+        self.appendData(data)
 
     def fitChart(self):
-        if self._data is None:
+        if not len(self._data):
             return
 
-        minX = float(self._data.first_valid_index())
-        maxX = float(self._data.last_valid_index())
+        minX = self._data.firstTime()
+        maxX = self._data.lastTime()
 
         dataWidth = maxX - minX
         if dataWidth == 0:
@@ -71,34 +75,37 @@ class ChartWidget(QWidget):
 
         self._axes.set_xlim([minX-margin, maxX+margin])
         self._adjustYRange(minX, maxX)
+        self._updateLines()
 
-        self._canvas.draw()
+        self._canvas.draw_idle()
 
     def appendData(self, data: pd.DataFrame):
-        if self._data is None:
-            self._data = data
-        else:
-            self._data = pd.concat([self._data[self._data.index < data.first_valid_index()], data])
+        if data.empty:
+            return
 
-        d = self._data.reset_index()  # "Time" is back to a column to serve as X value in numpy transpose below
+        self._data.append(data.index.to_numpy(dtype=np.float64),
+                          {c: data[c].to_numpy(dtype=np.float64) for c in data.columns})
 
-        for c in self._data.columns.values.tolist():
+        newLines = False
+        for c in self._data.columns:
             if c not in self._lines:
-                self._lines[c], = self._axes.plot('Time', c, '', label=c, data=d)
+                self._lines[c], = self._axes.plot([], [], '', label=c)
                 self._lines[c].set_linewidth(0.8)
-            else:
-                self._lines[c].set_data(d[['Time', c]].to_numpy().transpose())
+                self._blitManager.add(self._lines[c])
+                newLines = True
 
-        legend = self._axes.legend()
-        for h in legend.legendHandles:
-            h.set_linewidth(1.6)
+        if newLines:
+            legend = self._axes.legend()
+            for h in legend.legendHandles:
+                h.set_linewidth(1.6)
 
-        self._updateChart(1.0)
+        self._updateChart(1.0, newLines)
 
     def clear(self):
         self._axes.cla()
+        self._blitManager.clear()
 
-        self._data = None
+        self._data = TimeSeries()
         self._lines = {}
 
         self._axes.grid(alpha=0.6, linestyle='--')
@@ -128,14 +135,14 @@ class ChartWidget(QWidget):
         maxX = chartWidth + margin
         self._axes.set_xlim([minX, maxX])
 
-        self._canvas.draw()
+        self._canvas.draw_idle()
 
-    def _updateChart(self, scale: float):
-        if self._data is None:
+    def _updateChart(self, scale: float, redraw=False):
+        if not len(self._data):
             return
 
-        timeMin = float(self._data.first_valid_index())
-        timeMax = float(self._data.last_valid_index())
+        timeMin = self._data.firstTime()
+        timeMax = self._data.lastTime()
 
         dataWidth = timeMax - timeMin
 
@@ -154,23 +161,40 @@ class ChartWidget(QWidget):
             maxX = timeMax
             minX = maxX - chartWidth
 
-        self._axes.set_xlim([minX-margin, maxX+margin])
+        limits = (self._axes.get_xlim(), self._axes.get_ylim())
 
+        self._axes.set_xlim([minX-margin, maxX+margin])
         self._adjustYRange(minX, maxX)
+        self._updateLines()
 
-        self._canvas.draw()  # force re-draw the next time the GUI refreshes
-        # self._canvas.draw_idle()
+        self._blitManager.update(redraw or limits != (self._axes.get_xlim(), self._axes.get_ylim()))
+
+    def _updateLines(self):
+        """Set the lines to the points in the visible range, decimated to the width of the axes"""
+        times = self._data.times()
+        start, end = visibleRange(times, *self._axes.get_xlim())
+        columns = max(int(self._axes.bbox.width), 1)
+
+        for c, line in self._lines.items():
+            line.set_data(*decimate(times[start:end], self._data.column(c)[start:end], columns))
 
     def _onScroll(self, event):
         scale = np.power(1.05, -event.step)
         self._updateChart(scale)
 
     def _adjustYRange(self, minX: float, maxX: float):
-        data = self._data
+        start = self._data.indexOf(minX)
+        end = self._data.indexOf(maxX, side='right')
 
-        d = data[(data.index >= minX) & (data.index <= maxX)]
-        minY = d.min().min()
-        maxY = d.max().max()
+        minY = np.inf
+        maxY = -np.inf
+        for c in self._data.columns:
+            low, high = self._data.extrema(c, start, end)
+            minY = min(minY, low)
+            maxY = max(maxY, high)
+
+        if minY > maxY:
+            return
 
         if self._logScale:
             # value cannot be "0" or close to "0" in log scale chart
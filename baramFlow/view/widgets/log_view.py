@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+from bisect import bisect_right
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize
+from PySide6.QtGui import QFontDatabase, QKeySequence, QGuiApplication
+from PySide6.QtWidgets import QListView, QAbstractItemView
+
+from libbaram.log_file import LogFile
+
+
+class _TextLog:
+    """Lines appended by the application, such as outputs of utilities, kept in memory"""
+    def __init__(self):
+        self._lines = []
+
+    def lineCount(self):
+        return len(self._lines)
+
+    def line(self, index):
+        return self._lines[index]
+
+    def append(self, lines: [str]):
+        self._lines.extend(lines)
+
+    def find(self, text, start, end, backward=False):
+        indices = range(end - 1, start - 1, -1) if backward else range(start, end)
+        for i in indices:
+            if text in self._lines[i]:
+                return i
+
+        return -1
+
+    def close(self):
+        self._lines = []
+
+
+class LogModel(QAbstractListModel):
+    """Lines of log files and texts in the order they have arrived
+
+    Rows are mapped to runs of consecutive lines of a source, so that outputs of the sources are interleaved
+    without copying the lines.
+    Lines of files are read through LogFile only when the view shows them.
+    """
+    def __init__(self):
+        super().__init__()
+
+        self._files = {}
+        self._text = _TextLog()
+
+        self._sources = []      # Source of each run
+        self._firsts = []       # Index of the first line in the source of each run
+        self._ends = []         # Index of the row next to the last row of each run
+
+        self._charSize = QSize(8, 16)
+        self._maxLineLength = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return self._ends[-1] if self._ends and not parent.isValid() else 0
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            source, line = self._locate(index.row())
+            return source.line(line)
+        elif role == Qt.ItemDataRole.SizeHintRole and self._charSize is not None:
+            # Views use the size of the first row for all the rows if they have uniform item sizes
+            return QSize(self._charSize.width() * (self._maxLineLength + 1), self._charSize.height())
+
+        return None
+
+    def setCharSize(self, size: Optional[QSize]):
+        """Size of a character of the fixed font to give the size of rows, or None to let the view measure rows"""
+        self._charSize = size
+
+    def openFile(self, path: Path):
+        """Open the file, replacing the lines of the file opened before with the path
+
+        Log files are truncated when the solver starts again.
+        """
+        if file := self._files.get(path):
+            self._removeRuns(file)
+            file.close()
+
+        self._files[path] = LogFile(path)
+
+    async def update(self, paths=None, final=False) -> bool:
+        """Show lines appended to the files
+
+        Args:
+            paths: Files to update. All the files opened if None
+            final: The files will not grow any more
+
+        Returns:
+            True if any line has been added
+        """
+        updated = False
+        for path in self._files if paths is None else paths:
+            if file := self._files.get(path):
+                # Lines are indexed in a worker thread while the view reads the current index
+                index = await asyncio.to_thread(file.scan, final)
+                if self._files.get(path) is not file:  # Can be cleared while updating
+                    continue
+
+                count = file.apply(index)
+                if count:
+                    first = file.lineCount() - count
+                    if first == 0:  # Indexed again from the start as the file has been truncated
+                        self._removeRuns(file)
+
+                    self._maxLineLength = max(self._maxLineLength, file.maxLineLength())
+                    self._appendRun(file, first, count)
+                    updated = True
+
+        return updated
+
+    def appendText(self, text):
+        lines = text.splitlines() or ['']
+        first = self._text.lineCount()
+
+        self._text.append(lines)
+        self._maxLineLength = max(self._maxLineLength, max(len(line) for line in lines))
+        self._appendRun(self._text, first, len(lines))
+
+    def find(self, text: str, row: int, backward=False) -> int:
+        """Find the row containing the text, from the row in the direction, wrapping around at the end
+
+        Returns:
+            The row found, or -1 if not found
+        """
+        rowCount = self.rowCount()
+        if not text or rowCount == 0:
+            return -1
+
+        row %= rowCount
+        if backward:
+            ranges = [(0, row + 1), (row + 1, rowCount)]
+        else:
+            ranges = [(row, rowCount), (0, row)]
+
+        for start, end in ranges:
+            if (found := self._findInRange(text, start, end, backward)) >= 0:
+                return found
+
+        return -1
+
+    def text(self, rows: [int]) -> str:
+        return '\n'.join(self.data(self.index(row)) for row in sorted(rows))
+
+    def clear(self):
+        self.beginResetModel()
+
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+        self._text.close()
+
+        self._sources = []
+        self._firsts = []
+        self._ends = []
+        self._maxLineLength = 0
+
+        self.endResetModel()
+
+    def _appendRun(self, source, first, count):
+        rows = self.rowCount()
+        self.beginInsertRows(QModelIndex(), rows, rows + count - 1)
+
+        if self._sources and self._sources[-1] is source:
+            self._ends[-1] += count
+        else:
+            self._sources.append(source)
+            self._firsts.append(first)
+            self._ends.append(rows + count)
+
+        self.endInsertRows()
+
+    def _removeRuns(self, source):
+        if source not in self._sources:
+            return
+
+        self.beginResetModel()
+
+        runs = [(s, first, end - start) for s, first, start, end
+                in zip(self._sources, self._firsts, [0] + self._ends[:-1], self._ends) if s is not source]
+        self._sources = []
+        self._firsts = []
+        self._ends = []
+        for s, first, count in runs:
+            if self._sources and self._sources[-1] is s:    # Runs around the ones removed
+                self._ends[-1] += count
+            else:
+                self._sources.append(s)
+                self._firsts.append(first)
+                self._ends.append((self._ends[-1] if self._ends else 0) + count)
+
+        self.endResetModel()
+
+    def _locate(self, row):
+        run = bisect_right(self._ends, row)
+        start = self._ends[run - 1] if run > 0 else 0
+
+        return self._sources[run], self._firsts[run] + row - start
+
+    def _findInRange(self, text, start, end, backward):
+        if start >= end:
+            return -1
+
+        first = bisect_right(self._ends, start)
+        last = bisect_right(self._ends, end - 1)
+        runs = range(last, first - 1, -1) if backward else range(first, last + 1)
+
+        for run in runs:
+            runStart = self._ends[run - 1] if run > 0 else 0
+            lineStart = self._firsts[run] + max(start, runStart) - runStart
+            lineEnd = self._firsts[run] + min(end, self._ends[run]) - runStart
+
+            line = self._sources[run].find(text, lineStart, lineEnd, backward)
+            if line >= 0:
+                return runStart + line - self._firsts[run]
+
+        return -1
+
+
+class LogView(QListView):
+    """Virtualized view of a LogModel, which creates items only for the rows visible
+
+    It keeps following the end of the log while it is scrolled to the bottom.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._model = LogModel()
+        self._following = True
+
+        self.setModel(self._model)
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setTextElideMode(Qt.TextElideMode.ElideNone)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+
+        self._model.setCharSize(self._charSize())
+
+        self._model.rowsAboutToBeInserted.connect(self._rowsAboutToBeInserted)
+        self._model.rowsInserted.connect(self._rowsInserted)
+
+    def logModel(self) -> LogModel:
+        return self._model
+
+    def setLineWrap(self, wrap: bool):
+        # Wrapped rows have different heights and are laid out in batches not to block the GUI
+        self._model.setCharSize(None if wrap else self._charSize())
+        self.setWordWrap(wrap)
+        self.setUniformItemSizes(not wrap)
+        self.setLayoutMode(QListView.LayoutMode.Batched if wrap else QListView.LayoutMode.SinglePass)
+
+    def find(self, text: str, backward=False) -> bool:
+        current = self.currentIndex().row()
+        if current < 0:
+            row = self._model.rowCount() - 1 if backward else 0
+        else:
+            row = current - 1 if backward else current + 1
+
+        found = self._model.find(text, row, backward)
+        if found < 0:
+            return False
+
+        index = self._model.index(found)
+        self.setCurrentIndex(index)
+        self.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+
+        return True
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Copy):
+            rows = [index.row() for index in self.selectionModel().selectedIndexes()]
+            if rows:
+                QGuiApplication.clipboard().setText(self._model.text(rows))
+            return
+
+        super().keyPressEvent(event)
+
+    def _charSize(self):
+        fontMetrics = self.fontMetrics()
+        return QSize(fontMetrics.horizontalAdvance('M'), fontMetrics.lineSpacing())
+
+    def _rowsAboutToBeInserted(self):
+        scrollBar = self.verticalScrollBar()
+        self._following = scrollBar.value() == scrollBar.maximum()
+
+    def _rowsInserted(self):
+        if self._following:
+            self.scrollToBottom()
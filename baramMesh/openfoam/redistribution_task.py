@@ -133,7 +133,11 @@ class RedistributionTask(QObject):
             self.progress.emit(self.tr(f'Decomposition done.'))
 
     def _reportTimeProgress(self, msg):
-        if msg.startswith('Time = constant'):
-            self.progress.emit(self.tr(f'{self._reconstructMessage} (constant)'))
-        elif msg.startswith('Time = '):
-            self.progress.emit(self.tr(f'{self._reconstructMessage} ({msg.strip()}/{self._latestTime})'))
+        # Output comes in batches of lines. The last time in the batch is reported
+        for line in reversed(msg.splitlines()):
+            if line.startswith('Time = constant'):
+                self.progress.emit(self.tr(f'{self._reconstructMessage} (constant)'))
+                break
+            elif line.startswith('Time = '):
+                self.progress.emit(self.tr(f'{self._reconstructMessage} ({line.strip()}/{self._latestTime})'))
+                break
@@ -4,9 +4,9 @@
 from pathlib import Path
 
 from PyFoam.Basics.DataStructures import DictProxy
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict
 
 from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.foam_file import BoundaryDictFile
 
 from baramMesh.app import app
 from baramMesh.db.configurations_schema import CFDType
@@ -28,7 +28,7 @@ class RestoreCyclicPatchNames:
                 self._updateCyclicPatchNames(path)
 
     def _updateCyclicPatchNames(self, path: Path):
-        boundaryDict: ParsedBoundaryDict = ParsedBoundaryDict(str(path), treatBinaryAsASCII=True)
+        boundaryDict = BoundaryDictFile(path)
         boundaries = boundaryDict.content.keys()  # To save the order of boundaries
         for interface in app.db.getElements(
                 'geometry', lambda i, e: e['cfdType'] == CFDType.INTERFACE.value and not e['interRegion'] and not e['nonConformal']).values():
@@ -6,6 +6,8 @@ from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import QPlainTextEdit, QWidget, QVBoxLayout
 from PySide6QtAds import CDockWidget
 
+from libbaram.output_throttle import OutputThrottle
+
 
 class Console(QWidget):
     def __init__(self):
@@ -21,14 +23,18 @@ class Console(QWidget):
         layout.setContentsMargins(QMargins(0, 0, 0, 0))
         layout.addWidget(self._view)
 
+        self._outputThrottle = OutputThrottle()
+        self._outputThrottle.released.connect(self._view.appendPlainText)
+
     def clear(self):
+        self._outputThrottle.clear()
         self._view.clear()
 
     def append(self, text):
-        self._view.appendPlainText(text)
+        self._outputThrottle.append(text)
 
     def appendError(self, text):
-        self._view.appendPlainText(text)
+        self._outputThrottle.append(text)
 
 
 class ConsoleView(CDockWidget):
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from pathlib import Path
+
+SYSTEM_CPU_PATH = Path('/sys/devices/system/cpu')
+SYSTEM_NODE_PATH = Path('/sys/devices/system/node')
+
+
+def availableCores() -> list[list[int]]:
+    """Returns the CPUs this process can run on, one for each physical core, grouped by NUMA node
+
+    Hyper-threads of a core are not used for other processes, as solvers gain little from them.
+    CPUs are in a single group on the systems that do not tell their topology.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+
+    cores = {}
+    for cpu in cpus:
+        topology = SYSTEM_CPU_PATH / f'cpu{cpu}' / 'topology'
+        try:
+            core = (topology / 'physical_package_id').read_text().strip(), (topology / 'core_id').read_text().strip()
+        except OSError:
+            core = cpu
+        cores.setdefault(core, cpu)
+
+    nodes = {}
+    for path in SYSTEM_NODE_PATH.glob('node[0-9]*'):
+        try:
+            for cpu in parseCPUList((path / 'cpulist').read_text()):
+                nodes[cpu] = int(path.name[4:])
+        except OSError:
+            pass
+
+    groups = {}
+    for cpu in sorted(cores.values()):
+        groups.setdefault(nodes.get(cpu, 0), []).append(cpu)
+
+    return [groups[node] for node in sorted(groups)]
+
+
+def partitionCores(size: int, groups: list[list[int]] = None) -> list[list[int]]:
+    """Partitions the cores into sets of the size, to run processes side by side
+
+    Sets are made within NUMA nodes first, and of the cores left in the nodes after that.
+
+    Args:
+        size: Number of cores in a set
+        groups: Cores grouped by NUMA node, availableCores() if None
+
+    Returns:
+        Sets of cores, which are empty if there are fewer cores than the size
+    """
+    if groups is None:
+        groups = availableCores()
+
+    sets = []
+    rest = []
+    for cores in groups:
+        count = len(cores) // size * size
+        sets.extend(cores[i:i + size] for i in range(0, count, size))
+        rest.extend(cores[count:])
+
+    sets.extend(rest[i:i + size] for i in range(0, len(rest) // size * size, size))
+
+    return sets
+
+
+def parseCPUList(text: str) -> list[int]:
+    """Parses the list of CPUs in the format of Linux, like "0-3,8,10-11" """
+    cpus = []
+    for part in text.strip().split(','):
+        if part:
+            first, _, last = part.partition('-')
+            cpus.extend(range(int(first), int(last or first) + 1))
+
+    return cpus
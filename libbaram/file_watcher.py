@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import platform
+import struct
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o00004000
+IN_CLOEXEC = 0o02000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+# Directory timestamps can be coarser than the time between a scan and a following change.
+# Directories modified more recently than this are scanned again on the next poll.
+RACY_MTIME_NS = 1_000_000_000
+
+
+class _Inotify:
+    _libc = None
+
+    def __init__(self):
+        if _Inotify._libc is None:
+            _Inotify._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._paths = {}
+
+    def addWatch(self, path: Path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed on {path}')
+
+        self._paths[wd] = path
+
+    def read(self):
+        """Drain pending events without blocking
+
+        Returns:
+            (watched directory, entry name, mask) tuples. "name" is empty for events on the directory itself.
+        """
+        events = []
+        while True:
+            try:
+                buffer = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b'\0')
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    events.append((None, '', mask))
+                elif wd in self._paths:
+                    events.append((self._paths[wd], os.fsdecode(name), mask))
+                    if mask & IN_IGNORED:
+                        del self._paths[wd]
+
+        return events
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._paths = {}
+
+
+class FileWatcher:
+    """Reports files under a directory that are new or have grown since the previous poll
+
+    Files are selected by glob patterns relative to the root, one glob per path component,
+    such as "*/solverInfo_*/*/solverInfo*.dat".
+    Linux inotify tells which directories and files have changed.
+    Otherwise, directories are listed again only when their mtime has changed,
+    and only the files already found are stat-ed.
+    In both cases, the cost of a poll does not depend on the number of unchanged entries in the tree.
+    """
+    def __init__(self, root: Path, patterns: [str], useInotify=True):
+        self._root = Path(root)
+        self._patterns = [tuple(Path(p).parts) for p in patterns]
+
+        self._dirs: {Path: [tuple]} = {}    # Tracked directory and the patterns remaining below it
+        self._mtimes: {Path: int} = {}
+        self._files: {Path: int} = {}       # Tracked file and its size reported last
+
+        self._inotify = None
+        if useInotify and platform.system() == 'Linux':
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.info(f'inotify is not available, falling back to polling: {e}')
+
+    @property
+    def root(self):
+        return self._root
+
+    def changedFiles(self) -> [(Path, int)]:
+        """Files created or grown since the last call, with their current size
+
+        All the files matching the patterns are reported on the first call.
+        """
+        if self._root not in self._dirs:
+            if not self._root.is_dir():
+                return []
+
+            candidates = set(self._addDirectory(self._root, self._patterns))
+        elif self._inotify:
+            candidates = self._changedByEvents()
+        else:
+            candidates = self._changedByStat()
+
+        changed = []
+        for path in candidates:
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                self._files.pop(path, None)
+                continue
+
+            if self._files.get(path) != size:
+                self._files[path] = size
+                changed.append((path, size))
+
+        return changed
+
+    def setSize(self, path: Path, size: int):
+        """Set the size consumed by the caller, so that the file is reported only when it grows beyond the size"""
+        self._files[path] = size
+
+    def files(self) -> {Path: int}:
+        return self._files
+
+    def close(self):
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+
+    def _changedByEvents(self):
+        candidates = set()
+        dirty = set()
+
+        try:
+            events = self._inotify.read()
+        except OSError as e:
+            logger.info(f'Reading inotify events failed, falling back to polling: {e}')
+            self._inotify.close()
+            self._inotify = None
+            return self._changedByStat()
+
+        for directory, name, mask in events:
+            if directory is None:   # Event queue overflowed. Some events are lost.
+                dirty.update(self._dirs)
+                candidates.update(self._files)
+            elif mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                self._removeDirectory(directory)
+            elif mask & (IN_CREATE | IN_MOVED_TO | IN_DELETE | IN_MOVED_FROM):
+                dirty.add(directory)
+            elif name:
+                path = directory / name
+                if path in self._files:
+                    candidates.add(path)
+
+        for directory in dirty:
+            if directory in self._dirs:
+                candidates.update(self._scan(directory))
+
+        return candidates
+
+    def _changedByStat(self):
+        candidates = set(self._files)
+
+        for directory in list(self._dirs):
+            if directory not in self._dirs:  # Removed while this loop is running
+                continue
+
+            try:
+                mtime = directory.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._removeDirectory(directory)
+                continue
+
+            if self._mtimes.get(directory) != mtime:
+                candidates.update(self._scan(directory))
+
+        return candidates
+
+    def _addDirectory(self, directory: Path, patterns: [tuple]):
+        if self._inotify:
+            try:
+                self._inotify.addWatch(directory)
+            except OSError as e:    # Usually, the limit of the number of watches is reached
+                logger.info(f'Watching {directory} failed, falling back to polling: {e}')
+                self._inotify.close()
+                self._inotify = None
+
+        self._dirs[directory] = patterns
+
+        return self._scan(directory)
+
+    def _scan(self, directory: Path) -> [Path]:
+        """Find new entries in the directory
+
+        Returns:
+            New files in the directory and in its new subdirectories
+        """
+        patterns = self._dirs[directory]
+        found = []
+
+        try:
+            mtime = directory.stat().st_mtime_ns
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            self._removeDirectory(directory)
+            return found
+
+        self._mtimes[directory] = None if time.time_ns() - mtime < RACY_MTIME_NS else mtime
+
+        for entry in entries:
+            path = directory / entry.name
+            if path in self._files or path in self._dirs:
+                continue
+
+            remaining = [p[1:] for p in patterns if fnmatchcase(entry.name, p[0])]
+            if not remaining:
+                continue
+
+            if any(len(p) == 0 for p in remaining) and entry.is_file():
+                found.append(path)
+            elif subpatterns := [p for p in remaining if len(p) > 0]:
+                if entry.is_dir():
+                    found.extend(self._addDirectory(path, subpatterns))
+
+        return found
+
+    def _removeDirectory(self, directory: Path):
+        for d in [d for d in self._dirs if d == directory or directory in d.parents]:
+            del self._dirs[d]
+            self._mtimes.pop(d, None)
+
+        for f in [f for f in self._files if directory in f.parents]:
+            del self._files[f]
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import mmap
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+# Offset of every this-th line is kept. Other lines are found by scanning from there.
+LINE_INDEX_STRIDE = 32
+INDEXING_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class _Index:
+    """Mapping of a file and the offsets of its lines, which is not changed once made current in LogFile"""
+    def __init__(self):
+        self.file = None
+        self.fileId = None          # Device and inode of the file opened
+        self.mmap: Optional[mmap.mmap] = None
+        self.size = 0               # Size of the file scanned for newlines
+
+        self.checkpoints = np.zeros(1024, dtype=np.int64)    # Offsets of lines 0, STRIDE, 2*STRIDE, ...
+        self.checkpointCount = 1
+        self.lineCount = 0          # Number of complete lines
+        self.lastLineStart = 0      # Offset of the line not terminated yet
+        self.maxLineLength = 0
+        self.final = False
+
+    def copy(self):
+        index = object.__new__(_Index)
+        vars(index).update(vars(self))
+
+        return index
+
+    def open(self, path):
+        self.file = open(path, 'rb')
+        stat = os.fstat(self.file.fileno())
+        self.fileId = (stat.st_dev, stat.st_ino)
+
+    def count(self):
+        if self.final and self.lastLineStart < self.size:
+            return self.lineCount + 1
+
+        return self.lineCount
+
+    def truncated(self):
+        # Pages of the mapping beyond the end of the file cannot be accessed
+        return os.fstat(self.file.fileno()).st_size < self.size
+
+    def addLines(self, newlines: np.ndarray):
+        if newlines.size:
+            starts = np.concatenate(([self.lastLineStart], newlines[:-1] + 1))
+            self.maxLineLength = max(self.maxLineLength, int((newlines - starts).max()))
+
+            # Line numbers of the lines starting right after the newlines
+            numbers = np.arange(self.lineCount + 1, self.lineCount + 1 + newlines.size)
+            self._addCheckpoints(newlines[numbers % LINE_INDEX_STRIDE == 0] + 1)
+
+            self.lineCount += newlines.size
+            self.lastLineStart = int(newlines[-1]) + 1
+
+    def lineOffset(self, index: int) -> int:
+        offset = int(self.checkpoints[index // LINE_INDEX_STRIDE])
+        for _ in range(index % LINE_INDEX_STRIDE):
+            offset = self.mmap.find(b'\n', offset, self.size) + 1
+
+        return offset
+
+    def _addCheckpoints(self, offsets: np.ndarray):
+        # Slots after the count are not read through the indices made before, and can be filled in place
+        required = self.checkpointCount + offsets.size
+        if required > len(self.checkpoints):
+            capacity = len(self.checkpoints)
+            while capacity < required:
+                capacity *= 2
+
+            checkpoints = np.zeros(capacity, dtype=np.int64)
+            checkpoints[:self.checkpointCount] = self.checkpoints[:self.checkpointCount]
+            self.checkpoints = checkpoints
+
+        self.checkpoints[self.checkpointCount:required] = offsets
+        self.checkpointCount = required
+
+
+class LogFile:
+    """Memory-mapped text file with an index of line offsets
+
+    Only the offset of every LINE_INDEX_STRIDE-th line is kept,
+    so the index takes a fraction of a byte per line and a line is found by scanning a few lines at most.
+    The file can be growing, such as a log the solver is writing,
+    and "update()" indexes the lines appended since the last call.
+    If the file is truncated or replaced, as the solver starts again, it is indexed again from the start.
+    Lines are decoded only when they are requested.
+
+    Lines can be indexed by "scan()" in a worker thread while they are read,
+    and the new index is made current by "apply()" in the thread reading them.
+    """
+    def __init__(self, path: Path):
+        self._path = path
+        self._index = _Index()
+
+    @property
+    def path(self):
+        return self._path
+
+    def lineCount(self) -> int:
+        """Number of lines indexed
+
+        A line without newline at the end of the file is counted only after "update(final=True)".
+        """
+        return self._index.count()
+
+    def maxLineLength(self) -> int:
+        """Length of the longest line indexed, in bytes"""
+        return self._index.maxLineLength
+
+    def update(self, final=False) -> int:
+        """Index lines appended since the last call
+
+        Args:
+            final: The file will not grow any more. The last line is counted even if it does not end with newline
+
+        Returns:
+            Number of lines added, or the number of lines if the file has been indexed again from the start
+        """
+        return self.apply(self.scan(final))
+
+    def scan(self, final=False) -> _Index:
+        """Returns a new index with the lines appended since the index applied, leaving the current one as it is
+
+        It can take a while for a large file and may be called in a worker thread.
+        """
+        index = self._index.copy()
+        try:
+            if index.file is None:
+                index.open(self._path)
+
+            stat = self._path.stat()
+            if stat.st_size < index.size or (stat.st_dev, stat.st_ino) != index.fileId:
+                index = _Index()
+                index.open(self._path)
+                stat = os.fstat(index.file.fileno())
+        except FileNotFoundError:
+            stat = None
+
+        if stat is not None and stat.st_size > index.size:
+            start = index.size
+            index.mmap = mmap.mmap(index.file.fileno(), 0, access=mmap.ACCESS_READ)
+            index.size = len(index.mmap)
+
+            for position in range(start, index.size, INDEXING_CHUNK_SIZE):
+                length = min(INDEXING_CHUNK_SIZE, index.size - position)
+                newlines = np.flatnonzero(
+                    np.frombuffer(index.mmap, dtype=np.uint8, count=length, offset=position) == ord('\n')) + position
+                index.addLines(newlines)
+
+        index.final = final
+        if final:
+            index.maxLineLength = max(index.maxLineLength, index.size - index.lastLineStart)
+
+        return index
+
+    def apply(self, index: _Index) -> int:
+        """Makes the index made by "scan()" current
+
+        Returns:
+            Number of lines added, or the number of lines if the file has been indexed again from the start
+        """
+        count = self._index.count() if index.file is self._index.file else 0
+        self._index = index
+
+        return index.count() - count
+
+    def line(self, index: int) -> str:
+        """Text of the line, or an empty string if the file has been truncated and is not indexed again yet"""
+        current = self._index
+        if current.mmap is None or current.truncated():
+            return ''
+
+        start = current.lineOffset(index)
+        end = current.mmap.find(b'\n', start, current.size)
+        if end < 0:
+            end = current.size
+
+        return current.mmap[start:end].decode('UTF-8', errors='replace').rstrip('\r')
+
+    def find(self, text: str, start: int, end: int, backward=False) -> int:
+        """Find a line containing the text in lines [start, end)
+
+        Args:
+            text: Text to find
+            start: Index of the first line to search
+            end: Index of the line to stop searching at
+            backward: Find the last one in the range
+
+        Returns:
+            Index of the line found, or -1 if not found.
+        """
+        current = self._index
+        if start >= end or current.mmap is None or current.truncated():
+            return -1
+
+        needle = text.encode('UTF-8')
+        startOffset = current.lineOffset(start)
+        if current.final and end >= current.count():
+            endOffset = current.size
+        else:
+            endOffset = current.lineOffset(min(end, current.lineCount))
+
+        if backward:
+            position = current.mmap.rfind(needle, startOffset, endOffset)
+        else:
+            position = current.mmap.find(needle, startOffset, endOffset)
+
+        if position < 0:
+            return -1
+
+        checkpoint = int(np.searchsorted(current.checkpoints[:current.checkpointCount], position, side='right')) - 1
+        offset = int(current.checkpoints[checkpoint])
+
+        return checkpoint * LINE_INDEX_STRIDE + current.mmap[offset:position].count(b'\n')
+
+    def close(self):
+        # The file and its mapping can be in use by readers and "scan()" in other threads.
+        # They are released when unreferenced.
+        self._index = _Index()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gzip
+import re
+from pathlib import Path
+from typing import Optional
+
+from libbaram.openfoam.foam_file import foamString
+
+
+_SPACE = re.compile(rb'\s*')
+_WORD = re.compile(rb'[^\s{}();"]+')
+_INTEGER = re.compile(rb'[0-9]+')
+_FORMAT = re.compile(rb'\bformat\s+(\w+)\s*;')
+_ARCH = re.compile(rb'\barch\s+"([^"]*)"')
+_LABEL_SIZE = re.compile(rb'label=(\d+)')
+_SCALAR_SIZE = re.compile(rb'scalar=(\d+)')
+_INDENT = re.compile(rb'[ \t]*')
+
+BOUNDARY_FIELD = b'boundaryField'
+
+# Number of components of list elements
+_COMPONENTS = {b'label': 1, b'scalar': 1, b'vector': 3, b'sphericalTensor': 1, b'symmTensor': 6, b'tensor': 9}
+
+
+class _SyntaxError(Exception):
+    pass
+
+
+class _Entry:
+    def __init__(self, key: Optional[bytes], start, valueStart, end):
+        self.key = key  # None for directives like "#includeEtc"
+        self.start = start
+        self.valueStart = valueStart
+        self.end = end
+
+
+class _Scanner:
+    """Finds the extents of entries in FoamFile bytes without interpreting values
+
+    Lists with their sizes and element types, like "nonuniform List<vector> 1000 (...)", are skipped at once,
+    which is the only way to get over binary lists.
+    """
+    def __init__(self, data: bytes):
+        self._data = data
+
+        header = data[:data.find(b'}') + 1]
+        self._binary = (m := _FORMAT.search(header)) is not None and m.group(1) == b'binary'
+        arch = m.group(1) if (m := _ARCH.search(header)) else b''
+        self._labelSize = int(m.group(1)) // 8 if (m := _LABEL_SIZE.search(arch)) else 4
+        self._scalarSize = int(m.group(1)) // 8 if (m := _SCALAR_SIZE.search(arch)) else 8
+
+    def skipSpace(self, pos):
+        data = self._data
+        while True:
+            pos = _SPACE.match(data, pos).end()
+            if data.startswith(b'//', pos):
+                pos = data.find(b'\n', pos)
+                if pos < 0:
+                    return len(data)
+            elif data.startswith(b'/*', pos):
+                pos = data.find(b'*/', pos)
+                if pos < 0:
+                    raise _SyntaxError
+                pos += 2
+            else:
+                return pos
+
+    def token(self, pos):
+        """Returns the next token and the position after it, or None at the end"""
+        data = self._data
+        pos = self.skipSpace(pos)
+        if pos >= len(data):
+            return None, pos
+
+        c = data[pos:pos + 1]
+        if c in b'{}();':
+            return c, pos + 1
+
+        if c == b'"':
+            end = pos
+            while True:
+                end = data.find(b'"', end + 1)
+                if end < 0:
+                    raise _SyntaxError
+                if data[end - 1:end] != b'\\':
+                    return data[pos:end + 1], end + 1
+
+        m = _WORD.match(data, pos)
+        return m.group(), m.end()
+
+    def entries(self, pos):
+        """Returns the entries of the dictionary starting at pos, after "{", and the position after its "}" """
+        entries = []
+        while True:
+            start = self.skipSpace(pos)
+            token, end = self.token(start)
+            if token is None or token in (b'{', b'(', b')'):
+                raise _SyntaxError
+
+            if token == b'}':
+                return entries, end
+            elif token == b';':
+                pos = end
+            elif token.startswith(b'#'):
+                argument, end = self.token(end)
+                if argument == b'(':
+                    end = self._skip(end, b')')
+                entries.append(_Entry(None, start, end, end))
+                pos = end
+            else:
+                pos = self.valueEnd(end)
+                entries.append(_Entry(token, start, self.skipSpace(end), pos))
+
+    def valueEnd(self, pos):
+        """Returns the position after the value starting at pos, which ends with ";", or is a dictionary"""
+        token, end = self.token(pos)
+        if token == b'{':
+            return self._skip(end, b'}')
+
+        return self._skip(pos, b';')
+
+    def _skip(self, pos, stop):
+        depth = 0
+        previous = elementType = None
+        while True:
+            token, pos = self.token(pos)
+            if token is None:
+                raise _SyntaxError
+
+            if depth == 0 and token == stop:
+                return pos
+
+            if token == b'(' and elementType is not None and previous is not None and _INTEGER.fullmatch(previous):
+                pos = self._listEnd(pos, int(previous), elementType)
+                elementType = None
+            elif token in (b'(', b'{'):
+                depth += 1
+            elif token in (b')', b'}'):
+                depth -= 1
+                if depth < 0:
+                    raise _SyntaxError
+            elif token.startswith(b'List<') and token.endswith(b'>'):
+                elementType = token[5:-1]
+
+            previous = token
+
+    def _listEnd(self, pos, count, elementType):
+        """Returns the position after the list of the size, whose elements start at pos"""
+        data = self._data
+        components = _COMPONENTS.get(elementType)
+        if components is None:
+            return self._skip(pos, b')')
+
+        if self._binary:
+            size = self._labelSize if elementType == b'label' else self._scalarSize * components
+            end = pos + count * size
+            if data[end:end + 1] == b')':
+                return end + 1
+            # Lists can be written in ASCII even in binary files, by hand or by other tools
+
+        if elementType in (b'label', b'scalar'):
+            end = data.find(b')', pos)
+        else:
+            end = pos
+            for _ in range(count):
+                end = data.find(b')', end) + 1
+                if end == 0:
+                    raise _SyntaxError
+            end = data.find(b')', end)
+
+        if data[end:end + 1] != b')':
+            raise _SyntaxError
+
+        return end + 1
+
+
+class BoundaryFieldFile:
+    """Field file whose patches in boundaryField are updated without parsing the other parts
+
+    internalField, which is as large as the mesh, is copied as it is in ASCII or binary format.
+    Files compressed with gzip are read and written in gzip.
+    """
+    def __init__(self, path: Path, data: bytes, scanner: _Scanner, start, end, patches: list[_Entry]):
+        self._path = path
+        self._data = data
+        self._scanner = scanner
+        self._start = start  # After "{" of boundaryField
+        self._end = end  # At "}" of boundaryField
+        self._patches = {p.key.decode(): p for p in patches if p.key is not None}
+        self._updates: dict[str, dict] = {}
+        self._patchEntries = {}
+
+    @classmethod
+    def exists(cls, path: Path):
+        return path.is_file() or cls._compressedPath(path).is_file()
+
+    @classmethod
+    def load(cls, path: Path):
+        """Loads the field file at the path, or the one compressed
+
+        Returns:
+            None if the file does not exist, or boundaryField is not found in it
+        """
+        if not path.is_file():
+            path = cls._compressedPath(path)
+            if not path.is_file():
+                return None
+
+        data = path.read_bytes()
+        if path.suffix == '.gz':
+            data = gzip.decompress(data)
+
+        scanner = _Scanner(data)
+
+        # boundaryField is the last entry of field files.
+        # Searching backward, it is found without going through internalField.
+        end = len(data)
+        while (start := data.rfind(BOUNDARY_FIELD, 0, end)) >= 0:
+            end = start
+            if start > 0 and data[start - 1:start] not in b' \t\r\n;}':
+                continue
+
+            try:
+                token, pos = scanner.token(start + len(BOUNDARY_FIELD))
+                if token != b'{':
+                    continue
+
+                patches, blockEnd = scanner.entries(pos)
+                if scanner.skipSpace(blockEnd) == len(data):
+                    return cls(path, data, scanner, pos, blockEnd - 1, patches)
+            except _SyntaxError:
+                continue
+
+        return None
+
+    def patchNames(self):
+        return list(self._patches.keys())
+
+    def get(self, patch: str, key: str) -> Optional[str]:
+        """Returns the value of the entry in the patch as written, or None if it does not exist"""
+        if entry := self._entries(patch).get(key):
+            return self._data[entry.valueStart:entry.end].rstrip(b';').strip().decode('latin-1')
+
+        return None
+
+    def update(self, patch: str, entries: dict):
+        """Sets the entries of the patch, keeping the other entries
+
+        The patch is added if it does not exist.
+        """
+        self._updates.setdefault(patch, {}).update(entries)
+
+    def writeFile(self):
+        data = self._data
+        chunks = [data[:self._start]]
+        pos = self._start
+        # Spliced in the order of the file, not of the updates
+        updated = sorted((name for name in self._updates if name in self._patches),
+                         key=lambda name: self._patches[name].start)
+        for name in updated:
+            patch = self._patches[name]
+            chunks.append(data[pos:patch.start])
+            chunks.append(self._updatedPatch(patch, self._updates[name]))
+            pos = patch.end
+
+        chunks.append(data[pos:self._end])
+        for name, entries in self._updates.items():
+            if name not in self._patches:
+                chunks.append(f'    {name}\n    {{\n{self._render(entries, b"        ")}    }}\n'.encode())
+        chunks.append(data[self._end:])
+
+        data = b''.join(chunks)
+        if self._path.suffix == '.gz':
+            data = gzip.compress(data)
+
+        self._path.write_bytes(data)
+
+    def _entries(self, patch):
+        if patch not in self._patchEntries:
+            self._patchEntries[patch] = {}
+            if entry := self._patches.get(patch):
+                if self._data[entry.valueStart:entry.valueStart + 1] == b'{':
+                    entries, _ = self._scanner.entries(entry.valueStart + 1)
+                    self._patchEntries[patch] = {e.key.decode(): e for e in entries if e.key is not None}
+
+        return self._patchEntries[patch]
+
+    def _updatedPatch(self, patch: _Entry, updates: dict):
+        data = self._data
+        entries = self._entries(patch.key.decode())
+
+        indent = None
+        for e in entries.values():
+            indent = _INDENT.match(data, data.rfind(b'\n', 0, e.start) + 1).group()
+            break
+        if indent is None:
+            indent = _INDENT.match(data, data.rfind(b'\n', 0, patch.start) + 1).group() + b'    '
+
+        chunks = []
+        pos = patch.start
+        for e in sorted((entries[key] for key in updates if key in entries), key=lambda e: e.start):
+            chunks.append(data[pos:e.start])
+            chunks.append(self._render({e.key.decode(): updates[e.key.decode()]}, indent).strip().encode())
+            pos = e.end
+
+        close = data.rfind(b'}', pos, patch.end)
+        tail = data[pos:close]
+        if added := {k: v for k, v in updates.items() if k not in entries}:
+            lineStart = data.rfind(b'\n', 0, close) + 1
+            closeIndent = data[lineStart:close] if lineStart > pos and not data[lineStart:close].strip() else b''
+            chunks.append(tail.rstrip() + b'\n')
+            chunks.append(self._render(added, indent).encode())
+            chunks.append(closeIndent)
+        else:
+            chunks.append(tail)
+        chunks.append(data[close:patch.end])
+
+        return b''.join(chunks)
+
+    @classmethod
+    def _render(cls, entries: dict, indent: bytes):
+        text = foamString(entries)
+        return ''.join(indent.decode() + line + '\n' if line else '\n' for line in text.splitlines())
+
+    @classmethod
+    def _compressedPath(cls, path: Path):
+        return path.with_name(path.name + '.gz')
@@ -2,12 +2,13 @@
 # -*- coding: utf-8 -*-
 
 from enum import Enum
+import hashlib
+import io
 import tempfile
 from pathlib import Path
 
-from PyFoam.Basics.FoamFileGenerator import FoamFileGenerator
-
 from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.foam_file import FoamFileWriter
 
 from resources import resource
 
@@ -17,6 +18,7 @@ VERSION = '2.0'
 
 class Format(Enum):
     FORMAT_ASCII = 'ascii'
+    FORMAT_BINARY = 'binary'
 
 
 class DataClass(Enum):
@@ -59,13 +61,42 @@ class DictionaryFile:
     def asDict(self):
         return self._data
 
+    def serialize(self) -> bytes:
+        """Returns the file as written, which is empty if the file is not to be written"""
+        if not self._data:
+            return b''
+
+        with io.BytesIO() as f:
+            FoamFileWriter(f, self._header).write(self._data)
+            return f.getvalue()
+
+    def contentHash(self, content: bytes = None):
+        """Returns the hash of the built contents, or an empty string if the file is not to be written
+
+        Args:
+            content: The file serialized by "serialize()", not to serialize it again
+        """
+        if content is None:
+            content = self.serialize()
+
+        return hashlib.sha256(content).hexdigest() if content else ''
+
     def write(self):
         self._write()
 
+    def writeContent(self, content: bytes):
+        """Writes the file serialized by "serialize()" """
+        path = self.fullPath()
+        if content:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        else:
+            path.unlink(missing_ok=True)
+
     def writeAtomic(self):
         if self._data:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, dir=self.fullPath().parent) as f:
-                f.write(str(FoamFileGenerator(self._data, header=self._header)))
+            with tempfile.NamedTemporaryFile(mode='wb', delete=False, dir=self.fullPath().parent) as f:
+                FoamFileWriter(f, self._header).write(self._data)
                 p = Path(f.name)
             p.replace(self.fullPath())
 
@@ -82,8 +113,8 @@ class DictionaryFile:
         path = self.fullPath(processorNo)
         if self._data:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w') as f:
-                f.write(str(FoamFileGenerator(self._data, header=self._header)))
+            with open(path, 'wb') as f:
+                FoamFileWriter(f, self._header).write(self._data)
         else:
             path.unlink(missing_ok=True)
 
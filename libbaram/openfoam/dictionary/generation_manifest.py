@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+from pathlib import Path
+from threading import Lock
+
+from libbaram.openfoam.dictionary.dictionary_file import DictionaryFile
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationManifest:
+    """Hashes of the files generated in a case, to write only the files that have changed
+
+    A file is regarded as unchanged if it is built into the same contents as the last time,
+    and has not been modified by others, such as OpenFOAM utilities, since it was written.
+    """
+    FILE_NAME = '.generation_manifest.json'
+
+    def __init__(self, casePath: Path):
+        self._path = casePath / self.FILE_NAME
+        self._casePath = casePath
+        self._entries = {}
+        self._changed = []
+        self._unchanged = []
+        self._lock = Lock()
+
+        if self._path.is_file():
+            try:
+                self._entries = json.loads(self._path.read_text())
+            except (ValueError, OSError) as e:
+                logger.info(f'Generation manifest is ignored: {e}')
+
+    def write(self, file: DictionaryFile):
+        """Writes the file if it has changed, and returns whether it was written"""
+        path = file.fullPath()
+        key = self._key(path)
+        # Serialized once to be hashed and written
+        content = file.serialize()
+        contentHash = file.contentHash(content)
+        if self._entries.get(key) == [contentHash, self._state(path)]:
+            with self._lock:
+                self._unchanged.append(key)
+            return False
+
+        file.writeContent(content)
+
+        with self._lock:
+            self._entries[key] = [contentHash, self._state(path)]
+            self._changed.append(key)
+
+        return True
+
+    def save(self):
+        self._path.write_text(json.dumps(self._entries, indent=1, sort_keys=True))
+
+    def changedFiles(self):
+        return sorted(self._changed)
+
+    def report(self):
+        if not self._changed:
+            return f'No files changed since the last generation ({len(self._unchanged)} files)'
+
+        return (f'{len(self._changed)} files changed since the last generation, {len(self._unchanged)} unchanged\n    '
+                + '\n    '.join(self.changedFiles()))
+
+    def _key(self, path: Path):
+        try:
+            return path.relative_to(self._casePath).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _state(self, path: Path):
+        """Returns the size and modification time of the file, or its compressed file"""
+        for p in (path, path.with_name(path.name + '.gz')):
+            try:
+                stat = p.stat()
+                return [stat.st_size, stat.st_mtime_ns]
+            except FileNotFoundError:
+                pass
+
+        return None
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gzip
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+from PyFoam.Basics.DataStructures import DictProxy, Field
+
+from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.foam_file import BoundaryDictFile, FoamDictFile, FoamFileError, FoamFileWriter, arrayField
+
+_TIME = re.compile(r'[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?')
+
+VOLUME_FIELD_CLASSES = ['volScalarField', 'volVectorField', 'volSphericalTensorField', 'volSymmTensorField',
+                        'volTensorField']
+UNIFORM_DIRECTORY_NAME = 'uniform'
+
+
+class _NotDecomposable(Exception):
+    pass
+
+
+class _ProcessorMesh:
+    """Patches and addressing of the mesh of a processor"""
+    def __init__(self, polyMesh: Path):
+        self._polyMesh = polyMesh
+        self._faceProcAddressing = None
+        self._lock = Lock()
+
+        self.patches = BoundaryDictFile(polyMesh / 'boundary').content
+
+    def facesOf(self, name, globalStart):
+        """Returns indexes of the faces of the patch in the patch of the whole mesh"""
+        with self._lock:
+            if self._faceProcAddressing is None:
+                self._faceProcAddressing = FoamDictFile(self._polyMesh / 'faceProcAddressing').content
+
+        start = self.patches[name]['startFace']
+        faces = self._faceProcAddressing[start:start + self.patches[name]['nFaces']]
+
+        return np.abs(faces) - 1 - globalStart
+
+
+class FieldDecomposer:
+    """Splits the fields of cases into processor folders, in place of "decomposePar -fields"
+
+    Cases share the decomposed mesh of a case, whose processor folders have the polyMesh with addressing,
+    like batch cases linked to the mesh of the live case.
+    Only the fields with uniform internal fields are split,
+    for which the values on processor patches are the internal fields as well.
+    Nonuniform values on the other patches are split with "faceProcAddressing".
+    """
+    def __init__(self, meshCase: Path, regions, executor: ThreadPoolExecutor):
+        self._regions = regions
+        self._executor = executor
+
+        self._patches = {}
+        self._processors = {}
+        processors = sorted((p for p in meshCase.glob('processor[0-9]*') if p.name[9:].isdigit()),
+                            key=lambda p: int(p.name[9:]))
+        for rname in regions:
+            self._patches[rname] = BoundaryDictFile(
+                meshCase / Directory.CONSTANT_DIRECTORY_NAME / rname / Directory.POLY_MESH_DIRECTORY_NAME
+                / 'boundary').content
+            self._processors[rname] = [
+                _ProcessorMesh(p / Directory.CONSTANT_DIRECTORY_NAME / rname / Directory.POLY_MESH_DIRECTORY_NAME)
+                for p in processors]
+
+        self._nProcessors = len(processors)
+
+    def decompose(self, caseRoot: Path) -> bool:
+        """Writes the fields of the times in the case root into its processor folders
+
+        Returns:
+            False without writing anything, if the case has fields that cannot be split
+        """
+        try:
+            fields, uniforms = self._readFields(caseRoot)
+        except (_NotDecomposable, FoamFileError, OSError, KeyError):
+            return False
+
+        for p in range(self._nProcessors):
+            for directory in uniforms:
+                target = caseRoot / f'processor{p}' / directory.relative_to(caseRoot)
+                shutil.copytree(directory, target, dirs_exist_ok=True)
+
+        futures = [self._executor.submit(self._writeField, caseRoot, rname, path, field, p)
+                   for rname, path, field in fields for p in range(self._nProcessors)]
+        for future in futures:
+            future.result()
+
+        return True
+
+    def _readFields(self, caseRoot: Path):
+        times = [d for d in caseRoot.iterdir() if d.is_dir() and _TIME.fullmatch(d.name) and float(d.name) >= 0]
+
+        files = []
+        uniforms = []
+        for time in times:
+            if (time / UNIFORM_DIRECTORY_NAME).is_dir():
+                uniforms.append(time / UNIFORM_DIRECTORY_NAME)
+
+            for rname in self._regions:
+                directory = time / rname
+                if not directory.is_dir():
+                    continue
+
+                for path in directory.iterdir():
+                    if path.is_file():
+                        files.append((rname, path))
+                    elif path.name == UNIFORM_DIRECTORY_NAME:
+                        if rname:
+                            uniforms.append(path)
+                    else:
+                        raise _NotDecomposable(path)
+
+        fields = self._executor.map(lambda f: (f[0], f[1], self._readField(f[0], f[1])), files)
+
+        return list(fields), uniforms
+
+    def _readField(self, rname, path: Path):
+        dictFile = FoamDictFile(path)
+        if dictFile.header is None or dictFile.header.get('class') not in VOLUME_FIELD_CLASSES:
+            raise _NotDecomposable(path)
+
+        internalField = dictFile.content['internalField']
+        boundaryField = dictFile.content['boundaryField']
+        if (not isinstance(internalField, Field) or not internalField.isUniform()
+                or not isinstance(boundaryField, DictProxy) or any(isinstance(k, int) for k in boundaryField)):
+            raise _NotDecomposable(path)
+
+        for name, patch in self._patches[rname].items():
+            if name not in boundaryField or not isinstance(boundaryField[name], DictProxy):
+                raise _NotDecomposable(path)
+
+            for value in boundaryField[name].values():
+                if isinstance(value, Field) and not value.isUniform() and len(value.val) != patch['nFaces']:
+                    raise _NotDecomposable(path)
+
+        return dictFile
+
+    def _writeField(self, caseRoot: Path, rname, path: Path, dictFile: FoamDictFile, processor: int):
+        mesh = self._processors[rname][processor]
+        boundaryField = dictFile.content['boundaryField']
+        internalField = dictFile.content['internalField']
+
+        patches = DictProxy()
+        for name, patch in mesh.patches.items():
+            if patch['type'] in ('processor', 'processorCyclic'):
+                patches[name] = DictProxy()
+                patches[name]['type'] = patch['type']
+                patches[name]['value'] = internalField
+            else:
+                patches[name] = self._split(boundaryField[name], mesh, name, self._patches[rname][name]['startFace'])
+
+        content = DictProxy()
+        for key in dictFile.content:
+            content[key] = patches if key == 'boundaryField' else dictFile.content[key]
+
+        target = caseRoot / f'processor{processor}' / path.relative_to(caseRoot)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(target, 'wb') if target.suffix == '.gz' else target.open('wb') as f:
+            FoamFileWriter(f, dictFile.header, dictFile.longListOutputThreshold).write(content, firstLevel=True)
+
+    def _split(self, entry: DictProxy, mesh: _ProcessorMesh, name, globalStart):
+        """Returns the entry of the patch with its nonuniform values for the faces of the processor"""
+        split = None
+        for key, value in entry.items():
+            if isinstance(value, Field) and not value.isUniform():
+                if split is None:
+                    split = DictProxy()
+                    split.update(entry)
+                split[key] = arrayField(np.asarray(value.val)[mesh.facesOf(name, globalStart)], value.name)
+
+        return entry if split is None else split
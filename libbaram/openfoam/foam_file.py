@@ -0,0 +1,726 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import gzip
+import io
+import re
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from PyFoam.Basics.DataStructures import BinaryList, BoolProxy, Codestream, DictProxy, DictRedirection, Dimension, Field
+from PyFoam.Basics.DataStructures import SymmTensor, Tensor, TupleProxy, Unparsed, UnparsedList, Vector
+
+
+_SPACE = re.compile(rb'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.S)
+_COMMENT = re.compile(rb'//[^\n]*|/\*.*?\*/', re.S)
+_NUMBER = re.compile(rb'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?=[\s{}()\[\];]|$)')
+_INTEGER = re.compile(rb'[-+]?\d+')
+_WORD = re.compile(rb'[^\s{}()\[\];"]+')
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+_CODE = re.compile(rb'#\{(.*?)#\}', re.S)
+_LINE = re.compile(rb'[^\n]*')
+_VECTOR_LIST_END = re.compile(rb'\)\s*\)')
+_FORMAT = re.compile(rb'\bformat\s+(\w+)\s*;')
+_CLASS = re.compile(rb'\bclass\s+(\w+)\s*;')
+_ARCH = re.compile(rb'\barch\s+"([^"]*)"')
+_LABEL_SIZE = re.compile(rb'label=(\d+)')
+_SCALAR_SIZE = re.compile(rb'scalar=(\d+)')
+
+# Number of components of list elements
+_COMPONENTS = {'label': 1, 'scalar': 1, 'vector': 3, 'sphericalTensor': 1, 'symmTensor': 6, 'tensor': 9}
+_FIXED_LENGTH_TYPES = {3: Vector, 6: SymmTensor, 9: Tensor}
+_PRIMITIVE_TYPES = (SymmTensor, Tensor, Vector, Dimension, Field, Unparsed)
+# Element types of the files that are a list at the top level, like "polyMesh/cellProcAddressing"
+_LIST_CLASSES = {b'labelList': 'label', b'labelIOList': 'label'}
+_BOOLS = {s: BoolProxy(textual=s) for s in BoolProxy.TrueStrings + BoolProxy.FalseStrings}
+
+# Lists of this size or larger are decoded into NumPy arrays
+ARRAY_THRESHOLD = 100
+
+
+class FoamFileError(Exception):
+    pass
+
+
+class _Block:
+    """Value in braces after a size, like "10 {0}" """
+    def __init__(self, value):
+        self.value = value
+
+
+def arrayField(array: np.ndarray, name: str) -> Field:
+    """Returns nonuniform Field of PyFoam with the array as its value"""
+    field = Field([], name)
+    field.val = array
+
+    return field
+
+
+class FoamFileParser:
+    """Parses FoamFile into the structures of PyFoam that ParsedParameterFile makes
+
+    Dictionaries are DictProxy, and values are int, float, str, BoolProxy, Vector, Field, list or TupleProxy.
+    Directives such as "#include" are kept with integer keys as PyFoam does.
+    Lists of numbers with their sizes and element types, like "List<vector> 1000 (...)",
+    are decoded into NumPy arrays in ASCII and binary if they are large, and always in binary.
+    Comments are skipped, except those after the last entry, which are kept in "lastDecoration".
+    """
+    def __init__(self, data: bytes, arrayThreshold=ARRAY_THRESHOLD):
+        self._data = data
+        self._arrayThreshold = arrayThreshold
+        self._directives = 0
+
+        self.lastDecoration = ''
+
+        header = data[:data.find(b'}') + 1]
+        self._binary = (m := _FORMAT.search(header)) is not None and m.group(1) == b'binary'
+        self._listType = _LIST_CLASSES.get(m.group(1)) if (m := _CLASS.search(header)) else None
+        arch = m.group(1) if (m := _ARCH.search(header)) else b''
+        labelSize = int(m.group(1)) if (m := _LABEL_SIZE.search(arch)) else 32
+        scalarSize = int(m.group(1)) if (m := _SCALAR_SIZE.search(arch)) else 64
+        self._labelType = np.dtype(f'<i{labelSize // 8}')
+        self._scalarType = np.dtype(f'<f{scalarSize // 8}')
+
+    def parse(self):
+        """Returns the header and the content
+
+        The content is DictProxy, or a list for files like "polyMesh/boundary".
+        Label lists like "polyMesh/cellProcAddressing" are arrays.
+        """
+        header = None
+        pos = self._skipSpace(0)
+        if self._data.startswith(b'FoamFile', pos):
+            pos = self._expect(pos + len(b'FoamFile'), b'{')
+            header, pos = self._dictionary(pos, b'}')
+
+        pos = self._skipSpace(pos)
+        if _INTEGER.match(self._data, pos) or self._data.startswith(b'(', pos):
+            items, pos = self._items(pos, (None,))
+            content = self._value(items)
+        else:
+            content, pos = self._dictionary(pos, None)
+
+        return header, content
+
+    def _skipSpace(self, pos):
+        return _SPACE.match(self._data, pos).end()
+
+    def _expect(self, pos, token):
+        pos = self._skipSpace(pos)
+        if not self._data.startswith(token, pos):
+            raise FoamFileError(f'"{token.decode()}" expected at {pos}')
+
+        return pos + len(token)
+
+    def _error(self, pos):
+        return FoamFileError(f'Unexpected "{self._data[pos:pos + 20].decode("latin-1")}" at {pos}')
+
+    def _dictionary(self, pos, close):
+        """Parses entries up to the close, or the end of the data if close is None"""
+        data = self._data
+        content = DictProxy()
+        while True:
+            end = pos
+            pos = self._skipSpace(pos)
+            if pos >= len(data):
+                if close is None:
+                    self.lastDecoration = b''.join(_COMMENT.findall(data, end)).decode()
+                    return content, pos
+                raise FoamFileError(f'"{close.decode()}" expected at the end')
+
+            c = data[pos:pos + 1]
+            if c == close:
+                return content, pos + 1
+            elif c == b';':
+                pos += 1
+                continue
+            elif c == b'#' and not data.startswith(b'#{', pos):
+                line = _LINE.match(data, pos)
+                content[self._directives] = line.group().decode().strip() + '\n'
+                self._directives += 1
+                pos = line.end()
+                continue
+            elif c == b'"':
+                m = _STRING.match(data, pos)
+            else:
+                m = _WORD.match(data, pos)
+            if m is None:
+                raise self._error(pos)
+
+            key = self._word(m.group(), m.end())
+            pos = self._skipSpace(m.end() + len(key) - len(m.group()))
+            if data.startswith(b'{', pos):
+                value, pos = self._dictionary(pos + 1, b'}')
+            else:
+                items, pos = self._items(pos, (b';',))
+                value = self._value(items)
+
+            _setItem(content, key.decode(), value)
+
+    def _word(self, word, end):
+        """Returns the word extended with parentheses following it without spaces, like "div(phi,U)" """
+        data = self._data
+        if not (word[:1].isalpha() or word[:1] in b'_$'):
+            return word
+
+        extended = word
+        depth = 0
+        while True:
+            c = data[end:end + 1]
+            if c == b'(':
+                depth += 1
+            elif c == b')' and depth > 0:
+                depth -= 1
+            else:
+                break
+
+            extended += c
+            end += 1
+            if m := _WORD.match(data, end):
+                extended += m.group()
+                end = m.end()
+
+        return word if depth else extended
+
+    def _items(self, pos, closes):
+        """Parses items up to one of the closes, which is None for the end of data"""
+        data = self._data
+        items = []
+        while True:
+            pos = self._skipSpace(pos)
+            c = data[pos:pos + 1]
+            if not c:
+                if None in closes:
+                    return items, pos
+                raise FoamFileError('Unexpected end of file')
+            if c in closes:
+                return items, pos + 1
+
+            if c == b'(':
+                elementType, always = None, False
+                if (len(items) > 1 and isinstance(items[-1], int) and isinstance(items[-2], str)
+                        and items[-2].startswith('List<') and items[-2].endswith('>')):
+                    elementType = items[-2][5:-1]
+                elif len(items) == 1 and isinstance(items[0], int) and None in closes:
+                    elementType, always = self._listType, True
+
+                if elementType is not None and (array := self._array(pos + 1, items[-1], elementType, always)):
+                    value, pos = array
+                    items.append(value)
+                    continue
+
+                values, pos = self._items(pos + 1, (b')',))
+                if items and type(items[-1]) is int and (b')' in closes or len(items) == 1):
+                    # The list after its size is not a vector, and the size is dropped in lists if it matches
+                    if b')' in closes and items[-1] == len(values):
+                        items[-1] = values
+                    else:
+                        items.append(values)
+                else:
+                    items.append(self._list(values))
+            elif c == b'[':
+                values, pos = self._items(pos + 1, (b']',))
+                items.append(Dimension(*values) if len(values) == 7 else Dimension(' '.join(map(str, values))))
+            elif c == b'{':
+                if b')' in closes:  # Dictionaries in lists, like "polyMesh/boundary"
+                    value, pos = self._dictionary(pos + 1, b'}')
+                    items.append(value)
+                else:
+                    values, pos = self._items(pos + 1, (b'}',))
+                    items.append(_Block(self._value(values)))
+            elif c == b'"':
+                m = _STRING.match(data, pos)
+                if m is None:
+                    raise self._error(pos)
+                items.append(m.group().decode())
+                pos = m.end()
+            elif m := _CODE.match(data, pos):
+                items.append(Codestream(m.group(1).decode()))
+                pos = m.end()
+            elif m := _NUMBER.match(data, pos):
+                number = m.group()
+                items.append(int(number) if _INTEGER.fullmatch(number) else float(number))
+                pos = m.end()
+            elif m := _WORD.match(data, pos):
+                word = self._word(m.group(), m.end())
+                pos = m.end() + len(word) - len(m.group())
+                word = word.decode()
+                items.append(_BOOLS.get(word, word))
+            else:
+                raise self._error(pos)
+
+    def _array(self, pos, count, elementType, always=False):
+        """Decodes the list of the size into an array, if it is large or binary, or always if told
+
+        Returns:
+            The array and the position after the list, or None to be parsed as a list
+        """
+        data = self._data
+        components = _COMPONENTS.get(elementType)
+        if components is None or not (always or self._binary or count >= self._arrayThreshold):
+            return None
+
+        dtype = self._labelType if elementType == 'label' else self._scalarType
+        size = count * components
+        if self._binary:
+            end = pos + size * dtype.itemsize
+            if data[end:end + 1] == b')':
+                array = np.frombuffer(data, dtype, size, pos).astype(dtype.newbyteorder('='))
+                return (array.reshape(count, components) if components > 1 else array), end + 1
+            # Lists can be written in ASCII even in binary files
+
+        if components == 1:
+            end = data.find(b')', pos)
+            text = data[pos:end]
+        else:
+            m = _VECTOR_LIST_END.search(data, pos)
+            end = m.end() - 1 if m else -1
+            text = data[pos:end].translate(None, b'()')
+
+        if end < 0:
+            raise FoamFileError(f'Unclosed list at {pos}')
+
+        array = np.fromstring(text, dtype=np.int64 if elementType == 'label' else np.float64, sep=' ')
+        if array.size != size:
+            raise FoamFileError(f'{count} {elementType}s expected at {pos}, but {array.size // components} found')
+
+        return (array.reshape(count, components) if components > 1 else array), end + 1
+
+    def _list(self, values):
+        if (len(values) in _FIXED_LENGTH_TYPES
+                and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)):
+            return _FIXED_LENGTH_TYPES[len(values)](*values)
+
+        return values
+
+    def _value(self, items):
+        if not items:
+            return None
+
+        first = items[0]
+        if len(items) == 1:
+            return first
+
+        if len(items) == 2:
+            if first == 'uniform':
+                return Field(items[1])
+            if isinstance(first, int):
+                if isinstance(items[1], (list, np.ndarray)):
+                    return items[1]
+                if isinstance(items[1], _Block):
+                    return Field(items[1].value, length=first)
+
+        if first == 'nonuniform' and len(items) == 4 and isinstance(items[2], int):
+            if isinstance(items[3], np.ndarray):
+                return arrayField(items[3], items[1])
+            if isinstance(items[3], list):
+                return Field(items[3], items[1])
+            if isinstance(items[3], (Vector, SymmTensor, Tensor)):  # A list of a fixed length type
+                return Field(list(items[3].vals), items[1])
+
+        return TupleProxy(items)
+
+
+class FoamFileWriter:
+    """Writes the structures of PyFoam to a file opened in binary mode, in the same layout as FoamFileGenerator
+
+    The text is written as it is made instead of being built up in one string.
+    NumPy arrays are formatted in chunks, and nonuniform fields and arrays are written in binary
+    if the format in the header is "binary".
+    """
+    _CHUNK = 10000
+
+    def __init__(self, f, header=None, longListThreshold=20, useFixedType=True):
+        self._f = f
+        self._header = header
+        self._longListThreshold = longListThreshold
+        self._useFixedType = useFixedType
+        self._buffer = []
+
+        self._binary = header is not None and header.get('format') == 'binary'
+        arch = str(header.get('arch', '')) if self._binary else ''
+        labelSize = int(m.group(1)) if (m := _LABEL_SIZE.search(arch.encode())) else 32
+        scalarSize = int(m.group(1)) if (m := _SCALAR_SIZE.search(arch.encode())) else 64
+        self._labelType = np.dtype(f'<i{labelSize // 8}')
+        self._scalarType = np.dtype(f'<f{scalarSize // 8}')
+
+    def write(self, data, firstLevel=False):
+        if self._header:
+            self._out('FoamFile\n{\n')
+            self._dict(self._binaryHeader() if self._binary else self._header, 1)
+            self._out('}\n\n')
+
+        if type(data) in (dict, DictProxy, OrderedDict):
+            self._dict(data, firstLevel=firstLevel)
+        elif type(data) in (tuple, TupleProxy):
+            self._tuple(data)
+        elif type(data) in (list, UnparsedList, BinaryList, np.ndarray):
+            self._list(data)
+        elif data is None:
+            raise FoamFileError('<None> found')
+        else:
+            self._out(self._primitive(data))
+
+        self._flush()
+
+    def _binaryHeader(self):
+        if 'arch' in self._header:
+            return self._header
+
+        header = DictProxy()
+        for key, value in self._header.items():
+            header[key] = value
+            if key == 'format':
+                header['arch'] = 'LSB;label=32;scalar=64'
+
+        return header
+
+    def _out(self, text):
+        self._buffer.append(text)
+        if len(self._buffer) > self._CHUNK:
+            self._flush()
+
+    def _flush(self):
+        self._f.write(''.join(self._buffer).encode())
+        self._buffer.clear()
+
+    def _dict(self, dictionary, indent=0, firstLevel=False):
+        out = self._out
+        isProxy = type(dictionary) is DictProxy
+        spaces = ' ' * indent
+        for k in (dictionary._order if isProxy else list(dictionary.keys())):
+            if type(k) is DictRedirection:
+                v = k
+            else:
+                try:
+                    v = dictionary[k]
+                except KeyError:
+                    v = dictionary.getRegexpValue(k)
+
+            end = '\n'
+            if isProxy:
+                end = dictionary.getDecoration(k) + '\n'
+            if firstLevel:
+                end += '\n'
+            end = '\n'.join([part.rstrip() for part in end.split('\n')])
+
+            if type(k) is int:
+                out(v)
+                continue
+
+            if str(k).startswith('anonymValue'):
+                k = ''
+
+            out(spaces + str(k))
+            if isinstance(v, str):
+                if type(v) is Codestream:
+                    out('\n' + spaces + str(v) + ';' + end)
+                else:
+                    out(' ' + _quote(v) + ';' + end)
+            elif type(v) in (dict, DictProxy, OrderedDict):
+                out('\n' + spaces + '{\n')
+                self._dict(v, indent + 2)
+                out(spaces + '}' + end)
+            elif type(v) in (list, UnparsedList, np.ndarray):
+                out('\n')
+                self._list(v, indent + 2, newline=False)
+                out(';' + end)
+            elif isinstance(v, (tuple, TupleProxy)):
+                out(' ')
+                self._tuple(v, indent + 2)
+                out(';' + end)
+            elif type(v) in (bool, BoolProxy):
+                out(' yes;\n' if v else ' no;\n')
+            elif isinstance(v, (int, float)):
+                out(' ' + str(v) + ';' + end)
+            elif type(v) is Field:
+                out(' ')
+                self._field(v)
+                out(';' + end)
+            elif v.__class__ in _PRIMITIVE_TYPES:
+                out(' ' + str(v) + ';' + end)
+            elif v is None:
+                out(' /* empty */ ;' + end)
+            elif type(v) is DictRedirection:
+                out(';' + end)
+            else:
+                raise FoamFileError(f'Unhandled type {type(v)} for {v}')
+
+    def _list(self, values, indent=0, newline=True):
+        """Writes the list, and the newline after it if the list ends with one and newline is True"""
+        out = self._out
+        spaces = ' ' * indent
+        if type(values) is np.ndarray:
+            self._array(values, indent, newline)
+            return
+        elif type(values) is UnparsedList:
+            out(spaces + str(len(values)) + ' (' + values.data)
+            if values.data[-1] != '\n':
+                out('\n')
+            out(spaces + (')\n' if newline else ')'))
+            return
+        elif type(values) is BinaryList:
+            out(spaces + str(len(values)) + ' (' + values.data + ')')
+            return
+
+        length = len(values)
+
+        # In case of "polyMesh/boundary" file
+        if length >= 2 and length % 2 == 0:
+            if isinstance(values[0], str) and (type(values[1]) in (dict, DictProxy)):
+                length //= 2
+
+        if self._useFixedType and len(values) in _FIXED_LENGTH_TYPES:
+            try:
+                out('(' + ' '.join(['%g' % float(v) for v in values]) + ')')
+                return
+            except (ValueError, TypeError):
+                pass
+
+        if self._longListThreshold and length > self._longListThreshold:
+            out(spaces + str(length) + '\n')
+        out(spaces + '(\n')
+
+        inner = spaces + '  '
+        for v in values:
+            if isinstance(v, str):
+                out(inner + v + '\n')
+            elif type(v) in (dict, DictProxy):
+                out('\n' + inner + '{\n')
+                self._dict(v, indent + 4)
+                out('\n' + inner + '}\n')
+            elif type(v) in (list, UnparsedList, np.ndarray):
+                out('\n')
+                self._list(v, indent + 2)
+            elif type(v) is tuple:
+                out(' ')
+                self._tuple(v, indent + 2)
+                out('\n')
+            elif type(v) is Field:
+                out(inner)
+                self._field(v)
+                out('\n')
+            else:
+                out(inner + str(v) + '\n')
+
+        out(spaces + (')\n' if newline else ')'))
+
+    def _tuple(self, values, indent=0):
+        out = self._out
+        inner = ' ' * (indent + 2)
+        for i, v in enumerate(values):
+            if isinstance(v, str):
+                out(v + ' ')
+            elif type(v) in (dict, DictProxy):
+                out('{\n')
+                self._dict(v, indent + 4)
+                out(inner + '} ')
+            elif type(v) in (list, UnparsedList, np.ndarray):
+                out(' ')
+                self._list(v, indent + 2)
+            elif i + 1 < len(values) and type(values[i + 1]) is np.ndarray:
+                # The size before an array, like "List<label> 10 (...)", is written with the array
+                continue
+            elif type(v) is Field:
+                out(inner)
+                self._field(v)
+                out(' ')
+            else:
+                out(inner + str(v) + ' ')
+
+    def _field(self, field: Field):
+        """Writes the field as str(Field) of PyFoam, except for its array"""
+        if field.length:
+            self._out(str(field.length) + ' {' + str(field.val) + '}')
+            return
+
+        if field.uniform:
+            self._out('uniform ')
+        else:
+            self._out('nonuniform ' + (field.name + ' ' if field.name else ''))
+
+        value = field.val
+        if self._binary and not field.uniform and type(value) is list:
+            # Lists of numbers are read in binary from binary files
+            try:
+                value = np.asarray(value, dtype=np.float64)
+            except (ValueError, TypeError):
+                pass
+
+        if type(value) is np.ndarray:
+            self._array(value, 0, dtype=self._labelType if 'label' in (field.name or '') else self._scalarType)
+            return
+
+        # Field of PyFoam writes its value with FoamFileGenerator of these options
+        options = self._longListThreshold, self._useFixedType
+        self._longListThreshold, self._useFixedType = -1, False
+        try:
+            if type(value) in (dict, DictProxy, OrderedDict):
+                self._dict(value)
+            elif type(value) in (tuple, TupleProxy):
+                self._tuple(value)
+            elif type(value) in (list, UnparsedList, BinaryList):
+                self._list(value)
+            elif value is None:
+                raise FoamFileError('<None> found')
+            else:
+                self._out(self._primitive(value))
+        finally:
+            self._longListThreshold, self._useFixedType = options
+
+    def _array(self, array: np.ndarray, indent, newline=True, dtype=None):
+        spaces = ' ' * indent
+        if self._binary:
+            if dtype is None:
+                dtype = self._labelType if array.dtype.kind in 'iu' else self._scalarType
+            self._out(spaces + str(len(array)) + '(')
+            self._flush()
+            self._f.write(np.ascontiguousarray(array, dtype).tobytes())
+            self._out(')\n' if newline else ')')
+            return
+
+        self._out(spaces + str(len(array)) + ' (\n')
+        self._flush()
+
+        rows = array.reshape(array.shape[0], int(np.prod(array.shape[1:])))
+        line = '%s\n' if array.ndim == 1 else '(' + ' '.join(['%s'] * rows.shape[1]) + ')\n'
+        for start in range(0, len(rows), self._CHUNK):
+            chunk = rows[start:start + self._CHUNK]
+            self._f.write(((line * len(chunk)) % tuple(chunk.ravel().tolist())).encode())
+
+        self._out(spaces + (')\n' if newline else ')'))
+
+    def _primitive(self, value):
+        if type(value) is bool:
+            return 'yes' if value else 'no'
+        elif type(value) is BoolProxy:
+            return str(value)
+        elif isinstance(value, str):
+            return _quote(value)
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif type(value) is Field:
+            with io.BytesIO() as f:
+                writer = FoamFileWriter(f, longListThreshold=self._longListThreshold, useFixedType=self._useFixedType)
+                writer._field(value)
+                writer._flush()
+                return f.getvalue().decode()
+        elif value.__class__ in _PRIMITIVE_TYPES:
+            return str(value)
+        elif type(value) is DictRedirection:
+            return str(value())
+
+        raise FoamFileError(f'List, Dict or valid primitive expected, {type(value)} found in {value}')
+
+
+def foamString(data, header=None, longListThreshold=20, firstLevel=False) -> str:
+    """Returns the text of the data that FoamFileWriter writes in ASCII"""
+    with io.BytesIO() as f:
+        FoamFileWriter(f, header, longListThreshold).write(data, firstLevel)
+        return f.getvalue().decode()
+
+
+class FoamDictFile:
+    """FoamFile parsed by FoamFileParser, to be used in place of ParsedParameterFile
+
+    Files compressed with gzip, such as "U.gz", are read if the path does not exist, and written compressed.
+    """
+    def __init__(self, path, longListOutputThreshold=20, arrayThreshold=ARRAY_THRESHOLD):
+        self._path = Path(path)
+        if not self._path.is_file() and (compressed := self._path.with_name(self._path.name + '.gz')).is_file():
+            self._path = compressed
+
+        data = self._path.read_bytes()
+        if self._path.suffix == '.gz':
+            data = gzip.decompress(data)
+
+        self.longListOutputThreshold = longListOutputThreshold
+        parser = FoamFileParser(data, arrayThreshold)
+        self.header, self.content = parser.parse()
+        self.content = self.parse(self.content)
+        self.lastDecoration = parser.lastDecoration  # Comments at the end, like "// *** //" 
+
+    def parse(self, content):
+        return content
+
+    def writeFile(self):
+        """Writes the file in the format of its header
+
+        The file is replaced with a new one written in full, not to be read half written by running solvers.
+        """
+        with tempfile.NamedTemporaryFile(delete=False, dir=self._path.parent) as f:
+            with gzip.open(f, 'wb') if self._path.suffix == '.gz' else f as out:
+                self.write(out, self.header)
+        if self._path.exists():
+            shutil.copymode(self._path, f.name)
+        Path(f.name).replace(self._path)
+
+    def write(self, f, header):
+        FoamFileWriter(f, header, self.longListOutputThreshold).write(self.content, firstLevel=True)
+        if self.lastDecoration:
+            f.write(('\n\n' + self.lastDecoration).encode())
+
+    def __str__(self):
+        with io.BytesIO() as f:
+            self.write(f, self._asciiHeader())
+            return f.getvalue().decode()
+
+    def _asciiHeader(self):
+        if self.header is None or self.header.get('format') != 'binary':
+            return self.header
+
+        header = DictProxy()
+        header.update(self.header)
+        header['format'] = 'ascii'
+
+        return header
+
+
+class BoundaryDictFile(FoamDictFile):
+    """"polyMesh/boundary" file parsed by FoamFileParser, to be used in place of ParsedBoundaryDict
+
+    The content is a dictionary of patches by their names.
+    """
+    def __init__(self, path, longListOutputThreshold=None, arrayThreshold=ARRAY_THRESHOLD):
+        super().__init__(path, longListOutputThreshold, arrayThreshold)
+
+    def parse(self, content):
+        if not isinstance(content, list) or len(content) % 2:
+            raise FoamFileError(f'List of patches expected in {self._path}')
+
+        patches = DictProxy()
+        for i in range(0, len(content), 2):
+            _setItem(patches, content[i], content[i + 1])
+
+        return patches
+
+    def write(self, f, header):
+        patches = []
+        for name, patch in sorted(self.content.items(), key=lambda p: int(p[1]['startFace'])):
+            patches.append(name)
+            patches.append(patch)
+
+        FoamFileWriter(f, header, self.longListOutputThreshold).write(patches)
+
+
+def _setItem(dictionary: DictProxy, key, value):
+    if dict.__contains__(dictionary, key) or dictionary.isRegexp(key):
+        dictionary[key] = value
+    else:
+        # DictProxy looks up its order list on every assignment, which is slow for many entries
+        dict.__setitem__(dictionary, key, value)
+        dictionary._order.append(key)
+
+
+def _quote(value: str):
+    """Quotes the string if it has characters that words cannot have, as FoamFileGenerator does"""
+    if not value or value[0] in '\'"':
+        return value
+
+    if any(c in value for c in '\\{}/;"'):
+        return "'" + value + "'" if '"' in value else '"' + value + '"'
+
+    return value
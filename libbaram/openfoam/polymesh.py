@@ -3,9 +3,8 @@
 
 from pathlib import Path
 
-from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict, ParsedParameterFile
-
 from libbaram.openfoam.constants import Directory
+from libbaram.openfoam.foam_file import BoundaryDictFile, FoamDictFile
 
 
 def isPolyMesh(path: Path):
@@ -27,7 +26,7 @@ def loadRegions(constant: Path):
     regionPropFile = constant / Directory.REGION_PROPERTIES_FILE_NAME
 
     if regionPropFile.is_file():
-        regionsDict = ParsedParameterFile(regionPropFile).content['regions']
+        regionsDict = FoamDictFile(regionPropFile).content['regions']
         for i in range(1, len(regionsDict), 2):
             for rname in regionsDict[i]:
                 if not constant.joinpath(rname).is_dir():
@@ -53,7 +52,7 @@ def removeVoidBoundaries(caseRoot: Path):
         if not isPolyMesh(constant / rname / 'polyMesh'):
             continue
         boundaryPath = constant / rname / 'polyMesh' / 'boundary'
-        boundaryDict = ParsedBoundaryDict(str(boundaryPath), treatBinaryAsASCII=True)
+        boundaryDict = BoundaryDictFile(boundaryPath)
         boundaries = boundaryDict.content
 
         for b in list(boundaries.keys()):
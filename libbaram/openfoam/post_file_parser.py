@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+import logging
+import re
+from pathlib import Path
+from typing import Optional, Callable
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+# Vectors and tensors are written as "(x y z)". Parentheses are replaced with spaces to make their components columns.
+_PARENTHESES = bytes.maketrans(b'()', b'  ')
+_TOKEN_PATTERN = re.compile(r'\(([^)]*)\)|(\S+)')
+
+VECTOR_COMPONENTS = ['x', 'y', 'z']
+NOT_AVAILABLE = b'N/A'
+
+
+def _isNumber(token: str):
+    if token == NOT_AVAILABLE.decode():
+        return True
+
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+def parseHeader(line: bytes) -> [str]:
+    return line.decode('UTF-8', errors='replace').lstrip('#').split()
+
+
+def columnLayout(names: [str], line: bytes) -> ([str], [bool]):
+    """Expand the header names into columns of the data line
+
+    Vector values get a column per component, named like "total_x", "total_y" and "total_z".
+
+    Args:
+        names: Names in the header
+        line: A data line
+
+    Returns:
+        Names of the columns and whether they are numeric.
+    """
+    columns = []
+    numeric = []
+    for i, m in enumerate(_TOKEN_PATTERN.finditer(line.decode('UTF-8', errors='replace'))):
+        name = names[i] if i < len(names) else str(i)
+        if m.group(1) is not None:
+            components = m.group(1).split()
+            suffixes = VECTOR_COMPONENTS if len(components) == 3 else [str(j) for j in range(len(components))]
+            columns.extend(f'{name}_{s}' for s in suffixes)
+            numeric.extend(_isNumber(c) for c in components)
+        else:
+            columns.append(name)
+            numeric.append(_isNumber(m.group(2)))
+
+    return columns, numeric
+
+
+def parseLines(data: bytes, indices: [int]) -> np.ndarray:
+    """Decode complete data lines into a 2-D float array of the columns in "indices"
+
+    Comment lines are skipped and "N/A" becomes NaN.
+    """
+    data = data.translate(_PARENTHESES)
+    if NOT_AVAILABLE in data:
+        data = data.replace(NOT_AVAILABLE, b'nan')
+
+    try:
+        return np.loadtxt(io.BytesIO(data), dtype=np.float64, usecols=indices, ndmin=2)
+    except ValueError:  # Some lines are broken. Parse line by line dropping them.
+        rows = []
+        for line in data.splitlines():
+            tokens = line.split()
+            if not tokens or tokens[0].startswith(b'#'):
+                continue
+            try:
+                rows.append([float(tokens[i]) for i in indices])
+            except (ValueError, IndexError):
+                logger.warning(f'Broken line skipped: {line}')
+
+        return np.array(rows, dtype=np.float64).reshape(-1, len(indices))
+
+
+class PostFileTail:
+    """Incremental reader of a functionObject output file in "postProcessing"
+
+    Only complete lines after the last byte offset read are parsed.
+    Whitespace and tab separated values, vectors in parentheses, "N/A" and
+    non-numeric columns such as solver names in "solverInfo.dat" are handled.
+    Numeric columns are decoded straight into NumPy arrays.
+    """
+    def __init__(self, path: Path, valueName: str = None):
+        """
+        Args:
+            path: Path of the file
+            valueName: Name of the value column, for files of which header has only "Time" like probes
+        """
+        self._path = path
+        self._valueName = valueName
+        self._file = None
+        self._offset = 0
+        self._header = None
+        self._columns = None
+        self._numeric = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def offset(self):
+        """Size of the file read so far, which ends with a complete line"""
+        return self._offset
+
+    @property
+    def header(self) -> Optional[list]:
+        return self._header
+
+    @property
+    def columns(self) -> Optional[list]:
+        """Names of the columns, available after data lines are read"""
+        return self._columns
+
+    def open(self):
+        if self._file is None:
+            self._file = open(self._path, 'rb')
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def read(self, size: int = None, select: Callable[[str], bool] = None) -> Optional[dict]:
+        """Read lines appended since the last call
+
+        Args:
+            size: Size of the file to read up to, such as the one reported by FileWatcher. Up to EOF if None
+            select: Returns whether to decode the column of the name. All numeric columns are decoded if None
+
+        Returns:
+            Arrays of the columns by name, or None if no complete data line has been appended.
+        """
+        if self._file is None:
+            self.open()
+
+        self._file.seek(self._offset)
+        data = self._file.read(-1 if size is None else max(size - self._offset, 0))
+
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return None
+
+        self._offset += end
+        data = data[:end]
+
+        # Header comments are at the top of the file
+        while data.startswith(b'#'):
+            lineEnd = data.find(b'\n') + 1
+            self._header = parseHeader(data[:lineEnd])
+            if len(self._header) == 1 and self._valueName:
+                self._header.append(self._valueName)
+            data = data[lineEnd:]
+
+        if not data.strip():
+            return None
+
+        if self._columns is None:
+            if self._header is None:
+                raise RuntimeError(f'No header in {self._path}')
+
+            first = data.lstrip()
+            self._columns, self._numeric = columnLayout(self._header, first[:first.find(b'\n')])
+
+        indices = [i for i, numeric in enumerate(self._numeric)
+                   if numeric and (select is None or select(self._columns[i]))]
+
+        values = parseLines(data, indices)
+
+        return {self._columns[i]: values[:, j] for j, i in enumerate(indices)}
+
+
+def parsePostFile(path: Path, valueName: str = None, select: Callable[[str], bool] = None) -> Optional[dict]:
+    tail = PostFileTail(path, valueName)
+    try:
+        return tail.read(select=select)
+    finally:
+        tail.close()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+FRAME_INTERVAL = 50     # in milliseconds
+MAX_BYTES_PER_FRAME = 64 * 1024
+
+
+class OutputThrottle(QObject):
+    """Coalesces texts appended to a console into one text per frame
+
+    When more than "maxBytes" is appended in a frame, only the last lines within the budget are released,
+    following a marker of the number of lines skipped.
+    So, the cost of showing the output is bounded, however fast a process prints.
+    """
+    released = Signal(str)
+
+    def __init__(self, maxBytes=MAX_BYTES_PER_FRAME, interval=FRAME_INTERVAL):
+        super().__init__()
+
+        self._maxBytes = maxBytes
+        self._pending = []
+        self._size = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, text: str):
+        self._pending.append(text)
+        self._size += len(text) + 1
+
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        if self._size <= self._maxBytes:
+            text = '\n'.join(self._pending)
+        else:
+            lines = '\n'.join(self._pending).split('\n')
+
+            size = 0
+            first = len(lines)
+            while first > 0 and size + len(lines[first - 1]) + 1 <= self._maxBytes:
+                first -= 1
+                size += len(lines[first]) + 1
+
+            text = '\n'.join([self.tr('... {} lines skipped ...').format(first)] + lines[first:])
+
+        self._pending = []
+        self._size = 0
+
+        self.released.emit(text)
+
+    def clear(self):
+        self._timer.stop()
+        self._pending = []
+        self._size = 0
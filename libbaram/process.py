@@ -10,7 +10,7 @@ import os
 import platform
 import subprocess
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer, Signal
 
 from libbaram.exception import CanceledException
 from libbaram.mpi import ParallelEnvironment
@@ -18,6 +18,10 @@ from libbaram.mpi import ParallelEnvironment
 
 logger = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 64 * 1024
+OUTPUT_INTERVAL = 0.05  # in seconds, a frame of the GUI
+PROCESS_CHECK_INTERVAL = 500  # in milliseconds, where pidfd is not available
+
 
 class ProcessError(Exception):
     def __init__(self, returncode):
@@ -77,6 +81,63 @@ async def runExternalScript(program: str, *args, cwd=None, useVenv=True, stdout=
     return proc
 
 
+class ProcessWatcher(QObject):
+    """Notifies the exit of a process, which does not have to be a child
+
+    The process is watched through its pidfd on Linux, to be notified as soon as it exits without polling,
+    and checked periodically on the other systems.
+    """
+    exited = Signal()
+
+    def __init__(self, pid, startTime):
+        super().__init__()
+
+        self._pid = pid
+        self._startTime = startTime
+        self._fd = None
+        self._notifier = None
+        self._timer = None
+
+    def start(self):
+        if hasattr(os, 'pidfd_open'):
+            try:
+                self._fd = os.pidfd_open(self._pid)
+            except OSError:  # Exited already, or pidfd is not supported by the kernel
+                self._fd = None
+
+        # Checked after the pidfd is open, as the pid might have been reused by another process
+        if not isRunning(self._pid, self._startTime):
+            self.stop()
+            QTimer.singleShot(0, self.exited.emit)
+        elif self._fd is not None:
+            self._notifier = QSocketNotifier(self._fd, QSocketNotifier.Type.Read)
+            self._notifier.activated.connect(self._exited)
+        else:
+            self._timer = QTimer()
+            self._timer.setInterval(PROCESS_CHECK_INTERVAL)
+            self._timer.timeout.connect(self._check)
+            self._timer.start()
+
+    def stop(self):
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _check(self):
+        if not isRunning(self._pid, self._startTime):
+            self._exited()
+
+    def _exited(self):
+        self.stop()
+        self.exited.emit()
+
+
 def stopProcess(pid, startTime=None):
     try:
         ps = psutil.Process(pid)
@@ -88,6 +149,7 @@ def stopProcess(pid, startTime=None):
 
 
 class RunSubprocess(QObject):
+    # Batches of lines joined with newlines
     output = Signal(str)
     errorOutput = Signal(str)
 
@@ -126,43 +188,8 @@ class RunSubprocess(QObject):
     async def wait(self):
         self._canceled = False
 
-        tasks = []
-
-        stdout = self._proc.stdout
-        outTask = asyncio.create_task(stdout.readline())
-        tasks.append(outTask)
-
-        stderr = self._proc.stderr
-        errTask = asyncio.create_task(stderr.readline())
-        tasks.append(errTask)
-
-        while len(tasks) > 0:
-            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-            tasks = list(pending)
-            if outTask in done:
-                try:
-                    if output := outTask.result().decode('UTF-8').rstrip():
-                        self.output.emit(output)
-                except UnicodeDecodeError:
-                    logger.warning(f'Unicode Decode Error: {outTask.result()}')
-
-                if not stdout.at_eof():
-                    outTask = asyncio.create_task(stdout.readline())
-                    tasks.append(outTask)
-
-            if errTask in done:
-                try:
-                    self.errorOutput.emit(errTask.result().decode('UTF-8').rstrip())
-                except UnicodeDecodeError:
-                    logger.warning(f'Unicode Decode Error: {errTask.result()}')
-
-                if not stderr.at_eof():
-                    errTask = asyncio.create_task(stderr.readline())
-                    tasks.append(errTask)
-
-            if len(done) < 1:
-                await asyncio.sleep(1)
+        await asyncio.gather(self._readOutput(self._proc.stdout, self.output, skipEmptyLines=True),
+                             self._readOutput(self._proc.stderr, self.errorOutput))
 
         returncode = await self._proc.wait()
 
@@ -171,6 +198,57 @@ class RunSubprocess(QObject):
 
         return returncode
 
+    async def _readOutput(self, stream: asyncio.StreamReader, signal, skipEmptyLines=False):
+        """Read the pipe in large chunks and emit its lines in batches, at most one batch per OUTPUT_INTERVAL
+
+        Utilities like snappyHexMesh print hundreds of thousands of lines,
+        and a signal per line would saturate the event loop.
+        A batch is a text of complete lines joined with newlines.
+        """
+        loop = asyncio.get_running_loop()
+
+        lines = []
+        partial = b''
+        emittedAt = loop.time()
+
+        def emit():
+            nonlocal lines, emittedAt
+            if lines:
+                signal.emit('\n'.join(lines))
+                lines = []
+            emittedAt = loop.time()
+
+        while True:
+            timeout = max(OUTPUT_INTERVAL - (loop.time() - emittedAt), 0) if lines else None
+            try:
+                # Cancelling "read()" while it waits does not lose data
+                chunk = await asyncio.wait_for(stream.read(READ_CHUNK_SIZE), timeout)
+            except asyncio.TimeoutError:
+                emit()
+                continue
+
+            if not chunk:   # EOF
+                break
+
+            data = partial + chunk
+            end = data.rfind(b'\n') + 1
+            partial = data[end:]
+
+            for line in data[:end].decode('UTF-8', errors='replace').splitlines():
+                line = line.rstrip()
+                if line or not skipEmptyLines:
+                    lines.append(line)
+
+            if loop.time() - emittedAt >= OUTPUT_INTERVAL:
+                emit()
+
+        if partial:
+            line = partial.decode('UTF-8', errors='replace').rstrip()
+            if line or not skipEmptyLines:
+                lines.append(line)
+
+        emit()
+
 
 class RunExternalScript(RunSubprocess):
     async def start(self):
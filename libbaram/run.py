@@ -3,7 +3,10 @@
 
 import os
 import platform
+import shutil
 import subprocess
+from dataclasses import dataclass
+from typing import Optional
 
 import psutil
 from pathlib import Path
@@ -39,6 +42,7 @@ startupinfo = None
 
 STDOUT_FILE_NAME = 'stdout.log'
 STDERR_FILE_NAME = 'stderr.log'
+SOLVER_STATUS_FILE_NAME = 'solver.status'
 
 WM_PROJECT_DIR = str(OPENFOAM)
 
@@ -128,12 +132,23 @@ def launchSolverOnWindow(solver: str, casePath: Path, parallel: ParallelEnvironm
 
 
 def launchSolverOnLinux(solver: str, casePath: Path, uuid, parallel: ParallelEnvironment) -> (int, float):
-    args = [OPENFOAM/'bin'/'baramd', '-project', uuid, '-cmdline']
+    statusFile = casePath / SOLVER_STATUS_FILE_NAME
+    statusFile.unlink(missing_ok=True)
+
+    args = [OPENFOAM/'bin'/'baramd', '-project', uuid, '-status', statusFile, '-cmdline']
     args.extend(parallel.makeCommand(OPENFOAM / 'bin' / solver, cwd=casePath, options=MPI_OPTIONS))
 
     process = openSolverProcess(args, casePath)
     process.wait()
 
+    # baramd returns after writing its pid, unless it is a build that does not know "-status"
+    if run := readSolverRun(casePath):
+        try:
+            ps = psutil.Process(run.pid)
+            return ps.pid, ps.create_time()
+        except psutil.NoSuchProcess:
+            return None
+
     processes = [p for p in psutil.process_iter(['pid', 'cmdline', 'create_time'])
                  if (p.info['cmdline'] is not None) and (uuid in p.info['cmdline'])]
     if processes:
@@ -143,6 +158,36 @@ def launchSolverOnLinux(solver: str, casePath: Path, uuid, parallel: ParallelEnv
     return None
 
 
+@dataclass
+class SolverRun:
+    """Status of a solver run that baramd writes in the case"""
+    pid: int    # of baramd
+    solverPid: Optional[int] = None
+    exitCode: Optional[int] = None
+    signal: Optional[int] = None
+    cpuTime: Optional[float] = None     # in seconds
+    maxRSS: Optional[int] = None        # in kilobytes
+
+    def isEnded(self):
+        return self.exitCode is not None or self.signal is not None
+
+
+def readSolverRun(casePath: Path) -> Optional[SolverRun]:
+    """Returns the status of the last solver run in the case, or None if baramd has not written it"""
+    values = {}
+    try:
+        for line in (casePath / SOLVER_STATUS_FILE_NAME).read_text().splitlines():
+            key, _, value = line.partition(' ')
+            values[key] = float(value) if key == 'cpuTime' else int(value)
+    except (OSError, ValueError):
+        return None
+
+    if 'pid' not in values:
+        return None
+
+    return SolverRun(**{k: v for k, v in values.items() if k in SolverRun.__dataclass_fields__})
+
+
 def launchSolver(solver: str, casePath: Path, uuid, parallel: ParallelEnvironment) -> (int, float):
     """Launch solver
 
@@ -220,7 +265,12 @@ class RunUtility(RunSubprocess):
 
 
 async def runParallelUtility(program: str, *args, parallel: ParallelEnvironment, cwd: Path = None,
-                             stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL):
+                             stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL, cpus=None):
+    """Runs the program by mpirun/mpiexec
+
+    Args:
+        cpus: CPUs to pin the processes to. Ignored where "taskset" is not available.
+    """
     global creationflags
     global startupinfo
 
@@ -231,9 +281,13 @@ async def runParallelUtility(program: str, *args, parallel: ParallelEnvironment,
             wShowWindow=subprocess.SW_HIDE
         )
 
+    cmdline = parallel.makeCommand(OPENFOAM / 'bin' / program, *args, cwd=cwd, options=MPI_OPTIONS)
+    if cpus and (taskset := shutil.which('taskset')):
+        # mpirun binds the ranks within the CPUs it is allowed to run on
+        cmdline = [taskset, '--cpu-list', ','.join(str(cpu) for cpu in cpus)] + cmdline
+
     proc = await asyncio.create_subprocess_exec(
-        *parallel.makeCommand(OPENFOAM / 'bin' / program, *args, cwd=cwd, options=MPI_OPTIONS),
-        env=ENV, cwd=cwd, creationflags=creationflags, startupinfo=startupinfo, stdout=stdout, stderr=stderr)
+        *cmdline, env=ENV, cwd=cwd, creationflags=creationflags, startupinfo=startupinfo, stdout=stdout, stderr=stderr)
 
     return proc
 
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+from pathlib import Path
+
+import numpy as np
+import psutil
+from PySide6.QtCore import QObject, Signal
+
+
+RESOURCE_USAGE_FILE_NAME = 'resourceUsage.bin'
+
+SAMPLE_INTERVAL = 5             # in seconds
+# Ranks are looked for on every sample in this time from the start, and at this interval after that,
+# as listing the children of a process reads every process on the host
+TREE_REFRESH_INTERVAL = 60      # in seconds
+
+# A sample of a rank, in the order written in the file
+SAMPLE_DTYPE = np.dtype([('time', '<f8'),           # seconds since the solver started
+                         ('rank', '<i4'),
+                         ('cpu', '<f4'),            # percent of a CPU
+                         ('rss', '<i8'),            # bytes
+                         ('readBytes', '<i8'),
+                         ('writeBytes', '<i8'),
+                         ('ctxSwitches', '<i8')])
+
+# Processes of MPI and baram that start the solver ranks
+LAUNCHER_NAMES = {'baramd', 'taskset', 'mpirun', 'mpiexec', 'orterun', 'orted', 'prterun', 'prted', 'hydra_pmi_proxy'}
+RANK_VARIABLES = ['OMPI_COMM_WORLD_RANK', 'PMIX_RANK', 'PMI_RANK']
+
+
+def readResourceUsage(casePath: Path) -> np.ndarray:
+    path = casePath / RESOURCE_USAGE_FILE_NAME
+    if not path.is_file():
+        return np.empty(0, SAMPLE_DTYPE)
+
+    data = path.read_bytes()
+    return np.frombuffer(data, SAMPLE_DTYPE, len(data) // SAMPLE_DTYPE.itemsize)
+
+
+class ResourceSampler(QObject):
+    """Samples CPU, memory, I/O and context switches of the ranks of a solver into the case
+
+    The solver is the process tree from the process started to run it, like baramd or mpirun.
+    Samples of the ranks on this host are appended to RESOURCE_USAGE_FILE_NAME in the case as records of SAMPLE_DTYPE.
+    """
+    sampled = Signal(Path, np.ndarray)
+
+    def __init__(self, pid, casePath: Path, interval=SAMPLE_INTERVAL):
+        super().__init__()
+
+        self._pid = pid
+        self._path = casePath / RESOURCE_USAGE_FILE_NAME
+        self._casePath = casePath
+        self._interval = interval
+
+        self._root = None
+        self._startTime = None
+        self._ranks = {}   # Process by rank
+        self._refreshedAt = 0
+        self._task = None
+
+    def start(self, append=False):
+        """Starts sampling, with the samples of the last run removed unless to append to them"""
+        try:
+            self._root = psutil.Process(self._pid)
+            self._startTime = self._root.create_time()
+        except psutil.NoSuchProcess:
+            return
+
+        if not append:
+            self._path.unlink(missing_ok=True)
+
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while self._root.is_running():
+            records = await asyncio.to_thread(self._sample)
+            if len(records):
+                with self._path.open('ab') as f:
+                    records.tofile(f)
+                self.sampled.emit(self._casePath, records)
+
+            await asyncio.sleep(self._interval)
+
+    def _sample(self):
+        now = time.time()
+        if (not self._ranks or now - self._refreshedAt > TREE_REFRESH_INTERVAL
+                or now - self._startTime < TREE_REFRESH_INTERVAL):
+            self._refreshRanks()
+            self._refreshedAt = now
+
+        records = np.zeros(len(self._ranks), SAMPLE_DTYPE)
+        count = 0
+        for rank, process in self._ranks.items():
+            try:
+                with process.oneshot():
+                    cpu = process.cpu_percent()
+                    rss = process.memory_info().rss
+                    switches = process.num_ctx_switches()
+                    try:
+                        io = process.io_counters()
+                        readBytes, writeBytes = io.read_bytes, io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):  # Not available on macOS
+                        readBytes = writeBytes = 0
+            except psutil.Error:
+                continue
+
+            records[count] = (now - self._startTime, rank, cpu, rss, readBytes, writeBytes,
+                              switches.voluntary + switches.involuntary)
+            count += 1
+
+        return records[:count]
+
+    def _refreshRanks(self):
+        known = {process.pid: process for process in self._ranks.values()}
+        ranks = []
+        try:
+            for process in [self._root] + self._root.children(recursive=True):
+                if process.pid in known:
+                    ranks.append(known[process.pid])
+                elif self._isRank(process):
+                    process.cpu_percent()  # The first call starts measuring
+                    ranks.append(process)
+        except psutil.Error:
+            return
+
+        self._ranks = {}
+        for i, process in enumerate(sorted(ranks, key=lambda p: p.pid)):
+            self._ranks[self._rankOf(process, i)] = process
+
+    def _isRank(self, process):
+        try:
+            return process.name() not in LAUNCHER_NAMES
+        except psutil.Error:
+            return False
+
+    def _rankOf(self, process, default):
+        try:
+            environ = process.environ()
+            for variable in RANK_VARIABLES:
+                if variable in environ:
+                    return int(environ[variable])
+        except (psutil.Error, ValueError):
+            pass
+
+        return default
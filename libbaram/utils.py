@@ -71,6 +71,19 @@ def getFit(window: QRect, display: QRect) -> QRect:
     return QRect(x, y, width, height)
 
 
+def directorySize(path: Path) -> int:
+    """Returns the total size of the files in the directory, not following symbolic links"""
+    size = 0
+    for parent, _, files in os.walk(path):
+        for file in files:
+            try:
+                size += os.lstat(os.path.join(parent, file)).st_size
+            except OSError:
+                pass
+
+    return size
+
+
 def copyOrLink(source: Path, target: Path):
     if platform.system() == 'Windows':
         shutil.copy(source, target)
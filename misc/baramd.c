@@ -4,14 +4,71 @@
 #include <stdbool.h>
 
 #include <unistd.h>
+#include <fcntl.h>
+#include <errno.h>
 
 #include <signal.h>
+#include <sys/resource.h>
 #include <sys/wait.h>
 
 static pid_t child = -1;
 
+/*
+ * Status of the solver, written to the file given by "-status" as lines of "key value"
+ *
+ *     pid        process id of baramd, which exits after writing the exit status of the solver
+ *     solverPid  process id of the solver
+ *
+ * They are written as soon as the solver starts, and the others when it exits.
+ *
+ *     exitCode   exit code, or "signal" with the signal that terminated the solver
+ *     cpuTime    user and system CPU time in seconds, including the processes the solver waited for
+ *     maxRSS     maximum resident set size in kilobytes, of the largest of the processes
+ */
 static void
-daemonize()
+write_status(const char *path, const int *status, const struct rusage *usage)
+{
+    char temp[4096];
+    FILE *fp;
+
+    if (path == NULL || snprintf(temp, sizeof(temp), "%s.tmp", path) >= (int) sizeof(temp))
+        return;
+
+    fp = fopen(temp, "w");
+    if (fp == NULL)
+        return;
+
+    fprintf(fp, "pid %d\n", (int) getpid());
+    fprintf(fp, "solverPid %d\n", (int) child);
+    if (status != NULL)
+    {
+        if (WIFSIGNALED(*status))
+            fprintf(fp, "signal %d\n", WTERMSIG(*status));
+        else
+            fprintf(fp, "exitCode %d\n", WEXITSTATUS(*status));
+    }
+    if (usage != NULL)
+    {
+        long maxrss = usage->ru_maxrss;
+#ifdef __APPLE__
+        maxrss /= 1024;  /* in bytes on macOS */
+#endif
+        fprintf(fp, "cpuTime %.3f\n",
+                usage->ru_utime.tv_sec + usage->ru_stime.tv_sec
+                + (usage->ru_utime.tv_usec + usage->ru_stime.tv_usec) / 1e6);
+        fprintf(fp, "maxRSS %ld\n", maxrss);
+    }
+
+    fclose(fp);
+    rename(temp, path);  /* Readers never see the file half written */
+}
+
+/*
+ * The parent exits when the daemon tells it that the solver has started,
+ * so that the launcher finds the pid in the status file as soon as baramd returns
+ */
+static void
+daemonize(int ready[2])
 {
     /* Our process ID and Session ID */
     pid_t pid, sid;
@@ -24,12 +81,20 @@ daemonize()
     }
 
     /* If we got a good PID, then
-       we can exit the parent process. */
+       we can exit the parent process
+       after the solver has started. */
     if (pid > 0)
     {
+        char c;
+
+        close(ready[1]);
+        while (read(ready[0], &c, 1) < 0 && errno == EINTR)
+            ;
         exit(EXIT_SUCCESS);
     }
 
+    close(ready[0]);
+
     /* Create a new SID for the child process */
     sid = setsid();
     if (sid < 0)
@@ -57,10 +122,14 @@ main(int argc, char *argv[])
 {
     struct sigaction forwarding_action;
     struct sigaction child_action;
+    struct rusage usage;
+    int ready[2];
+    int status;
 
     int start = 0;
+    const char *statusPath = NULL;
 
-    // ignore all the arguments before "-cmdline", which are just for memo
+    // ignore all the arguments before "-cmdline", which are just for memo, except "-status"
     for (int i = 1; i < argc; i++)
     {
         if (!strcmp(argv[i], "-cmdline"))
@@ -68,6 +137,9 @@ main(int argc, char *argv[])
             start = i + 1;
             break;
         }
+
+        if (!strcmp(argv[i], "-status") && i + 1 < argc)
+            statusPath = argv[++i];
     }
 
     if (start == 0 )  // command not found
@@ -79,16 +151,29 @@ main(int argc, char *argv[])
     for (int i = 3; i<1024; i++)
         close(i);
 
-    daemonize();
+    if (pipe(ready) < 0)
+        exit(EXIT_FAILURE);
+
+    daemonize(ready);
+
+    fcntl(ready[1], F_SETFD, FD_CLOEXEC);
 
     child = fork();
 
-    if (child == 0)
+    if (child < 0)
+    {
+        exit(EXIT_FAILURE);
+    }
+    else if (child == 0)
     {
         execvp(argv[start], &argv[start]);
+        _exit(127);
     }
     else
     {
+        write_status(statusPath, NULL, NULL);
+        close(ready[1]);  /* Lets the parent exit */
+
         close(0);
         close(1);
         close(2);
@@ -112,7 +197,13 @@ main(int argc, char *argv[])
 
         sigaction (SIGCHLD, &child_action, NULL);
 
-        waitpid(child, NULL, 0);
+        while (wait4(child, &status, 0, &usage) < 0)
+        {
+            if (errno != EINTR)
+                return 0;
+        }
+
+        write_status(statusPath, &status, &usage);
     }
 
     return 0;
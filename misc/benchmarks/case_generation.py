@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark of case file generation from a configuration with many boundaries
+
+Run from the repository root:
+    python -m misc.benchmarks.case_generation [number of boundaries, 100 by default]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from libbaram.openfoam.dictionary.generation_manifest import GenerationManifest
+
+from baramFlow.coredb import coredb
+from baramFlow.coredb.coredb_reader import CoreDBReader
+from baramFlow.coredb.material_db import MaterialDB
+from baramFlow.coredb.region_db import RegionDB
+from baramFlow.openfoam.case_generator import CaseGenerator
+from baramFlow.openfoam.file_system import FileSystem
+
+
+BOUNDARY_TYPES = ['wall', 'velocityInlet', 'pressureOutlet', 'symmetry']
+
+
+def writeBoundaryFile(path: Path, count):
+    patches = ''.join(f'    patch{i}\n'
+                      f'    {{\n'
+                      f'        type patch;\n'
+                      f'        nFaces 10;\n'
+                      f'        startFace {1000 + i * 10};\n'
+                      f'    }}\n' for i in range(count))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('FoamFile\n'
+                    '{\n'
+                    '    version 2.0;\n'
+                    '    format ascii;\n'
+                    '    class polyBoundaryMesh;\n'
+                    '    location "constant/polyMesh";\n'
+                    '    object boundary;\n'
+                    '}\n\n'
+                    f'{count}\n(\n{patches})\n')
+
+
+def measure(name, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    print(f'  {name:<28}{time.perf_counter() - start:10.3f} s')
+
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    db = coredb.createDB()
+    MaterialDB.addNonMixture(db, 'air')
+    RegionDB.addRegion('')
+    for i in range(count):
+        db.addBoundaryCondition('', f'patch{i}', 'patch', BOUNDARY_TYPES[i % len(BOUNDARY_TYPES)])
+
+    with tempfile.TemporaryDirectory() as d:
+        case = Path(d) / 'case'
+        FileSystem.createCase(case)
+        FileSystem.setCaseRoot(case)
+        writeBoundaryFile(case / 'constant' / 'polyMesh' / 'boundary', count)
+
+        print(f'{count} boundaries')
+        snapshot = measure('snapshot', CoreDBReader().snapshot)
+        generator = CaseGenerator(snapshot)
+        with coredb.viewing(snapshot):
+            measure('gather', generator._gatherFiles)
+            measure('generate', generator._generateFiles)
+
+            # Generated again with the manifest, first writing all the files and then none of them
+            for name in ['generate with manifest', 'regenerate unchanged']:
+                generator._gatherFiles()
+                generator._manifest = GenerationManifest(case)
+                measure(name, generator._generateFiles)
+                generator._manifest.save()
+            print(f'  {generator._manifest.report()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark of FoamFile parsing with PyFoam and with FoamFileParser
+
+Run from the repository root:
+    python -m misc.benchmarks.foam_file_parsing [case directories or files]
+
+Without arguments, a corpus of the files that baram reads is generated,
+in addition to the dictionaries in resources.
+Mesh files other than "polyMesh/boundary" are skipped.
+"""
+
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PyFoam.RunDictionary.ParsedParameterFile import ParsedBoundaryDict, ParsedParameterFile
+
+from libbaram.openfoam.foam_file import BoundaryDictFile, FoamDictFile
+
+
+HEADER = '''FoamFile
+{{
+    version     2.0;
+    format      {format};
+    arch        "LSB;label=32;scalar=64";
+    class       {class_};
+    location    "{location}";
+    object      {object_};
+}}
+// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+
+'''
+
+
+def header(object_, class_='dictionary', location='constant', format_='ascii'):
+    return HEADER.format(format=format_, class_=class_, location=location, object_=object_)
+
+
+def writeCorpus(path: Path, nPatches=2000, nCells=200000):
+    polyMesh = path / 'constant' / 'polyMesh'
+    polyMesh.mkdir(parents=True)
+    patches = ''.join(f'    patch{i}\n'
+                      f'    {{\n'
+                      f'        type            {"wall" if i % 2 else "patch"};\n'
+                      f'        inGroups        List<word> 1({"wall" if i % 2 else "patch"});\n'
+                      f'        nFaces          100;\n'
+                      f'        startFace       {nCells * 3 + i * 100};\n'
+                      f'    }}\n' for i in range(nPatches))
+    (polyMesh / 'boundary').write_text(header('boundary', 'polyBoundaryMesh', 'constant/polyMesh')
+                                       + f'{nPatches}\n(\n{patches})\n')
+
+    (path / 'constant' / 'regionProperties').write_text(
+        header('regionProperties') + 'regions\n(\n    fluid (air water)\n    solid (steel)\n);\n')
+    (path / 'constant' / 'cellZonesToRegions').write_text(
+        header('cellZonesToRegions')
+        + 'fluentCellZones\n{\n    air fluid;\n    steel solid;\n}\n\n'
+        + 'regions\n{\n    air\n    {\n        cellZones (air);\n        type fluid;\n    }\n}\n')
+
+    boundaryField = ''.join(f'    patch{i}\n'
+                            f'    {{\n'
+                            f'        type            fixedValue;\n'
+                            f'        value           uniform (1 0 0);\n'
+                            f'    }}\n' for i in range(nPatches))
+    time_ = path / '0.5'
+    time_.mkdir()
+    (time_ / 'U').write_text(header('U', 'volVectorField', '0.5')
+                             + 'dimensions      [0 1 -1 0 0 0 0];\n\n'
+                             + f'internalField   nonuniform List<vector> \n{nCells}\n(\n'
+                             + ''.join(f'({i * 1e-3} 0.5 -{i * 2e-3})\n' for i in range(nCells))
+                             + ')\n;\n\n'
+                             + f'boundaryField\n{{\n{boundaryField}}}\n')
+
+    processor = path / 'processor0' / '0.5'
+    processor.mkdir(parents=True)
+    (processor / 'p').write_bytes(header('p', 'volScalarField', '0.5', 'binary').encode()
+                                  + b'dimensions      [0 2 -2 0 0 0 0];\n\n'
+                                  + f'internalField   nonuniform List<scalar> {nCells}('.encode()
+                                  + struct.pack(f'<{nCells}d', *range(nCells))
+                                  + b')\n;\n\nboundaryField\n{\n'
+                                  + b'    procBoundary0to1\n    {\n        type processor;\n'
+                                  + b'        value nonuniform List<scalar> 3(' + struct.pack('<3d', 1, 2, 3) + b');\n'
+                                  + b'    }\n}\n')
+
+
+def corpus(paths):
+    for path in paths:
+        if path.is_file():
+            yield path
+            continue
+
+        for file in sorted(path.rglob('*')):
+            if not file.is_file() or (file.parent.name == 'polyMesh' and file.name != 'boundary'):
+                continue
+
+            with file.open('rb') as f:
+                if b'FoamFile' in f.read(2048):
+                    yield file
+
+
+def measure(function, *args):
+    start = time.perf_counter()
+    try:
+        function(*args)
+    except Exception as e:
+        return None, type(e).__name__
+
+    return time.perf_counter() - start, None
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]]
+    with tempfile.TemporaryDirectory() as d:
+        if not paths:
+            writeCorpus(Path(d))
+            paths = [Path(d), Path('resources/openfoam')]
+
+        print(f'{"file":<48}{"size":>10}{"PyFoam":>20}{"native":>20}')
+        total = [0, 0]
+        for file in corpus(paths):
+            if file.name == 'boundary':
+                pyFoam = measure(ParsedBoundaryDict, str(file), True)
+                native = measure(BoundaryDictFile, file)
+            else:
+                pyFoam = measure(ParsedParameterFile, str(file))
+                native = measure(FoamDictFile, file)
+
+            name = str(file.relative_to(d)) if file.is_relative_to(d) else str(file)
+            results = [e if t is None else f'{t * 1000:.1f} ms' for t, e in (pyFoam, native)]
+            print(f'{name[-47:]:<48}{file.stat().st_size:>10}{results[0]:>20}{results[1]:>20}')
+            if pyFoam[0] is not None and native[0] is not None:
+                total[0] += pyFoam[0]
+                total[1] += native[0]
+
+        print(f'{"total of the files parsed by both":<58}{total[0] * 1000:>17.1f} ms{total[1] * 1000:>17.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
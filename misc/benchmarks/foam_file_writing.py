@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark of FoamFile writing with PyFoam's FoamFileGenerator and with FoamFileWriter
+
+Run from the repository root:
+    python -m misc.benchmarks.foam_file_writing [number of cells]
+
+A nonuniform vector field and a boundaryData table of the size are written.
+FoamFileGenerator is given the field as lists, as the structures that PyFoam parses.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from PyFoam.Basics.DataStructures import Field
+from PyFoam.Basics.FoamFileGenerator import FoamFileGenerator
+
+from libbaram.openfoam.foam_file import FoamFileWriter, arrayField
+
+
+HEADER = {'version': '2.0', 'format': 'ascii', 'class': 'volVectorField', 'location': '0', 'object': 'U'}
+
+
+def content(internalField):
+    return {
+        'dimensions': '[0 1 -1 0 0 0 0]',
+        'internalField': internalField,
+        'boundaryField': {'inlet': {'type': 'fixedValue', 'value': ('uniform', [1, 0, 0])}}
+    }
+
+
+def measure(name, function, *args):
+    start = time.perf_counter()
+    function(*args)
+    print(f'{name:<48}{(time.perf_counter() - start) * 1000:>12.1f} ms')
+
+
+def writeGenerator(path, data):
+    with open(path, 'w') as f:
+        f.write(str(FoamFileGenerator(data, header=HEADER)))
+
+
+def writeWriter(path, data, header=None):
+    with open(path, 'wb') as f:
+        FoamFileWriter(f, HEADER if header is None else header).write(data)
+
+
+def writeRows(path, data):
+    # The way boundaryData was written row by row
+    with open(path, 'w') as f:
+        f.write(f'{len(data)}\n(\n')
+        for row in data.itertuples(index=False):
+            f.write(f'({row[0]} {row[1]} {row[2]})\n')
+        f.write(')')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    array = np.random.default_rng(0).random((count, 3))
+    table = pd.DataFrame(array)
+
+    with tempfile.TemporaryDirectory() as d:
+        # Each is written to a new file, not to measure truncating files
+        path = Path(d)
+        print(f'{count} cells')
+        measure('FoamFileGenerator', writeGenerator, path / 'U0', content(Field(array.tolist(), 'List<vector>')))
+        measure('FoamFileWriter ascii', writeWriter, path / 'U1', content(arrayField(array, 'List<vector>')))
+        measure('FoamFileWriter binary', writeWriter, path / 'U2', content(arrayField(array, 'List<vector>')),
+                {**HEADER, 'format': 'binary'})
+        measure('boundaryData by rows', writeRows, path / 'points0', table)
+        measure('boundaryData by FoamFileWriter', writeWriter, path / 'points1', table.to_numpy(), {})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark of solverInfo.dat parsing, pandas path against PostFileTail
+
+Run from the repository root:
+    python -m misc.benchmarks.post_file_parser [size in MB, 1024 by default] [path of existing solverInfo.dat]
+"""
+
+import sys
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from libbaram.openfoam.post_file_parser import PostFileTail
+
+
+HEADER = ('# Solver information\n'
+          '# Time\tU_solver\tUx_initial\tUx_final\tUx_iters\tUy_initial\tUy_final\tUy_iters\t'
+          'Uz_initial\tUz_final\tUz_iters\tU_converged\tp_solver\tp_initial\tp_final\tp_iters\tp_converged\n')
+ROW = ('{:<16g}\tDILUPBiCGStab\t1.00000000e+00\t8.58724200e-08\t1\t1.00000000e+00\t5.78842110e-14\t1\t'
+       '1.00000000e+00\t6.57355850e-14\t1\tfalse\tGAMG\t3.66757700e-01\t2.17151110e-13\t12\tfalse\n')
+
+TICK_ROWS = 200  # Rows appended between two ticks of the collector
+
+
+def generate(path: Path, size: int):
+    with path.open('w') as f:
+        f.write(HEADER)
+        i = 0
+        while f.tell() < size:
+            f.write(''.join(ROW.format(t) for t in range(i, i + 10000)))
+            i += 10000
+
+
+def isResidual(name):
+    return name == 'Time' or name.endswith('_initial')
+
+
+def readPandas(path: Path):
+    """Code path used before PostFileTail, reading whole file once"""
+    with path.open() as f:
+        f.readline()
+        names = f.readline().split()[1:]
+        columns = [n for n in names if isResidual(n)]
+        lines = f.read()
+
+    stream = StringIO(lines)
+    df = pd.read_csv(stream, sep=r'\s+', names=names, dtype={'Time': np.float64})[columns]
+    stream.close()
+
+    return len(df)
+
+
+def readTail(path: Path):
+    tail = PostFileTail(path)
+    data = tail.read(select=isResidual)
+    tail.close()
+
+    return len(data['Time'])
+
+
+def tickPandas(lines: [str], names):
+    columns = [n for n in names if isResidual(n)]
+    for i in range(0, len(lines), TICK_ROWS):
+        stream = StringIO(''.join(lines[i:i + TICK_ROWS]))
+        pd.read_csv(stream, sep=r'\s+', names=names, dtype={'Time': np.float64})[columns]
+        stream.close()
+
+
+def tickTail(path: Path, sizes: [int]):
+    tail = PostFileTail(path)
+    for size in sizes:
+        tail.read(size, isResidual)
+    tail.close()
+
+
+def measure(name, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    print(f'  {name:<28}{time.perf_counter() - start:10.3f} s')
+
+    return result
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+
+    with tempfile.TemporaryDirectory() as d:
+        if len(sys.argv) > 2:
+            path = Path(sys.argv[2])
+        else:
+            path = Path(d) / 'solverInfo.dat'
+            print(f'Generating {size} MB solverInfo.dat')
+            generate(path, size * 1024 * 1024)
+
+        print(f'Whole file, {path.stat().st_size / 1024 / 1024:.0f} MB')
+        rows = measure('pandas read_csv', readPandas, path)
+        measure('PostFileTail', readTail, path)
+
+        # Incremental reads as done every tick during a run, on the first 100,000 rows
+        with path.open() as f:
+            f.readline()
+            names = f.readline().split()[1:]
+            offset = f.tell()
+            lines = [f.readline() for _ in range(min(rows, 100000))]
+
+        sizes = np.cumsum([offset] + [len(line) for line in lines])[TICK_ROWS::TICK_ROWS]
+        print(f'{len(sizes)} ticks of {TICK_ROWS} rows')
+        measure('pandas read_csv', tickPandas, lines, names)
+        measure('PostFileTail', tickTail, path, sizes)
+
+
+if __name__ == '__main__':
+    main()